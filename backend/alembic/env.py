@@ -9,18 +9,23 @@ from alembic import context
 
 from app.database import Base, DB_SCHEMA, settings
 from app.models import (  # noqa: F401 - ensure all models are registered
+    CatalogVersion,
+    ChangeLog,
     Exercise,
     ExerciseProgress,
     ExerciseSubstitution,
+    PersonalRecord,
     PhaseWorkout,
     PhaseWorkoutExercise,
     PhaseWorkoutSection,
     Program,
     ProgramPhase,
     ProgramRoutine,
+    SeedVersion,
     TemplateExercise,
     User,
     UserProgram,
+    WeeklyVolume,
     WorkoutSession,
     WorkoutSet,
     WorkoutTemplate,
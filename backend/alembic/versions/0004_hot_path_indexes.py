@@ -0,0 +1,79 @@
+"""add composite indexes for per-user history and plan lookups
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "gym"
+
+# (index name, table, columns) -- kept in sync with __table_args__ in models.py
+INDEXES = [
+    # list_sessions / bootstrap: newest sessions for one user
+    (
+        "ix_workout_sessions_user_id_started_at",
+        "workout_sessions",
+        ["user_id", "started_at"],
+    ),
+    # stats and progress: one user's sessions grouped or filtered by week
+    (
+        "ix_workout_sessions_user_id_year_week",
+        "workout_sessions",
+        ["user_id", "year_week"],
+    ),
+    # session detail, sync ownership join and stats joins
+    ("ix_workout_sets_session_id", "workout_sets", ["session_id"]),
+    ("ix_workout_sets_exercise_id", "workout_sets", ["exercise_id"]),
+    # /today for rotating programs
+    (
+        "ix_template_exercises_template_id_week_type_order",
+        "template_exercises",
+        ["template_id", "week_type", "order"],
+    ),
+    # /today for phased programs
+    (
+        "ix_phase_workouts_phase_id_week_number_day_index",
+        "phase_workouts",
+        ["phase_id", "week_number", "day_index"],
+    ),
+    # ordered child collections loaded with selectinload
+    (
+        "ix_program_routines_program_id_order",
+        "program_routines",
+        ["program_id", "order"],
+    ),
+    (
+        "ix_program_phases_program_id_order",
+        "program_phases",
+        ["program_id", "order"],
+    ),
+    (
+        "ix_phase_workout_sections_workout_id_order",
+        "phase_workout_sections",
+        ["workout_id", "order"],
+    ),
+    (
+        "ix_phase_workout_exercises_section_id_order",
+        "phase_workout_exercises",
+        ["section_id", "order"],
+    ),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, schema=SCHEMA)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, schema=SCHEMA)
@@ -0,0 +1,54 @@
+"""add weekly_volume rollup and backfill it from existing sets
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "gym"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "weekly_volume",
+        sa.Column("id", sa.String(36), nullable=False),
+        sa.Column("user_id", sa.String(36), nullable=False),
+        sa.Column("year_week", sa.String(10), nullable=False),
+        sa.Column("muscle_group", sa.String(100), nullable=False),
+        sa.Column("total_volume", sa.Numeric(14, 2), nullable=False),
+        sa.Column("set_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["user_id"], [f"{SCHEMA}.users.id"]),
+        sa.UniqueConstraint(
+            "user_id", "year_week", "muscle_group", name="uq_weekly_volume"
+        ),
+        schema=SCHEMA,
+    )
+    # Same aggregate as app.rollups.volume_totals
+    op.execute(
+        f"""
+        INSERT INTO {SCHEMA}.weekly_volume
+            (id, user_id, year_week, muscle_group, total_volume, set_count)
+        SELECT gen_random_uuid()::text, s.user_id, s.year_week, e.muscle_group,
+               SUM(ws.reps * ws.weight), COUNT(*)
+        FROM {SCHEMA}.workout_sets ws
+        JOIN {SCHEMA}.workout_sessions s ON ws.session_id = s.id
+        JOIN {SCHEMA}.exercises e ON ws.exercise_id = e.id
+        WHERE ws.set_type = 'working' AND s.year_week IS NOT NULL
+        GROUP BY s.user_id, s.year_week, e.muscle_group
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("weekly_volume", schema=SCHEMA)
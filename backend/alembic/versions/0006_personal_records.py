@@ -0,0 +1,85 @@
+"""add personal_records store and backfill it from existing sets
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "gym"
+
+# Epley, as in app.records.estimate_1rm
+E1RM = (
+    "CASE WHEN ws.reps <= 1 THEN ws.weight "
+    "ELSE ROUND(ws.weight * (30 + ws.reps) / 30, 2) END"
+)
+
+# record_type -> (qualifying condition, ranking), as in app.records._rank
+RECORDS = {
+    "max_weight": ("ws.reps > 0", "ws.weight DESC, ws.reps DESC"),
+    "max_reps": ("ws.reps > 0", "ws.reps DESC, ws.weight DESC"),
+    "e1rm": ("ws.reps > 0 AND ws.weight > 0", f"{E1RM} DESC"),
+    **{f"rm_{n}": (f"ws.reps = {n}", "ws.weight DESC") for n in range(1, 13)},
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "personal_records",
+        sa.Column("id", sa.String(36), nullable=False),
+        sa.Column("user_id", sa.String(36), nullable=False),
+        sa.Column("exercise_id", sa.String(36), nullable=False),
+        sa.Column("record_type", sa.String(20), nullable=False),
+        sa.Column("set_id", sa.String(36), nullable=False),
+        sa.Column("weight", sa.Numeric(7, 2), nullable=False),
+        sa.Column("reps", sa.Integer(), nullable=False),
+        sa.Column("e1rm", sa.Numeric(8, 2), nullable=False),
+        sa.Column("achieved_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["user_id"], [f"{SCHEMA}.users.id"]),
+        sa.ForeignKeyConstraint(["exercise_id"], [f"{SCHEMA}.exercises.id"]),
+        sa.ForeignKeyConstraint(
+            ["set_id"], [f"{SCHEMA}.workout_sets.id"], ondelete="CASCADE"
+        ),
+        sa.UniqueConstraint(
+            "user_id", "exercise_id", "record_type", name="uq_personal_record"
+        ),
+        schema=SCHEMA,
+    )
+    op.create_index(
+        "ix_personal_records_set_id", "personal_records", ["set_id"], schema=SCHEMA
+    )
+    # Earliest set wins ties, matching the incremental path
+    for record_type, (condition, ranking) in RECORDS.items():
+        op.execute(
+            f"""
+            INSERT INTO {SCHEMA}.personal_records
+                (id, user_id, exercise_id, record_type, set_id, weight, reps,
+                 e1rm, achieved_at)
+            SELECT DISTINCT ON (s.user_id, ws.exercise_id)
+                   gen_random_uuid()::text, s.user_id, ws.exercise_id,
+                   '{record_type}', ws.id, ws.weight, ws.reps, {E1RM},
+                   s.started_at
+            FROM {SCHEMA}.workout_sets ws
+            JOIN {SCHEMA}.workout_sessions s ON ws.session_id = s.id
+            WHERE ws.set_type = 'working' AND {condition}
+            ORDER BY s.user_id, ws.exercise_id, {ranking},
+                     s.started_at, ws.created_at
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_personal_records_set_id", table_name="personal_records", schema=SCHEMA
+    )
+    op.drop_table("personal_records", schema=SCHEMA)
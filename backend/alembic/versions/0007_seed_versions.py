@@ -0,0 +1,33 @@
+"""add seed_versions registry for content-hashed shared seeds
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "gym"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "seed_versions",
+        sa.Column("name", sa.String(50), nullable=False),
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("applied_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("seed_versions", schema=SCHEMA)
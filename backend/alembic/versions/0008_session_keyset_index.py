@@ -0,0 +1,46 @@
+"""extend the per-user session history index with id for keyset pages
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "gym"
+
+
+def upgrade() -> None:
+    # list_sessions pages on (started_at, id) DESC, scanned backwards
+    op.create_index(
+        "ix_workout_sessions_user_id_started_at_id",
+        "workout_sessions",
+        ["user_id", "started_at", "id"],
+        schema=SCHEMA,
+    )
+    op.drop_index(
+        "ix_workout_sessions_user_id_started_at",
+        table_name="workout_sessions",
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_workout_sessions_user_id_started_at",
+        "workout_sessions",
+        ["user_id", "started_at"],
+        schema=SCHEMA,
+    )
+    op.drop_index(
+        "ix_workout_sessions_user_id_started_at_id",
+        table_name="workout_sessions",
+        schema=SCHEMA,
+    )
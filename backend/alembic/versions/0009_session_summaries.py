@@ -0,0 +1,55 @@
+"""add per-session summary columns and backfill them from existing sets
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0009"
+down_revision: Union[str, Sequence[str], None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "gym"
+
+COLUMNS = [
+    sa.Column("working_set_count", sa.Integer(), nullable=False, server_default="0"),
+    sa.Column("total_volume", sa.Numeric(12, 2), nullable=False, server_default="0"),
+    sa.Column("exercise_count", sa.Integer(), nullable=False, server_default="0"),
+]
+
+
+def upgrade() -> None:
+    for column in COLUMNS:
+        op.add_column("workout_sessions", column, schema=SCHEMA)
+    # Same aggregates as app.summaries
+    op.execute(
+        f"""
+        UPDATE {SCHEMA}.workout_sessions s
+        SET working_set_count = t.working_set_count,
+            total_volume = t.total_volume,
+            exercise_count = t.exercise_count
+        FROM (
+            SELECT session_id,
+                   COUNT(*) FILTER (WHERE set_type = 'working')
+                       AS working_set_count,
+                   COALESCE(
+                       SUM(reps * weight) FILTER (WHERE set_type = 'working'), 0
+                   ) AS total_volume,
+                   COUNT(DISTINCT exercise_id) AS exercise_count
+            FROM {SCHEMA}.workout_sets
+            GROUP BY session_id
+        ) t
+        WHERE t.session_id = s.id
+        """
+    )
+
+
+def downgrade() -> None:
+    for column in reversed(COLUMNS):
+        op.drop_column("workout_sessions", column.name, schema=SCHEMA)
@@ -0,0 +1,41 @@
+"""extend the per-session set index with exercise_id for last performance
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0010"
+down_revision: Union[str, Sequence[str], None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "gym"
+
+
+def upgrade() -> None:
+    # app.performance probes each of a user's sessions for given exercises
+    op.create_index(
+        "ix_workout_sets_session_id_exercise_id",
+        "workout_sets",
+        ["session_id", "exercise_id"],
+        schema=SCHEMA,
+    )
+    op.drop_index(
+        "ix_workout_sets_session_id", table_name="workout_sets", schema=SCHEMA
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_workout_sets_session_id", "workout_sets", ["session_id"], schema=SCHEMA
+    )
+    op.drop_index(
+        "ix_workout_sets_session_id_exercise_id",
+        table_name="workout_sets",
+        schema=SCHEMA,
+    )
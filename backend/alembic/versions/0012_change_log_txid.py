@@ -0,0 +1,40 @@
+"""order the change feed by writing transaction
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17
+
+Entries written before this revision have no txid and are not served again;
+clients holding an older cursor must hydrate again.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0012"
+down_revision: Union[str, Sequence[str], None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "gym"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "change_log", sa.Column("txid", sa.BigInteger(), nullable=True), schema=SCHEMA
+    )
+    op.create_index(
+        "ix_change_log_user_id_txid_id",
+        "change_log",
+        ["user_id", "txid", "id"],
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_change_log_user_id_txid_id", table_name="change_log", schema=SCHEMA
+    )
+    op.drop_column("change_log", "txid", schema=SCHEMA)
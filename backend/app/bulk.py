@@ -0,0 +1,146 @@
+"""Dialect-aware bulk upsert helpers for set-based write paths."""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, Select, case, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+
+def insert_for(db: AsyncSession | Session, model: type) -> Any:
+    """Return a dialect-specific INSERT that supports ``ON CONFLICT``."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"Upserts are not supported on {dialect}")
+
+
+def upsert_statement(
+    db: AsyncSession | Session,
+    model: type,
+    *,
+    index_elements: Sequence[str],
+    update_columns: Sequence[str] = (),
+    greatest_columns: Sequence[str] = (),
+    increment_columns: Sequence[str] = (),
+    where: ColumnElement[bool] | None = None,
+) -> Any:
+    """The ``INSERT ... ON CONFLICT DO UPDATE`` behind :func:`bulk_upsert`."""
+    stmt = insert_for(db, model)
+    table = model.__table__
+    set_: dict[str, Any] = {col: stmt.excluded[col] for col in update_columns}
+    for col in greatest_columns:
+        set_[col] = case(
+            (stmt.excluded[col] > table.c[col], stmt.excluded[col]),
+            else_=table.c[col],
+        )
+    for col in increment_columns:
+        set_[col] = table.c[col] + stmt.excluded[col]
+    return stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_=set_,
+        where=where,
+    )
+
+
+async def bulk_upsert(
+    db: AsyncSession,
+    model: type,
+    rows: Sequence[dict[str, Any]],
+    *,
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+    greatest_columns: Sequence[str] = (),
+    increment_columns: Sequence[str] = (),
+    where: ColumnElement[bool] | None = None,
+) -> list[str]:
+    """Insert ``rows`` in one statement, updating ``update_columns`` on conflict.
+
+    ``greatest_columns`` are only ever raised: on conflict they keep the larger
+    of the stored and incoming value. ``increment_columns`` add the incoming
+    value to the stored one, for running totals. ``where`` restricts which
+    existing rows may be overwritten; conflicting rows that fail it are left
+    untouched.
+    Returns the ids of the rows that were inserted or updated.
+    """
+    if not rows:
+        return []
+    stmt = upsert_statement(
+        db,
+        model,
+        index_elements=index_elements,
+        update_columns=update_columns,
+        greatest_columns=greatest_columns,
+        increment_columns=increment_columns,
+        where=where,
+    )
+    result = await db.scalars(stmt.returning(model.id), list(rows))
+    return list(result.all())
+
+
+async def bulk_upsert_rows(
+    db: AsyncSession,
+    model: type,
+    rows: Sequence[dict[str, Any]],
+    **kwargs: Any,
+) -> tuple[list[str], dict[str, str]]:
+    """:func:`bulk_upsert` that isolates the rows the database rejects.
+
+    The batch is written under a SAVEPOINT. If it fails, each row is retried
+    under its own SAVEPOINT, so one bad row costs only itself. Returns the
+    written ids and the database error for each rejected row id.
+    """
+    if not rows:
+        return [], {}
+    try:
+        async with db.begin_nested():
+            return await bulk_upsert(db, model, rows, **kwargs), {}
+    except DBAPIError:
+        pass
+    written: list[str] = []
+    rejected: dict[str, str] = {}
+    for row in rows:
+        try:
+            async with db.begin_nested():
+                written += await bulk_upsert(db, model, [row], **kwargs)
+        except DBAPIError as exc:
+            rejected[row["id"]] = str(exc.orig)
+    return written, rejected
+
+
+async def missing_ids(
+    db: AsyncSession, key: InstrumentedAttribute, ids: Iterable[str | None]
+) -> set[str]:
+    """The non-null ``ids`` that no row of ``key``'s table has, in one query."""
+    wanted = {id_ for id_ in ids if id_ is not None}
+    return wanted - (await fetch_rows(db, select(key), key, wanted)).keys()
+
+
+async def fetch_rows(
+    db: AsyncSession,
+    query: Select,
+    key: InstrumentedAttribute,
+    keys: Iterable[str],
+) -> dict[str, Row]:
+    """Run ``query`` once for all ``keys`` and index the rows by their first column."""
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return {}
+    result = await db.execute(query.where(key.in_(keys)))
+    return {row[0]: row for row in result.all()}
+
+
+async def fetch_map(
+    db: AsyncSession,
+    query: Select,
+    key: InstrumentedAttribute,
+    keys: Iterable[str],
+) -> dict[str, Any]:
+    """Run ``query`` once for all ``keys`` and map its first column to its second."""
+    rows = await fetch_rows(db, query, key, keys)
+    return {k: row[1] for k, row in rows.items()}
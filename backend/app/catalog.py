@@ -0,0 +1,129 @@
+"""Catalog write counters and the ETags built from them.
+
+Exercises, templates and programs change rarely, yet clients download them
+on every hydrate. Each owner of catalog rows has a write counter in
+``catalog_versions``: one for the shared catalog, and one per user for their
+custom rows. ORM writes to catalog models bump their owner's counter in the
+same flush, as :mod:`app.changes` does for the change feed. Seeding writes
+with Core statements and bumps the shared counter itself.
+
+A catalog endpoint's ETag hashes the caller's two counters, so checking
+``If-None-Match`` costs one primary-key lookup; see
+:func:`app.dependencies.catalog_cache_headers`.
+"""
+
+import hashlib
+from collections.abc import Iterable
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.util import identity_key
+
+from app.bulk import upsert_statement
+from app.models import (
+    CatalogVersion,
+    Exercise,
+    ExerciseSubstitution,
+    PhaseWorkout,
+    PhaseWorkoutExercise,
+    PhaseWorkoutSection,
+    Program,
+    ProgramPhase,
+    ProgramRoutine,
+    TemplateExercise,
+    WorkoutTemplate,
+)
+
+SHARED_SCOPE = "shared"
+_PENDING_KEY = "pending_catalog_scopes"
+
+# Catalog models without a user_id column -> (parent model, foreign key)
+_PARENT: dict[type, tuple[type, str]] = {
+    ExerciseSubstitution: (Exercise, "exercise_id"),
+    TemplateExercise: (WorkoutTemplate, "template_id"),
+    ProgramRoutine: (Program, "program_id"),
+    ProgramPhase: (Program, "program_id"),
+    PhaseWorkout: (ProgramPhase, "phase_id"),
+    PhaseWorkoutSection: (PhaseWorkout, "workout_id"),
+    PhaseWorkoutExercise: (PhaseWorkoutSection, "section_id"),
+}
+
+CATALOG_MODELS: tuple[type, ...] = (Exercise, WorkoutTemplate, Program, *_PARENT)
+
+
+def _scope(session: Session, target: object) -> str:
+    """The catalog scope a changed row belongs to."""
+    while type(target) in _PARENT:
+        model, key = _PARENT[type(target)]
+        parent = session.identity_map.get(identity_key(model, getattr(target, key)))
+        if parent is None:
+            # Unknown owner: invalidating every user's copy is always safe
+            return SHARED_SCOPE
+        target = parent
+    return target.user_id or SHARED_SCOPE  # type: ignore[attr-defined]
+
+
+def _after_change(mapper, connection, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(_scope(session, target))
+
+
+for _model in CATALOG_MODELS:
+    event.listen(_model, "after_insert", _after_change)
+    event.listen(_model, "after_update", _after_change)
+    event.listen(_model, "after_delete", _after_change)
+
+
+def _bump_statement(db: AsyncSession | Session):
+    return upsert_statement(
+        db, CatalogVersion, index_elements=["scope"], increment_columns=["version"]
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _write_pending_bumps(session: Session, flush_context) -> None:
+    scopes = session.info.pop(_PENDING_KEY, None)
+    if scopes:
+        session.connection().execute(
+            _bump_statement(session),
+            [dict(scope=scope, version=1) for scope in sorted(scopes)],
+        )
+
+
+async def bump_catalog_versions(db: AsyncSession, scopes: Iterable[str]) -> None:
+    """Bump catalog counters for rows written outside the ORM unit of work."""
+    rows = [dict(scope=scope, version=1) for scope in sorted(set(scopes))]
+    if rows:
+        await db.execute(_bump_statement(db), rows)
+
+
+async def catalog_etag(db: AsyncSession, user_id: str, variant: str = "") -> str:
+    """Strong ETag of the user's view of the catalog.
+
+    ``variant`` distinguishes representations of the same catalog state, such
+    as payloads of different response schemas.
+    """
+    result = await db.execute(
+        select(CatalogVersion.scope, CatalogVersion.version).where(
+            CatalogVersion.scope.in_((SHARED_SCOPE, user_id))
+        )
+    )
+    versions = dict(result.tuples().all())
+    key = f"{user_id}:{versions.get(SHARED_SCOPE, 0)}:{versions.get(user_id, 0)}"
+    digest = hashlib.sha256(f"{key}:{variant}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header covers ``etag``.
+
+    The comparison is weak, as RFC 9110 requires for ``If-None-Match``.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in tags
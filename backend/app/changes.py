@@ -0,0 +1,198 @@
+"""Change-feed stamping for delta sync.
+
+ORM writes to tracked models are captured by mapper events and appended to
+``change_log`` in one statement per flush. Core bulk writes bypass the unit of
+work, so callers must stamp them with :func:`record_changes`; shared seed rows
+are stamped with no owner, which every user's feed includes.
+
+On PostgreSQL each entry also records the id of the transaction that wrote
+it. Entry ids are handed out at insert time but transactions commit in any
+order, so the feed is ordered by transaction id instead and only serves
+transactions older than every one still in flight (see :func:`feed_watermark`).
+SQLite runs one write transaction at a time, so there ids already follow
+commit order.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from typing import NamedTuple
+
+from sqlalchemy import Insert, event, func, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.util import identity_key
+
+from app.models import (
+    ChangeLog,
+    ExerciseProgress,
+    Program,
+    ProgramRoutine,
+    TemplateExercise,
+    UserProgram,
+    WorkoutSession,
+    WorkoutSet,
+    WorkoutTemplate,
+)
+
+# Session.info key holding the id of the authenticated user for this request
+USER_ID_KEY = "user_id"
+_PENDING_KEY = "pending_changes"
+
+TRACKED_MODELS: tuple[type, ...] = (
+    WorkoutSession,
+    WorkoutSet,
+    ExerciseProgress,
+    UserProgram,
+    WorkoutTemplate,
+    TemplateExercise,
+    Program,
+    ProgramRoutine,
+)
+
+
+class _Unresolved(NamedTuple):
+    """A child row's parent that was not loaded when the row was stamped."""
+
+    model: type
+    id: object
+
+
+# Child models without a user_id column -> (parent model, foreign key)
+_OWNER_PARENT: dict[type, tuple[type, str]] = {
+    WorkoutSet: (WorkoutSession, "session_id"),
+    TemplateExercise: (WorkoutTemplate, "template_id"),
+    ProgramRoutine: (Program, "program_id"),
+}
+
+
+def _owner(session: Session, target: object) -> str | None | _Unresolved:
+    """Resolve which user a changed row belongs to (None for shared rows).
+
+    Child rows take their parent's owner. The parent is usually in the
+    identity map because the route loaded it to authorize; otherwise it is
+    returned unresolved and looked up once per flush.
+    """
+    if hasattr(type(target), "user_id"):
+        return target.user_id  # type: ignore[attr-defined]
+    model, key = _OWNER_PARENT[type(target)]
+    # Read without loading: a deleted row can no longer refresh itself
+    parent_id = target.__dict__.get(key)
+    if parent_id is None:
+        return session.info.get(USER_ID_KEY)
+    parent = session.identity_map.get(identity_key(model, parent_id))
+    if parent is None:
+        return _Unresolved(model, parent_id)
+    return parent.user_id
+
+
+def _is_postgresql(db: AsyncSession) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _change_log_insert(postgresql: bool) -> Insert:
+    stmt = insert(ChangeLog.__table__)
+    if postgresql:
+        stmt = stmt.values(txid=func.txid_current())
+    return stmt
+
+
+def _stamp(target: object, deleted: bool) -> None:
+    session = object_session(target)
+    if session is None:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    entity = type(target).__tablename__
+    pending[(entity, target.id)] = dict(  # type: ignore[attr-defined]
+        user_id=_owner(session, target),
+        entity=entity,
+        entity_id=target.id,  # type: ignore[attr-defined]
+        deleted=deleted,
+    )
+
+
+def _after_write(mapper, connection, target) -> None:
+    _stamp(target, deleted=False)
+
+
+def _after_delete(mapper, connection, target) -> None:
+    _stamp(target, deleted=True)
+
+
+for _model in TRACKED_MODELS:
+    event.listen(_model, "after_insert", _after_write)
+    event.listen(_model, "after_update", _after_write)
+    event.listen(_model, "after_delete", _after_delete)
+
+
+def _resolve_owners(
+    session: Session, connection: Connection, entries: list[dict]
+) -> None:
+    """Fill in owners left unresolved, with one query per parent model."""
+    unresolved: dict[type, set] = defaultdict(set)
+    for entry in entries:
+        if isinstance(entry["user_id"], _Unresolved):
+            unresolved[entry["user_id"].model].add(entry["user_id"].id)
+    owners: dict[_Unresolved, str | None] = {}
+    for model, ids in unresolved.items():
+        result = connection.execute(
+            select(model.id, model.user_id).where(model.id.in_(ids))
+        )
+        owners.update((_Unresolved(model, id_), owner) for id_, owner in result)
+    for entry in entries:
+        if isinstance(entry["user_id"], _Unresolved):
+            # The parent is gone; only its owner could have removed the row
+            entry["user_id"] = owners.get(
+                entry["user_id"], session.info.get(USER_ID_KEY)
+            )
+
+
+@event.listens_for(Session, "after_flush")
+def _write_pending_changes(session: Session, flush_context) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        connection = session.connection()
+        entries = list(pending.values())
+        _resolve_owners(session, connection, entries)
+        connection.execute(
+            _change_log_insert(connection.dialect.name == "postgresql"), entries
+        )
+
+
+async def record_changes(
+    db: AsyncSession,
+    user_id: str | None,
+    changes: Mapping[type, Iterable[str]],
+    *,
+    deleted: bool = False,
+) -> None:
+    """Stamp rows written outside the ORM unit of work onto the change feed.
+
+    ``changes`` maps each model to the ids written; all of them are appended
+    with a single INSERT.
+    """
+    rows = [
+        dict(
+            user_id=user_id,
+            entity=model.__tablename__,
+            entity_id=entity_id,
+            deleted=deleted,
+        )
+        for model, ids in changes.items()
+        for entity_id in dict.fromkeys(ids)
+    ]
+    if rows:
+        await db.execute(_change_log_insert(_is_postgresql(db)), rows)
+
+
+async def feed_watermark(db: AsyncSession) -> int | None:
+    """Transaction id below which every transaction has finished.
+
+    ``None`` where entries are ordered by id (SQLite): there every committed
+    entry is already final.
+    """
+    if not _is_postgresql(db):
+        return None
+    return await db.scalar(
+        select(func.txid_snapshot_xmin(func.txid_current_snapshot()))
+    )
@@ -0,0 +1,238 @@
+"""Response compression negotiated from ``Accept-Encoding``.
+
+JSON payloads such as the phased program tree or session history are very
+repetitive and shrink by an order of magnitude. :class:`CompressionMiddleware`
+picks the best encoding both sides support: zstd, brotli or gzip, each only
+if its library is installed (gzip always is). Small bodies and content types
+outside the allowlist pass through untouched. Streamed responses are
+compressed chunk by chunk and flushed after each one, so clients still see
+rows as they are produced.
+
+Responses whose body is re-encoded get a weak ETag: the bytes differ per
+encoding, while ``If-None-Match`` handling (see :mod:`app.catalog`) compares
+weakly and still matches. Uncompressed responses keep their strong ETag, and
+a 304 echoes the ETag in the form the client's cached copy carries.
+"""
+
+import gzip
+import zlib
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+class Stream(NamedTuple):
+    write: Callable[[bytes], bytes]  # compress and flush one chunk
+    finish: Callable[[], bytes]
+
+
+class Codec(NamedTuple):
+    compress: Callable[[bytes], bytes]
+    stream: Callable[[], Stream]
+
+
+def _gzip(level: int) -> Codec:
+    def stream() -> Stream:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return Stream(
+            write=lambda chunk: (
+                compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            ),
+            finish=compressor.flush,
+        )
+
+    return Codec(lambda body: gzip.compress(body, level, mtime=0), stream)
+
+
+def _brotli(quality: int) -> Codec:
+    def stream() -> Stream:
+        compressor = brotli.Compressor(quality=quality)
+        return Stream(
+            write=lambda chunk: compressor.process(chunk) + compressor.flush(),
+            finish=compressor.finish,
+        )
+
+    return Codec(lambda body: brotli.compress(body, quality=quality), stream)
+
+
+def _zstd(level: int) -> Codec:
+    compressor = zstandard.ZstdCompressor(level=level)
+
+    def stream() -> Stream:
+        obj = compressor.compressobj()
+        return Stream(
+            write=lambda chunk: (
+                obj.compress(chunk) + obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            ),
+            finish=obj.flush,
+        )
+
+    return Codec(compressor.compress, stream)
+
+
+def available_codecs(
+    encodings: Iterable[str], *, gzip_level: int, brotli_quality: int, zstd_level: int
+) -> dict[str, Codec]:
+    """Codecs for ``encodings`` in preference order, skipping uninstalled ones."""
+    factories: dict[str, Callable[[], Codec]] = {"gzip": lambda: _gzip(gzip_level)}
+    if brotli is not None:
+        factories["br"] = lambda: _brotli(brotli_quality)
+    if zstandard is not None:
+        factories["zstd"] = lambda: _zstd(zstd_level)
+    return {name: factories[name]() for name in encodings if name in factories}
+
+
+def negotiate(accept_encoding: str, offered: Iterable[str]) -> str | None:
+    """The offered encoding the client rates highest; ties go to the server's order."""
+    ratings: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, *params = (token.strip() for token in part.split(";"))
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            ratings[name.lower()] = quality
+    best, best_quality = None, 0.0
+    for name in offered:
+        quality = ratings.get(name, ratings.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class CompressionMiddleware:
+    """Compress eligible HTTP responses with the negotiated encoding."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        codecs: dict[str, Codec],
+        minimum_size: int,
+        content_types: Iterable[str],
+    ) -> None:
+        self.app = app
+        self.codecs = codecs
+        self.minimum_size = minimum_size
+        self.content_types = frozenset(content_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        encoding = negotiate(headers.get("Accept-Encoding", ""), self.codecs)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(self, encoding, send, headers)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        encoding: str,
+        send: Send,
+        request_headers: Headers,
+    ):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.codec = middleware.codecs[encoding]
+        self.downstream = send
+        self.if_none_match = request_headers.get("If-None-Match", "")
+        self.start: Message | None = None
+        self.stream: Stream | None = None
+        self.passthrough = False
+
+    def _eligible(self, headers: MutableHeaders) -> bool:
+        media_type = headers.get("Content-Type", "").split(";")[0].strip().lower()
+        return (
+            media_type in self.middleware.content_types
+            and "Content-Encoding" not in headers
+        )
+
+    def _mark_encoded(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        self._weaken_etag(headers)
+
+    @staticmethod
+    def _weaken_etag(headers: MutableHeaders) -> None:
+        etag = headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    def _revalidates_weak(self, headers: MutableHeaders) -> bool:
+        """Whether the client's copy carries the weak form of the ETag."""
+        etag = headers.get("ETag")
+        tags = {tag.strip() for tag in self.if_none_match.split(",")}
+        return bool(etag) and f"W/{etag}" in tags and etag not in tags
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            headers = MutableHeaders(scope=message)
+            if self._eligible(headers):
+                headers.add_vary_header("Accept-Encoding")
+            else:
+                self.passthrough = True
+                if message["status"] == 304 and self._revalidates_weak(headers):
+                    # Match the ETag of the compressed 200 being revalidated
+                    self._weaken_etag(headers)
+            return
+        if message["type"] != "http.response.body":
+            await self.downstream(message)
+            return
+
+        body, more_body = message.get("body", b""), message.get("more_body", False)
+        if self.passthrough:
+            await self._send_start()
+            await self.downstream(message)
+            return
+
+        if self.stream is None:
+            headers = MutableHeaders(scope=self.start)
+            if not more_body:
+                # Whole body in one message: compress it if it is worth it
+                if len(body) >= self.middleware.minimum_size:
+                    body = self.codec.compress(body)
+                    self._mark_encoded(headers)
+                    headers["Content-Length"] = str(len(body))
+                self.passthrough = True
+                await self._send_start()
+                await self.downstream({**message, "body": body})
+                return
+            self.stream = self.codec.stream()
+            self._mark_encoded(headers)
+            del headers["Content-Length"]
+            await self._send_start()
+
+        chunk = self.stream.write(body) if body else b""
+        if not more_body:
+            chunk += self.stream.finish()
+        await self.downstream(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body}
+        )
+
+    async def _send_start(self) -> None:
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self.downstream(start)
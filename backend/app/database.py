@@ -3,9 +3,28 @@ from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
+from app.pool import InstrumentedQueuePool, PoolMetrics
+
 
 class Settings(BaseSettings):
     DATABASE_URL: str | None = None
+    # Optional streaming replica for read-only routes (see get_read_db)
+    DATABASE_REPLICA_URL: str | None = None
+    # Users read from the primary for this long after a write (pinned by cookie)
+    REPLICA_PIN_SECONDS: float = 10
+    # PostgreSQL connection pools (primary and replica each get one);
+    # the defaults are SQLAlchemy's
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    DB_POOL_RECYCLE_SECONDS: int = -1
+    DB_POOL_PRE_PING: bool = False
+    # Prepared statements asyncpg keeps per connection; 0 disables the cache
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2
+    # Requests over this many statements, or repeating one this often, log a warning
+    QUERY_BUDGET: int = 30
+    QUERY_REPEAT_THRESHOLD: int = 5
     POSTGRES_USER: str | None = None
     POSTGRES_PASSWORD: str | None = None
     POSTGRES_DB: str | None = None
@@ -13,6 +32,23 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432
     CORS_ORIGINS: str = "http://localhost:5173"
     DEV_USER_EMAIL: str | None = None
+    IDENTITY_CACHE_TTL_SECONDS: float = 300
+    IDENTITY_CACHE_MAX_ENTRIES: int = 1024
+    PLAN_CACHE_TTL_SECONDS: float = 3600
+    PLAN_CACHE_MAX_ENTRIES: int = 64
+    LAST_PERFORMANCE_CACHE_TTL_SECONDS: float = 300
+    LAST_PERFORMANCE_CACHE_MAX_ENTRIES: int = 1024
+    # Catalog responses: stored by the browser/service worker, always revalidated
+    CATALOG_CACHE_CONTROL: str = "private, no-cache"
+    # Response compression; encodings in server preference order, comma-separated
+    COMPRESSION_ENCODINGS: str = "zstd,br,gzip"
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_CONTENT_TYPES: str = (
+        "application/json,application/x-ndjson,text/plain,text/csv,text/html"
+    )
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -32,9 +68,47 @@ DB_SCHEMA = "gym"
 
 settings = Settings()
 
-engine = create_async_engine(settings.database_url, echo=False)
+
+def engine_options(url: str) -> dict:
+    """Pool arguments for ``url``; SQLite keeps SQLAlchemy's default pool."""
+    if url.startswith("sqlite"):
+        return {}
+    options = dict(
+        poolclass=InstrumentedQueuePool,
+        metrics=PoolMetrics(),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    if "+asyncpg" in url:
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+        }
+    return options
+
+
+engine = create_async_engine(
+    settings.database_url, echo=False, **engine_options(settings.database_url)
+)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+replica_engine = (
+    create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        echo=False,
+        **engine_options(settings.DATABASE_REPLICA_URL),
+    )
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+replica_session = (
+    async_sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+    if replica_engine is not None
+    else None
+)
+
 
 class Base(DeclarativeBase):
     metadata = MetaData(schema=DB_SCHEMA)
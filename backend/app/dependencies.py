@@ -1,10 +1,30 @@
+"""FastAPI dependencies: database sessions, the current user and cache headers.
+
+Resolved identities are kept in :data:`identity_cache`, which lives in the
+worker process. A profile change made through ``PUT /api/auth/me`` only
+invalidates the entry in the worker that served it; other workers keep the
+old profile until the entry expires (``IDENTITY_CACHE_TTL_SECONDS``). The
+image runs a single uvicorn worker (see ``backend/Dockerfile``), so there
+this never happens. Running more workers needs a shorter TTL, or a TTL of
+zero to disable the cache.
+"""
+
+import hashlib
+import json
+import math
 from collections.abc import AsyncGenerator
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
-from app.database import async_session, settings
+from app.bulk import insert_for
+from app.cache import TTLCache
+from app.catalog import catalog_etag, etag_matches
+from app.changes import USER_ID_KEY
+from app.database import async_session, replica_session, settings
 from app.models import User
 
 
@@ -18,13 +38,31 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+# Set on a client for REPLICA_PIN_SECONDS after it writes, holding the user
+# id; any worker reading it sends that user's reads to the primary
+REPLICA_PIN_COOKIE = "read_primary"
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Remote-Email -> profile columns of the resolved User
+identity_cache = TTLCache(
+    max_entries=settings.IDENTITY_CACHE_MAX_ENTRIES,
+    ttl=settings.IDENTITY_CACHE_TTL_SECONDS,
+)
+
+_PROFILE_COLUMNS = ("id", "email", "display_name", "preferred_unit", "created_at")
+
+
 async def get_current_user(
     request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """Read Authelia forward-auth headers and return the authenticated User.
 
-    If the user doesn't exist in the database yet, auto-provision them.
+    Identities are cached per worker by email, so most requests skip the user
+    lookup entirely. If the user doesn't exist in the database yet, they are
+    auto-provisioned with an insert-or-get that is safe under concurrency.
     """
     email = request.headers.get("Remote-Email") or settings.DEV_USER_EMAIL
     if not email:
@@ -33,17 +71,89 @@ async def get_current_user(
             detail="Not authenticated",
         )
 
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    profile = identity_cache.get(email)
+    if profile is not None:
+        # Attach without a SELECT; attribute changes still flush as an UPDATE
+        user = User(**profile)
+        make_transient_to_detached(user)
+        user = await db.merge(user, load=False)
+    else:
+        user = await db.scalar(select(User).where(User.email == email))
+        if user is None:
+            display_name = request.headers.get("Remote-Name", email.split("@")[0])
+            await db.execute(
+                insert_for(db, User)
+                .values(email=email, display_name=display_name)
+                .on_conflict_do_nothing(index_elements=["email"])
+            )
+            await db.commit()
+            user = await db.scalar(select(User).where(User.email == email))
+        identity_cache.set(email, {col: getattr(user, col) for col in _PROFILE_COLUMNS})
 
-    if user is None:
-        display_name = request.headers.get("Remote-Name", email.split("@")[0])
-        user = User(
-            email=email,
-            display_name=display_name,
+    # Lets the change feed attribute writes to child rows without a user_id
+    db.info[USER_ID_KEY] = user.id
+    if request.method not in _SAFE_METHODS and replica_session is not None:
+        response.set_cookie(
+            REPLICA_PIN_COOKIE,
+            user.id,
+            max_age=math.ceil(settings.REPLICA_PIN_SECONDS),
+            httponly=True,
+            samesite="lax",
         )
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
-
     return user
+
+
+async def get_read_db(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session for a read-only route.
+
+    With ``DATABASE_REPLICA_URL`` set this reads from the replica, unless the
+    user wrote within ``REPLICA_PIN_SECONDS``: then replication may not have
+    caught up, and the primary session is used so they see their own writes.
+    The pin travels in a cookie, so it holds whichever worker serves the read.
+    """
+    pinned = request.cookies.get(REPLICA_PIN_COOKIE) == current_user.id
+    if replica_session is None or pinned:
+        yield db
+        return
+    async with replica_session() as session:
+        yield session
+
+
+# APIRoute.unique_id -> digest of the route's response schema
+_schema_digests: dict[str, str] = {}
+
+
+def _schema_digest(request: Request) -> str:
+    """Digest of the route's response schema.
+
+    Folding it into the ETag means a deploy that changes a payload's shape
+    invalidates copies cached before it.
+    """
+    route = request.scope["route"]
+    if route.unique_id not in _schema_digests:
+        schema = TypeAdapter(route.response_model).json_schema()
+        encoded = json.dumps(schema, sort_keys=True).encode()
+        _schema_digests[route.unique_id] = hashlib.sha256(encoded).hexdigest()
+    return _schema_digests[route.unique_id]
+
+
+async def catalog_cache_headers(
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> dict[str, str]:
+    """Answer a conditional GET of a catalog endpoint.
+
+    Raises 304 Not Modified when the client's copy is current, before the
+    endpoint runs any query. Otherwise returns the ``ETag`` and
+    ``Cache-Control`` headers the response must carry.
+    """
+    etag = await catalog_etag(db, current_user.id, _schema_digest(request))
+    headers = {"ETag": etag, "Cache-Control": settings.CATALOG_CACHE_CONTROL}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return headers
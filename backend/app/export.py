@@ -0,0 +1,203 @@
+"""Streaming export of everything a user owns.
+
+Each exported table is a query over the user's rows. Rows are read through
+a server-side cursor in partitions of :data:`PARTITION_SIZE` and encoded
+one partition at a time, so memory use does not grow with the account:
+
+* NDJSON carries every table, one object per row tagged with its
+  ``table``;
+* CSV and Parquet hold one table per file. Parquet writes one row group
+  per partition and needs the optional ``pyarrow`` package.
+
+The ``sets`` table uses the importer's native layout (see
+:mod:`app.importer`), so an export can be imported into another account.
+"""
+
+import csv
+import io
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any
+
+from sqlalchemy import Boolean, DateTime, Integer, Numeric, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Exercise,
+    ExerciseProgress,
+    Program,
+    ProgramRoutine,
+    TemplateExercise,
+    UserProgram,
+    WorkoutSession,
+    WorkoutSet,
+    WorkoutTemplate,
+)
+from app.serialization import dumps
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+PARTITION_SIZE = 1000
+
+
+def parquet_available() -> bool:
+    return pyarrow is not None
+
+
+def _sets(user_id: str) -> Select:
+    return (
+        select(
+            WorkoutSet.session_id,
+            WorkoutSession.started_at,
+            WorkoutSession.finished_at,
+            WorkoutTemplate.name.label("workout"),
+            WorkoutSession.week_type,
+            WorkoutSession.year_week,
+            Exercise.name.label("exercise"),
+            WorkoutSet.set_type,
+            WorkoutSet.set_number,
+            WorkoutSet.reps,
+            WorkoutSet.weight,
+            WorkoutSet.rpe,
+            WorkoutSet.notes,
+        )
+        .join(WorkoutSession, WorkoutSet.session_id == WorkoutSession.id)
+        .join(Exercise, WorkoutSet.exercise_id == Exercise.id)
+        .outerjoin(WorkoutTemplate, WorkoutSession.template_id == WorkoutTemplate.id)
+        .where(WorkoutSession.user_id == user_id)
+        .order_by(
+            WorkoutSession.started_at,
+            WorkoutSession.id,
+            WorkoutSet.created_at,
+            WorkoutSet.set_number,
+        )
+    )
+
+
+def _owned(model: type, order_by: Any) -> Callable[[str], Select]:
+    return lambda user_id: (
+        select(model.__table__).where(model.user_id == user_id).order_by(order_by)
+    )
+
+
+def _children(
+    model: type, parent: type, key: str, order_by: Any
+) -> Callable[[str], Select]:
+    return lambda user_id: (
+        select(model.__table__)
+        .join(parent, getattr(model, key) == parent.id)
+        .where(parent.user_id == user_id)
+        .order_by(getattr(model, key), order_by)
+    )
+
+
+# Table name -> query over one user's rows, in NDJSON output order
+EXPORT_TABLES: dict[str, Callable[[str], Select]] = {
+    "exercises": _owned(Exercise, Exercise.name),
+    "templates": _owned(WorkoutTemplate, WorkoutTemplate.name),
+    "template_exercises": _children(
+        TemplateExercise, WorkoutTemplate, "template_id", TemplateExercise.order
+    ),
+    "programs": _owned(Program, Program.name),
+    "program_routines": _children(
+        ProgramRoutine, Program, "program_id", ProgramRoutine.order
+    ),
+    "user_programs": _owned(UserProgram, UserProgram.id),
+    "sessions": _owned(WorkoutSession, WorkoutSession.started_at),
+    "sets": _sets,
+    "progress": _owned(ExerciseProgress, ExerciseProgress.year_week),
+}
+
+
+async def _partitions(db: AsyncSession, stmt: Select) -> AsyncIterator[Sequence[Any]]:
+    result = await db.stream(stmt.execution_options(yield_per=PARTITION_SIZE))
+    async for partition in result.mappings().partitions():
+        yield partition
+
+
+async def ndjson_stream(db: AsyncSession, user_id: str) -> AsyncIterator[bytes]:
+    """Every table as NDJSON, one chunk per partition."""
+    for name, query in EXPORT_TABLES.items():
+        async for rows in _partitions(db, query(user_id)):
+            yield b"".join(dumps({"table": name, **row}) + b"\n" for row in rows)
+
+
+async def csv_stream(
+    db: AsyncSession, user_id: str, table: str
+) -> AsyncIterator[bytes]:
+    """One table as CSV with a header row."""
+    stmt = EXPORT_TABLES[table](user_id)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(stmt.selected_columns.keys())
+    async for rows in _partitions(db, stmt):
+        writer.writerows(row.values() for row in rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # No rows: the header alone
+        yield buffer.getvalue().encode()
+
+
+def _arrow_type(sql_type: Any) -> Any:
+    if isinstance(sql_type, Boolean):
+        return pyarrow.bool_()
+    if isinstance(sql_type, Integer):
+        return pyarrow.int64()
+    if isinstance(sql_type, Numeric):
+        return pyarrow.decimal128(sql_type.precision, sql_type.scale)
+    if isinstance(sql_type, DateTime):
+        return pyarrow.timestamp("us")
+    return pyarrow.string()
+
+
+class _Sink(io.RawIOBase):
+    """Write target that hands out what was written since the last drain.
+
+    ``tell`` keeps counting across drains: Parquet footers record absolute
+    offsets.
+    """
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+async def parquet_stream(
+    db: AsyncSession, user_id: str, table: str
+) -> AsyncIterator[bytes]:
+    """One table as Parquet, one row group per partition."""
+    stmt = EXPORT_TABLES[table](user_id)
+    schema = pyarrow.schema(
+        [(c.key, _arrow_type(c.type)) for c in stmt.selected_columns]
+    )
+    sink = _Sink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema, compression="zstd")
+    async for rows in _partitions(db, stmt):
+        writer.write_table(
+            pyarrow.Table.from_pylist([dict(row) for row in rows], schema=schema)
+        )
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
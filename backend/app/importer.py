@@ -0,0 +1,550 @@
+"""Streaming import of workout history from CSV or NDJSON exports.
+
+Three layouts are recognised from the file's header:
+
+* ``strong``: the Strong app's CSV export (``Date``, ``Workout Name``,
+  ``Exercise Name``, ``Set Order``, ``Weight``, ``Reps``, ...);
+* ``hevy``: Hevy's CSV export (``start_time``, ``title``, ``exercise_title``,
+  ``set_index``, ``set_type``, ``weight_kg``, ``reps``, ...);
+* ``native``: one set per row with this app's field names (``started_at``,
+  ``workout``, ``exercise``, ``set_type``, ``set_number``, ``reps``,
+  ``weight``, ...), as CSV or one JSON object per line.
+
+The file is read row by row and written in batches of whole sessions.
+Exercise and template names are resolved against one in-memory lookup, and
+unknown exercises become custom exercises of the user. On PostgreSQL each
+batch is loaded with ``COPY`` into a staging table. Elsewhere it is
+inserted with one multi-row statement per table. Session and set ids are
+derived from the user and the row's position in its session, so re-running
+an import skips rows already loaded instead of duplicating them. After each
+batch commits, along with its sessions' totals, the number of rows consumed
+is saved to a checkpoint file with each session's set count, and
+``--resume`` continues from there. Once
+the last batch is in, exercise progress, weekly volume and personal records
+are rebuilt for the user in set-based passes::
+
+    python -m app.importer export.csv --email me@example.com [--resume]
+
+Weights are stored as exported, in the unit the user logs in.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import math
+import time
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from sqlalchemy import column, func, or_, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.bulk import insert_for
+from app.catalog import bump_catalog_versions
+from app.changes import record_changes
+from app.database import async_session
+from app.models import Exercise, User, WorkoutSession, WorkoutSet, WorkoutTemplate
+from app.records import rebuild_personal_records
+from app.rollups import rebuild_exercise_progress, rebuild_weekly_volume
+from app.summaries import refresh_session_summaries
+
+BATCH_SIZE = 5000
+_NAMESPACE = uuid.UUID("6b1c2a47-5f4e-4d8a-9a63-0f6f1b3e9c21")
+_DATETIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%d %b %Y, %H:%M")
+
+
+class ImportFormatError(ValueError):
+    """A row of the import file cannot be read."""
+
+
+class ImportedSet(NamedTuple):
+    session_key: str
+    started_at: datetime
+    finished_at: datetime | None
+    workout: str | None
+    week_type: str
+    year_week: str
+    exercise: str
+    set_type: str
+    set_number: int
+    reps: int
+    weight: Decimal
+    rpe: Decimal | None
+    notes: str | None
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    skipped: int = 0
+    sessions: int = 0
+    sets: int = 0
+    exercises_created: int = 0
+    seconds: float = 0.0
+    rebuilt: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def year_week(moment: datetime) -> str:
+    """The app's week label: 7-day blocks counted from January 1st."""
+    week = math.ceil(moment.timetuple().tm_yday / 7)
+    return f"{moment.year}-{week:02d}"
+
+
+def _datetime(value: str) -> datetime:
+    value = value.strip()
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        pass
+    for fmt in _DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ImportFormatError(f"unrecognised date {value!r}")
+
+
+def _decimal(value: Any) -> Decimal | None:
+    if value is None or str(value).strip() == "":
+        return None
+    try:
+        return Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ImportFormatError(f"not a number: {value!r}") from None
+
+
+def _int(value: Any) -> int | None:
+    number = _decimal(value)
+    return None if number is None else int(number)
+
+
+def _text(value: Any) -> str | None:
+    value = (value or "").strip() if isinstance(value, str) else value
+    return value or None
+
+
+def _duration(value: str) -> timedelta | None:
+    """Strong's ``Duration``: ``1h 5m``, ``45m`` or plain seconds."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return timedelta(seconds=int(value))
+    seconds = 0
+    for part in value.split():
+        unit, amount = part[-1], part[:-1]
+        if not amount.isdigit() or unit not in "hms":
+            return None
+        seconds += int(amount) * {"h": 3600, "m": 60, "s": 1}[unit]
+    return timedelta(seconds=seconds)
+
+
+def _set(
+    session_key: str,
+    started_at: datetime,
+    finished_at: datetime | None,
+    workout: str | None,
+    exercise: str | None,
+    set_type: str,
+    set_number: int | None,
+    reps: int | None,
+    weight: Decimal | None,
+    rpe: Decimal | None = None,
+    notes: str | None = None,
+    week_type: str | None = None,
+    week: str | None = None,
+) -> ImportedSet | None:
+    """Build a set, or None for rows this app cannot store (e.g. cardio)."""
+    if not exercise or reps is None:
+        return None
+    return ImportedSet(
+        session_key=session_key,
+        started_at=started_at,
+        finished_at=finished_at,
+        workout=workout,
+        week_type=week_type or "normal",
+        year_week=week or year_week(started_at),
+        exercise=exercise,
+        set_type=set_type,
+        set_number=max(set_number or 1, 1),
+        reps=reps,
+        weight=weight or Decimal(0),
+        rpe=rpe if rpe is not None and 1 <= rpe <= 10 else None,
+        notes=notes,
+    )
+
+
+def _strong(row: dict[str, str]) -> ImportedSet | None:
+    started_at = _datetime(row["Date"])
+    duration = _duration(row.get("Duration", ""))
+    order = (row.get("Set Order") or "").strip()
+    return _set(
+        f"{row['Date']}|{row['Workout Name']}",
+        started_at,
+        started_at + duration if duration else None,
+        _text(row["Workout Name"]),
+        _text(row["Exercise Name"]),
+        "warmup" if order.upper() == "W" else "working",
+        _int(order) if order.isdigit() else None,
+        _int(row.get("Reps")) or _int(row.get("Seconds")),
+        _decimal(row.get("Weight")),
+        _decimal(row.get("RPE")),
+        _text(row.get("Notes")),
+    )
+
+
+def _hevy(row: dict[str, str]) -> ImportedSet | None:
+    weight = row.get("weight_kg", row.get("weight_lbs"))
+    return _set(
+        f"{row['start_time']}|{row['title']}",
+        _datetime(row["start_time"]),
+        _datetime(row["end_time"]) if _text(row.get("end_time")) else None,
+        _text(row["title"]),
+        _text(row["exercise_title"]),
+        "warmup" if row.get("set_type") == "warmup" else "working",
+        (_int(row.get("set_index")) or 0) + 1,
+        _int(row.get("reps")) or _int(row.get("duration_seconds")),
+        _decimal(weight),
+        _decimal(row.get("rpe")),
+        _text(row.get("exercise_notes")),
+    )
+
+
+def _native(row: dict[str, Any]) -> ImportedSet | None:
+    started_at = _datetime(row["started_at"])
+    finished_at = row.get("finished_at")
+    return _set(
+        str(row.get("session_id") or f"{row['started_at']}|{row.get('workout')}"),
+        started_at,
+        _datetime(finished_at) if _text(finished_at) else None,
+        _text(row.get("workout")),
+        _text(row.get("exercise")),
+        _text(row.get("set_type")) or "working",
+        _int(row.get("set_number")),
+        _int(row.get("reps")),
+        _decimal(row.get("weight")),
+        _decimal(row.get("rpe")),
+        _text(row.get("notes")),
+        _text(row.get("week_type")),
+        _text(row.get("year_week")),
+    )
+
+
+def _layout(columns: list[str]) -> Any:
+    if "Exercise Name" in columns:
+        return _strong
+    if "exercise_title" in columns:
+        return _hevy
+    if {"started_at", "exercise"} <= set(columns):
+        return _native
+    raise ImportFormatError(f"unrecognised export layout with columns {columns}")
+
+
+def _rows(path: Path) -> Iterator[tuple[Any, dict[str, Any]]]:
+    """The file's records, each with the parser for its layout."""
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        if path.suffix in (".ndjson", ".jsonl"):
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    # Full exports (app.export) tag rows with their table
+                    if record.pop("table", "sets") == "sets":
+                        yield _native, record
+            return
+        try:
+            dialect = csv.Sniffer().sniff(f.read(4096), delimiters=",;")
+        except csv.Error:
+            dialect = csv.excel
+        f.seek(0)
+        reader = csv.DictReader(f, dialect=dialect)
+        parse = _layout(reader.fieldnames or [])
+        for row in reader:
+            yield parse, row
+
+
+def read_sets(path: Path) -> Iterator[ImportedSet | None]:
+    """Stream the file's records as sets; None marks a record that was skipped."""
+    for number, (parse, row) in enumerate(_rows(path), start=1):
+        try:
+            yield parse(row)
+        except (ImportFormatError, KeyError) as exc:
+            raise ImportFormatError(f"record {number}: {exc}") from None
+
+
+def _id(*parts: object) -> str:
+    return str(uuid.uuid5(_NAMESPACE, ":".join(map(str, parts))))
+
+
+class _Batch:
+    """Sessions and sets waiting to be written."""
+
+    def __init__(self) -> None:
+        self.sessions: dict[str, dict[str, Any]] = {}
+        self.sets: list[dict[str, Any]] = []
+
+
+class HistoryImporter:
+    def __init__(
+        self, db: AsyncSession, user_id: str, batch_size: int = BATCH_SIZE
+    ) -> None:
+        self.db = db
+        self.user_id = user_id
+        self.batch_size = batch_size
+        self.exercises: dict[str, str] = {}  # casefolded name -> id
+        self.templates: dict[str, str] = {}
+        self.positions: dict[str, int] = {}  # session key -> sets seen
+        self.stats = ImportStats()
+
+    async def load_lookups(self) -> None:
+        """Name -> id maps for every exercise and template the user can see."""
+        for model, lookup in (
+            (Exercise, self.exercises),
+            (WorkoutTemplate, self.templates),
+        ):
+            result = await self.db.execute(
+                select(model.name, model.id)
+                .where(or_(model.user_id.is_(None), model.user_id == self.user_id))
+                # The user's own rows win over shared ones of the same name
+                .order_by(model.user_id.is_not(None))
+            )
+            lookup.update((name.casefold(), id_) for name, id_ in result.tuples())
+
+    async def _exercise_ids(self, names: set[str]) -> None:
+        """Create custom exercises for names the lookup does not know."""
+        missing = {n.casefold(): n for n in names if n.casefold() not in self.exercises}
+        if not missing:
+            return
+        rows = [
+            dict(
+                id=_id(self.user_id, "exercise", key),
+                user_id=self.user_id,
+                name=name,
+                muscle_group="Other",
+                is_custom=True,
+                exercise_type="reps",
+                created_at=datetime.utcnow(),
+            )
+            for key, name in missing.items()
+        ]
+        await self.db.execute(
+            insert_for(self.db, Exercise).on_conflict_do_nothing(), rows
+        )
+        await bump_catalog_versions(self.db, [self.user_id])
+        self.exercises.update((key, row["id"]) for key, row in zip(missing, rows))
+        self.stats.exercises_created += len(rows)
+
+    def add(self, batch: _Batch, row: ImportedSet) -> None:
+        session_id = _id(self.user_id, "session", row.session_key)
+        if session_id not in batch.sessions:
+            batch.sessions[session_id] = dict(
+                id=session_id,
+                user_id=self.user_id,
+                template_id=self.templates.get((row.workout or "").casefold()),
+                year_week=row.year_week,
+                week_type=row.week_type,
+                started_at=row.started_at,
+                finished_at=row.finished_at,
+                synced=True,
+                working_set_count=0,
+                total_volume=Decimal(0),
+                exercise_count=0,
+            )
+        position = self.positions.get(row.session_key, 0)
+        self.positions[row.session_key] = position + 1
+        batch.sets.append(
+            dict(
+                id=_id(self.user_id, "set", row.session_key, position),
+                session_id=session_id,
+                exercise=row.exercise,
+                set_type=row.set_type,
+                set_number=row.set_number,
+                reps=row.reps,
+                weight=row.weight,
+                rpe=row.rpe,
+                notes=row.notes,
+                created_at=row.started_at,
+            )
+        )
+
+    async def flush(self, batch: _Batch) -> None:
+        """Write one batch; rows that already exist are left alone."""
+        await self._exercise_ids({s["exercise"] for s in batch.sets})
+        for s in batch.sets:
+            s["exercise_id"] = self.exercises[s.pop("exercise").casefold()]
+        session_ids = await self._insert(WorkoutSession, list(batch.sessions.values()))
+        set_ids = await self._insert(WorkoutSet, batch.sets)
+        # Core writes bypass the ORM, so stamp them onto the change feed
+        # explicitly; refreshing the totals stamps the sessions
+        await record_changes(self.db, self.user_id, {WorkoutSet: set_ids})
+        await refresh_session_summaries(self.db, self.user_id, batch.sessions)
+        self.stats.sessions += len(session_ids)
+        self.stats.sets += len(set_ids)
+
+    async def _insert(self, model: type, rows: list[dict[str, Any]]) -> list[str]:
+        if not rows:
+            return []
+        if self.db.get_bind().dialect.name == "postgresql":
+            return await self._copy(model, rows)
+        stmt = insert_for(self.db, model).on_conflict_do_nothing()
+        result = await self.db.scalars(stmt.returning(model.id), rows)
+        return list(result.all())
+
+    async def _copy(self, model: type, rows: list[dict[str, Any]]) -> list[str]:
+        """``COPY`` rows into a staging table, then move the new ones over."""
+        target = model.__table__
+        columns = list(rows[0])
+        staging = table(f"import_{target.name}", *(column(c) for c in columns))
+        await self.db.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {staging.name} ON COMMIT DELETE ROWS "
+                f"AS SELECT {', '.join(columns)} FROM {target.fullname} WITH NO DATA"
+            )
+        )
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            staging.name,
+            records=[tuple(row[c] for c in columns) for row in rows],
+            columns=columns,
+        )
+        stmt = (
+            insert_for(self.db, model)
+            .from_select(columns, select(*staging.c))
+            .on_conflict_do_nothing()
+            .returning(target.c.id)
+        )
+        result = await self.db.scalars(stmt)
+        return list(result.all())
+
+    async def rebuild(self) -> None:
+        """Recompute everything derived from the user's sets."""
+        rebuilt = self.stats.rebuilt
+        rebuilt["exercise_progress"] = await rebuild_exercise_progress(
+            self.db, self.user_id
+        )
+        rebuilt["weekly_volume"] = await rebuild_weekly_volume(self.db, self.user_id)
+        rebuilt["personal_records"] = await rebuild_personal_records(
+            self.db, self.user_id
+        )
+
+
+def _checkpoint_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.checkpoint.json")
+
+
+def _read_checkpoint(path: Path) -> tuple[int, dict[str, int]]:
+    """Rows consumed so far, and the sets already seen per session key."""
+    checkpoint = _checkpoint_path(path)
+    if not checkpoint.exists():
+        return 0, {}
+    state = json.loads(checkpoint.read_text())
+    if state.get("size") != path.stat().st_size:
+        raise ImportFormatError(f"{checkpoint} was written for a different file")
+    return state["rows"], state.get("positions", {})
+
+
+def _write_checkpoint(path: Path, rows: int, positions: dict[str, int]) -> None:
+    state = dict(
+        source=path.name, size=path.stat().st_size, rows=rows, positions=positions
+    )
+    _checkpoint_path(path).write_text(json.dumps(state))
+
+
+async def import_history(
+    db: AsyncSession,
+    user_id: str,
+    path: Path,
+    *,
+    resume: bool = False,
+    batch_size: int = BATCH_SIZE,
+    progress: Any = None,
+) -> ImportStats:
+    """Import ``path`` for the user, committing after every batch.
+
+    ``progress`` is called with the running stats after each batch.
+    """
+    importer = HistoryImporter(db, user_id, batch_size)
+    await importer.load_lookups()
+    stats = importer.stats
+    skip = 0
+    if resume:
+        # A session's rows need not be contiguous, so its set positions
+        # carry on from where the committed batches left them
+        skip, importer.positions = _read_checkpoint(path)
+    started = time.monotonic()
+
+    batch, current_key, consumed = _Batch(), None, skip
+    for index, row in enumerate(read_sets(path)):
+        if index < skip:
+            continue
+        if row is not None and row.session_key != current_key:
+            # Batches end on session boundaries so a resume never splits one
+            if len(batch.sets) >= batch_size:
+                await importer.flush(batch)
+                await db.commit()
+                _write_checkpoint(path, consumed, importer.positions)
+                stats.rows = consumed - skip
+                stats.seconds = time.monotonic() - started
+                if progress is not None:
+                    progress(stats)
+                batch = _Batch()
+            current_key = row.session_key
+        consumed = index + 1
+        if row is None:
+            stats.skipped += 1
+        else:
+            importer.add(batch, row)
+
+    await importer.flush(batch)
+    await importer.rebuild()
+    await db.commit()
+    _checkpoint_path(path).unlink(missing_ok=True)
+    stats.rows, stats.seconds = consumed - skip, time.monotonic() - started
+    return stats
+
+
+def _report(stats: ImportStats) -> None:
+    print(
+        f"{stats.rows} rows, {stats.sessions} sessions and {stats.sets} sets "
+        f"written ({stats.rows_per_second:,.0f} rows/s)"
+    )
+
+
+async def _main(path: Path, email: str, resume: bool, batch_size: int) -> None:
+    async with async_session() as db:
+        user_id = await db.scalar(
+            select(User.id).where(func.lower(User.email) == email.lower())
+        )
+        if user_id is None:
+            raise SystemExit(f"No user with email {email}")
+        stats = await import_history(
+            db, user_id, path, resume=resume, batch_size=batch_size, progress=_report
+        )
+    _report(stats)
+    print(
+        f"Skipped {stats.skipped} rows without reps, created "
+        f"{stats.exercises_created} custom exercises; rebuilt "
+        + ", ".join(f"{name}: {count}" for name, count in stats.rebuilt.items())
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import workout history")
+    parser.add_argument("path", type=Path, help="CSV or NDJSON export")
+    parser.add_argument("--email", required=True, help="Owner of the imported data")
+    parser.add_argument(
+        "--resume", action="store_true", help="Continue from the last checkpoint"
+    )
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+    asyncio.run(_main(args.path, args.email, args.resume, args.batch_size))
@@ -1,20 +1,36 @@
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import async_session, settings
+from app.compression import CompressionMiddleware, available_codecs
+from app.database import (
+    async_session,
+    engine,
+    replica_engine,
+    replica_session,
+    settings,
+)
+from app.dependencies import get_db, identity_cache
+from app.performance import last_performance_cache
+from app.plans import plan_cache
+from app.pool import pool_stats
+from app.query_stats import QueryStatsMiddleware
 from app.routes.auth import router as auth_router
+from app.routes.bootstrap import router as bootstrap_router
 from app.routes.exercises import router as exercises_router
+from app.routes.export import router as export_router
 from app.routes.programs import router as programs_router
 from app.routes.progress import router as progress_router
 from app.routes.sessions import router as sessions_router
 from app.routes.stats import router as stats_router
 from app.routes.sync import router as sync_router
 from app.routes.templates import router as templates_router
-from app.seed import seed_default_program, seed_exercises
-from app.seed_minimalift import seed_minimalift_program
-from app.seed_minimalift_5day import seed_minimalift_5day_program
+from app.seed import run_seeds
+from app.serialization import ORJSONResponse
 
 
 @asynccontextmanager
@@ -22,33 +38,49 @@ async def lifespan(app: FastAPI):
     try:
         print("[LIFESPAN] Connecting to DB")
         async with async_session() as db:
-            await seed_exercises(db)
-            print("[LIFESPAN] Exercises seeded")
-            await seed_default_program(db)
-            print("[LIFESPAN] JN program seeded")
-            await seed_minimalift_program(db)
-            print("[LIFESPAN] Minimalift 3-Day program seeded")
-            await seed_minimalift_5day_program(db)
-            print("[LIFESPAN] Minimalift 5-Day program seeded")
+            applied = await run_seeds(db)
+            print(f"[LIFESPAN] Seeds applied: {', '.join(applied) or 'none'}")
     except Exception as e:
         print(f"[LIFESPAN] ERROR: {e}")
         raise
     yield
 
 
+def _split(value: str) -> list[str]:
+    """Items of a comma-separated setting."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
 app = FastAPI(
     title="Gym Tracker API",
     lifespan=lifespan,
     redirect_slashes=False,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[o.strip() for o in settings.CORS_ORIGINS.split(",")],
+    allow_origins=_split(settings.CORS_ORIGINS),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    CompressionMiddleware,
+    codecs=available_codecs(
+        _split(settings.COMPRESSION_ENCODINGS),
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+    ),
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    content_types=_split(settings.COMPRESSION_CONTENT_TYPES),
+)
+app.add_middleware(
+    QueryStatsMiddleware,
+    budget=settings.QUERY_BUDGET,
+    repeat_threshold=settings.QUERY_REPEAT_THRESHOLD,
+)
 
 app.include_router(auth_router)
 app.include_router(exercises_router)
@@ -58,9 +90,69 @@ app.include_router(programs_router)
 app.include_router(progress_router)
 app.include_router(stats_router)
 app.include_router(sync_router)
+app.include_router(bootstrap_router)
+app.include_router(export_router)
 
 
 @app.get("/health")
 async def health_check() -> dict:
-    """Health check endpoint."""
+    """Liveness: the process is serving requests. See ``/health/ready``."""
     return {"status": "ok"}
+
+
+async def _ping(db: AsyncSession) -> str:
+    try:
+        await asyncio.wait_for(
+            db.execute(text("SELECT 1")), settings.HEALTH_CHECK_TIMEOUT_SECONDS
+        )
+    except Exception as e:
+        return f"error: {type(e).__name__}"
+    return "ok"
+
+
+def _pools() -> dict:
+    pools = {"primary": pool_stats(engine.pool)}
+    if replica_engine is not None:
+        pools["replica"] = pool_stats(replica_engine.pool)
+    return pools
+
+
+@app.get("/health/ready")
+async def readiness_check(db: AsyncSession = Depends(get_db)) -> ORJSONResponse:
+    """Readiness: every database answers, with this worker's pool counters.
+
+    Responds 503 while the primary or the configured replica is unreachable.
+    """
+    checks = {"database": await _ping(db)}
+    if replica_session is not None:
+        async with replica_session() as replica:
+            checks["replica"] = await _ping(replica)
+    ready = all(result == "ok" for result in checks.values())
+    return ORJSONResponse(
+        {"status": "ok" if ready else "unavailable", **checks, "pools": _pools()},
+        status_code=200 if ready else 503,
+    )
+
+
+@app.get("/health/db-pool")
+async def db_pool_stats() -> dict:
+    """Checked-out connections, overflow, checkout waits and timeouts per pool."""
+    return _pools()
+
+
+@app.get("/health/identity-cache")
+async def identity_cache_stats() -> dict:
+    """Hit/miss counters for this worker's identity cache."""
+    return identity_cache.stats()
+
+
+@app.get("/health/plan-cache")
+async def plan_cache_stats() -> dict:
+    """Hit/miss counters for this worker's shared program plan cache."""
+    return plan_cache.stats()
+
+
+@app.get("/health/last-performance-cache")
+async def last_performance_cache_stats() -> dict:
+    """Hit/miss counters for this worker's last performance cache."""
+    return last_performance_cache.stats()
@@ -3,9 +3,11 @@ from datetime import datetime
 from decimal import Decimal
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -123,6 +125,14 @@ class WorkoutTemplate(Base):
 
 class TemplateExercise(Base):
     __tablename__ = "template_exercises"
+    __table_args__ = (
+        Index(
+            "ix_template_exercises_template_id_week_type_order",
+            "template_id",
+            "week_type",
+            "order",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -154,6 +164,12 @@ class TemplateExercise(Base):
 
 class WorkoutSession(Base):
     __tablename__ = "workout_sessions"
+    __table_args__ = (
+        Index(
+            "ix_workout_sessions_user_id_started_at_id", "user_id", "started_at", "id"
+        ),
+        Index("ix_workout_sessions_user_id_year_week", "user_id", "year_week"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -179,6 +195,12 @@ class WorkoutSession(Base):
     finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     synced: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # Maintained from workout_sets by app.summaries
+    working_set_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_volume: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=0
+    )
+    exercise_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     user: Mapped[User] = relationship(back_populates="sessions")
     template: Mapped[WorkoutTemplate | None] = relationship(back_populates="sessions")
@@ -194,6 +216,10 @@ class WorkoutSession(Base):
 
 class WorkoutSet(Base):
     __tablename__ = "workout_sets"
+    __table_args__ = (
+        Index("ix_workout_sets_session_id_exercise_id", "session_id", "exercise_id"),
+        Index("ix_workout_sets_exercise_id", "exercise_id"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -243,6 +269,69 @@ class ExerciseProgress(Base):
     exercise: Mapped[Exercise] = relationship(back_populates="progress")
 
 
+class WeeklyVolume(Base):
+    """Working-set volume rollup per user, week and muscle group.
+
+    Maintained incrementally by the set write paths (see ``app.rollups``) so
+    the volume chart never has to rescan a user's whole history.
+    """
+
+    __tablename__ = "weekly_volume"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "year_week", "muscle_group", name="uq_weekly_volume"
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id"), nullable=False
+    )
+    year_week: Mapped[str] = mapped_column(String(10), nullable=False)
+    muscle_group: Mapped[str] = mapped_column(String(100), nullable=False)
+    total_volume: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    set_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class PersonalRecord(Base):
+    """A user's best set for one exercise under one ranking.
+
+    ``record_type`` is ``max_weight``, ``max_reps``, ``e1rm`` or ``rm_<n>``
+    (heaviest set of exactly n reps, n = 1..12). Each row points at the set
+    that holds it and copies that set's numbers, so reads never touch history.
+    """
+
+    __tablename__ = "personal_records"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "exercise_id", "record_type", name="uq_personal_record"
+        ),
+        Index("ix_personal_records_set_id", "set_id"),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id"), nullable=False
+    )
+    exercise_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("exercises.id"), nullable=False
+    )
+    record_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    set_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("workout_sets.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    weight: Mapped[Decimal] = mapped_column(Numeric(7, 2), nullable=False)
+    reps: Mapped[int] = mapped_column(Integer, nullable=False)
+    e1rm: Mapped[Decimal] = mapped_column(Numeric(8, 2), nullable=False)
+    achieved_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
 class Program(Base):
     __tablename__ = "programs"
 
@@ -320,6 +409,9 @@ class UserProgram(Base):
 
 class ProgramRoutine(Base):
     __tablename__ = "program_routines"
+    __table_args__ = (
+        Index("ix_program_routines_program_id_order", "program_id", "order"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -342,6 +434,9 @@ class ProgramRoutine(Base):
 
 class ProgramPhase(Base):
     __tablename__ = "program_phases"
+    __table_args__ = (
+        Index("ix_program_phases_program_id_order", "program_id", "order"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -364,6 +459,14 @@ class ProgramPhase(Base):
 
 class PhaseWorkout(Base):
     __tablename__ = "phase_workouts"
+    __table_args__ = (
+        Index(
+            "ix_phase_workouts_phase_id_week_number_day_index",
+            "phase_id",
+            "week_number",
+            "day_index",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -387,6 +490,9 @@ class PhaseWorkout(Base):
 
 class PhaseWorkoutSection(Base):
     __tablename__ = "phase_workout_sections"
+    __table_args__ = (
+        Index("ix_phase_workout_sections_workout_id_order", "workout_id", "order"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -410,6 +516,9 @@ class PhaseWorkoutSection(Base):
 
 class PhaseWorkoutExercise(Base):
     __tablename__ = "phase_workout_exercises"
+    __table_args__ = (
+        Index("ix_phase_workout_exercises_section_id_order", "section_id", "order"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -444,3 +553,56 @@ class PhaseWorkoutExercise(Base):
     substitute2: Mapped["Exercise | None"] = relationship(
         foreign_keys=[substitute2_exercise_id]
     )
+
+
+class ChangeLog(Base):
+    """Append-only feed of row changes; see :mod:`app.changes`.
+
+    ``user_id`` is NULL for shared catalog rows, which every user receives.
+    The client's sync cursor is ``txid`` on PostgreSQL and ``id`` elsewhere.
+    """
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_user_id_id", "user_id", "id"),
+        Index("ix_change_log_user_id_txid_id", "user_id", "txid", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    user_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    # Writing transaction (txid_current()); NULL on SQLite
+    txid: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    entity: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    deleted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+
+
+class SeedVersion(Base):
+    """Content hash of each shared seed dataset last applied to this database."""
+
+    __tablename__ = "seed_versions"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    applied_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+
+
+class CatalogVersion(Base):
+    """Write counter for one owner's catalog rows, used to build ETags.
+
+    ``scope`` is a user id, or ``"shared"`` for rows without an owner.
+    """
+
+    __tablename__ = "catalog_versions"
+
+    scope: Mapped[str] = mapped_column(String(36), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,129 @@
+"""What a user lifted last time on each exercise.
+
+For every requested exercise this returns the working sets of the most
+recent session that trained it, plus the best set by estimated 1RM over
+its last :data:`RECENT_SESSIONS` sessions. One query ranks the user's
+working sets per exercise with window functions; it reads the user's
+sessions through ``(user_id, started_at, id)`` and their sets for the
+requested exercises through ``(session_id, exercise_id)``, so other users'
+history of a shared exercise is never scanned.
+
+Results are cached per user in this worker and dropped by
+:func:`invalidate_last_performance` on every set write. A write served by
+another worker leaves this worker's entry in place until it expires
+(``LAST_PERFORMANCE_CACHE_TTL_SECONDS``). The image runs a single uvicorn
+worker (see ``backend/Dockerfile``), so every write reaches the only cache.
+Running more workers needs a shorter TTL, or a TTL of zero to disable the
+cache.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import TTLCache
+from app.database import settings
+from app.models import WorkoutSession, WorkoutSet
+from app.records import estimate_1rm
+from app.schemas import LastPerformanceResponse, RecordSetResponse, SetResponse
+
+RECENT_SESSIONS = 5
+
+# user_id -> {exercise_id: LastPerformanceResponse | None}
+last_performance_cache = TTLCache(
+    max_entries=settings.LAST_PERFORMANCE_CACHE_MAX_ENTRIES,
+    ttl=settings.LAST_PERFORMANCE_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_last_performance(user_id: str) -> None:
+    last_performance_cache.invalidate(user_id)
+
+
+async def last_performance(
+    db: AsyncSession, user_id: str, exercise_ids: Iterable[str]
+) -> dict[str, LastPerformanceResponse]:
+    """Last performance per exercise; exercises never trained are left out."""
+    exercise_ids = list(dict.fromkeys(exercise_ids))
+    known = last_performance_cache.get(user_id) or {}
+    missing = [e for e in exercise_ids if e not in known]
+    if missing:
+        known = {**known, **await _load(db, user_id, missing)}
+        last_performance_cache.set(user_id, known)
+    return {e: known[e] for e in exercise_ids if known[e] is not None}
+
+
+async def _load(
+    db: AsyncSession, user_id: str, exercise_ids: list[str]
+) -> dict[str, LastPerformanceResponse | None]:
+    sets = WorkoutSet.__table__
+    ranked = (
+        select(
+            *sets.c,
+            WorkoutSession.started_at,
+            func.dense_rank()
+            .over(
+                partition_by=sets.c.exercise_id,
+                order_by=(WorkoutSession.started_at.desc(), WorkoutSession.id.desc()),
+            )
+            .label("session_rank"),
+        )
+        .join(WorkoutSession, sets.c.session_id == WorkoutSession.id)
+        .where(
+            WorkoutSession.user_id == user_id,
+            sets.c.exercise_id.in_(exercise_ids),
+            sets.c.set_type == "working",
+            sets.c.reps > 0,
+        )
+        .subquery()
+    )
+    # Epley, as in app.records.estimate_1rm
+    e1rm = case(
+        (ranked.c.reps <= 1, ranked.c.weight),
+        else_=ranked.c.weight * (30 + ranked.c.reps) / 30,
+    )
+    recent = (
+        select(
+            ranked,
+            func.row_number()
+            .over(
+                partition_by=ranked.c.exercise_id,
+                order_by=(e1rm.desc(), ranked.c.started_at, ranked.c.created_at),
+            )
+            .label("best_rank"),
+        )
+        .where(ranked.c.session_rank <= RECENT_SESSIONS)
+        .subquery()
+    )
+    result = await db.execute(
+        select(recent)
+        .where(or_(recent.c.session_rank == 1, recent.c.best_rank == 1))
+        .order_by(recent.c.set_number, recent.c.created_at)
+    )
+
+    latest: dict[str, list] = {}
+    best: dict = {}
+    for row in result.all():
+        if row.session_rank == 1:
+            latest.setdefault(row.exercise_id, []).append(row)
+        if row.best_rank == 1:
+            best[row.exercise_id] = row
+
+    found: dict[str, LastPerformanceResponse | None] = dict.fromkeys(exercise_ids)
+    for exercise_id, rows in latest.items():
+        top = best[exercise_id]
+        found[exercise_id] = LastPerformanceResponse(
+            exercise_id=exercise_id,
+            session_id=rows[0].session_id,
+            performed_at=rows[0].started_at,
+            sets=[SetResponse.model_validate(row) for row in rows],
+            best_set=RecordSetResponse(
+                set_id=top.id,
+                weight=top.weight,
+                reps=top.reps,
+                e1rm=estimate_1rm(top.weight, top.reps),
+                achieved_at=top.started_at,
+            ),
+        )
+    return found
@@ -0,0 +1,229 @@
+"""Cached program plans for GET /api/programs/today and phased navigation.
+
+A plan is a program's structure plus the serialized workouts built from it.
+Phased programs are also compiled into a flat schedule with one entry per
+workout day, so finding, advancing to or previewing a day is an index
+operation instead of a walk over phases and weeks.
+Shared programs (``user_id IS NULL``) are identical for every user and only
+change when seed data is re-applied, so their plans are cached per worker
+and each request only merges in the caller's enrollment fields. Plans of
+custom programs are built fresh on every call.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.cache import TTLCache
+from app.database import settings
+from app.models import (
+    PhaseWorkout,
+    PhaseWorkoutExercise,
+    PhaseWorkoutSection,
+    Program,
+    ProgramRoutine,
+    TemplateExercise,
+)
+from app.schemas import (
+    PhaseWorkoutExerciseResponse,
+    PhaseWorkoutResponse,
+    PhaseWorkoutSectionResponse,
+    ProgramPhaseResponse,
+    ProgramResponse,
+    ProgramRoutineResponse,
+    TemplateExerciseResponse,
+)
+
+# program_id -> ProgramPlan, shared programs only
+plan_cache = TTLCache(
+    max_entries=settings.PLAN_CACHE_MAX_ENTRIES,
+    ttl=settings.PLAN_CACHE_TTL_SECONDS,
+)
+
+
+class ScheduleDay(NamedTuple):
+    phase_index: int
+    week_number: int  # 1-indexed, as in PhaseWorkout
+    day_index: int
+    workout_id: str
+    workout_name: str
+
+    @property
+    def enrollment_fields(self) -> dict[str, int]:
+        """The UserProgram progress columns that point at this day."""
+        return dict(
+            current_phase_index=self.phase_index,
+            current_week_in_phase=self.week_number - 1,
+            current_day_index=self.day_index,
+        )
+
+
+@dataclass
+class ProgramPlan:
+    program: ProgramResponse
+    routines: list[ProgramRoutineResponse]
+    phases: list[ProgramPhaseResponse]
+    # Phased programs only: every workout day in order
+    schedule: list[ScheduleDay] = field(default_factory=list)
+    # (routine index, week_type) -> template exercises, or
+    # phase workout id -> workout
+    workouts: dict[object, object] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._keys = [day[:3] for day in self.schedule]
+        self._positions = {key: pos for pos, key in enumerate(self._keys)}
+        # Weeks wrap within a phase; phases without weeks have none to wrap
+        self._durations = [max(phase.duration_weeks, 0) for phase in self.phases]
+
+    def _key(self, enrollment) -> tuple[int, int, int]:
+        phase_idx = enrollment.current_phase_index
+        week = enrollment.current_week_in_phase
+        if self._durations:
+            phase_idx %= len(self._durations)
+            if self._durations[phase_idx]:
+                week %= self._durations[phase_idx]
+        return (phase_idx, week + 1, enrollment.current_day_index)
+
+    def position(self, enrollment) -> int | None:
+        """Schedule position of the enrollment's current day, if it has one."""
+        if not self.schedule:
+            return None
+        return self._positions.get(self._key(enrollment))
+
+    def next_position(self, enrollment) -> int:
+        """Position of the day after the enrollment's, wrapping to the start."""
+        key = self._key(enrollment)
+        pos = self._positions.get(key)
+        if pos is None:
+            # Progress that matches no workout moves on to the next one that exists
+            return bisect_right(self._keys, key) % len(self.schedule)
+        return (pos + 1) % len(self.schedule)
+
+    def upcoming(self, start: int, count: int) -> list[tuple[int, ScheduleDay]]:
+        """Up to ``count`` days from position ``start`` on, wrapping around."""
+        n = len(self.schedule)
+        positions = [(start + i) % n for i in range(min(count, n))]
+        return [(pos, self.schedule[pos]) for pos in positions]
+
+
+async def load_plan(db: AsyncSession, program_id: str) -> ProgramPlan | None:
+    plan = plan_cache.get(program_id)
+    if plan is not None:
+        return plan
+
+    result = await db.execute(
+        select(Program)
+        .where(Program.id == program_id)
+        .options(
+            selectinload(Program.routines).selectinload(ProgramRoutine.template),
+            selectinload(Program.phases),
+        )
+    )
+    program = result.scalar_one_or_none()
+    if program is None:
+        return None
+    plan = ProgramPlan(
+        program=ProgramResponse.model_validate(program),
+        routines=[ProgramRoutineResponse.model_validate(r) for r in program.routines],
+        phases=[ProgramPhaseResponse.model_validate(p) for p in program.phases],
+        schedule=await _compile_schedule(db, program)
+        if program.program_type == "phased"
+        else [],
+    )
+    if program.user_id is None:
+        plan_cache.set(program_id, plan)
+    return plan
+
+
+async def _compile_schedule(db: AsyncSession, program: Program) -> list[ScheduleDay]:
+    """Order the program's workouts by phase, week and day.
+
+    Weeks past a phase's ``duration_weeks`` are never scheduled.
+    """
+    phases = {phase.id: (idx, phase) for idx, phase in enumerate(program.phases)}
+    if not phases:
+        return []
+    result = await db.execute(
+        select(
+            PhaseWorkout.phase_id,
+            PhaseWorkout.week_number,
+            PhaseWorkout.day_index,
+            PhaseWorkout.id,
+            PhaseWorkout.name,
+        ).where(PhaseWorkout.phase_id.in_(phases))
+    )
+    schedule = []
+    for phase_id, week_number, day_index, workout_id, name in result.tuples():
+        phase_idx, phase = phases[phase_id]
+        if week_number <= phase.duration_weeks:
+            schedule.append(
+                ScheduleDay(phase_idx, week_number, day_index, workout_id, name)
+            )
+    return sorted(schedule)
+
+
+async def routine_exercises(
+    db: AsyncSession, plan: ProgramPlan, idx: int, week_type: str
+) -> list[TemplateExerciseResponse]:
+    """Template exercises of the plan's ``idx``-th routine for ``week_type``."""
+    key = (idx, week_type)
+    if key not in plan.workouts:
+        result = await db.execute(
+            select(TemplateExercise)
+            .where(
+                TemplateExercise.template_id == plan.routines[idx].template_id,
+                TemplateExercise.week_type == week_type,
+            )
+            .order_by(TemplateExercise.order)
+        )
+        plan.workouts[key] = [
+            TemplateExerciseResponse.model_validate(te) for te in result.scalars()
+        ]
+    return plan.workouts[key]
+
+
+async def phase_workout(
+    db: AsyncSession, plan: ProgramPlan, workout_id: str
+) -> PhaseWorkoutResponse:
+    """A scheduled workout with its sections and exercises."""
+    if workout_id not in plan.workouts:
+        exercises = selectinload(PhaseWorkout.sections).selectinload(
+            PhaseWorkoutSection.exercises
+        )
+        result = await db.execute(
+            select(PhaseWorkout)
+            .where(PhaseWorkout.id == workout_id)
+            .options(
+                exercises.selectinload(PhaseWorkoutExercise.exercise),
+                exercises.selectinload(PhaseWorkoutExercise.substitute1),
+                exercises.selectinload(PhaseWorkoutExercise.substitute2),
+            )
+        )
+        plan.workouts[workout_id] = _workout_response(result.scalar_one())
+    return plan.workouts[workout_id]
+
+
+def _workout_response(workout: PhaseWorkout) -> PhaseWorkoutResponse:
+    return PhaseWorkoutResponse(
+        id=workout.id,
+        name=workout.name,
+        day_index=workout.day_index,
+        week_number=workout.week_number,
+        sections=[
+            PhaseWorkoutSectionResponse(
+                id=s.id,
+                name=s.name,
+                order=s.order,
+                notes=s.notes,
+                exercises=[
+                    PhaseWorkoutExerciseResponse.model_validate(ex)
+                    for ex in s.exercises
+                ],
+            )
+            for s in sorted(workout.sections, key=lambda s: s.order)
+        ],
+    )
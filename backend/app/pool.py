@@ -0,0 +1,114 @@
+"""Connection pool sizing and saturation metrics.
+
+:class:`InstrumentedQueuePool` is SQLAlchemy's asyncio queue pool plus a
+:class:`PoolMetrics` that records how long each checkout waited for a free
+connection and how many gave up at ``pool_timeout``. Time spent opening a
+new connection is not waiting and is left out. Together with the pool's own
+live counters (checked out, overflow) this is what ``/health/ready`` and
+``/health/db-pool`` report, so a rush that exhausts the pool shows up as
+growing waits before it turns into timeouts.
+"""
+
+import math
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds of the checkout wait histogram, in seconds
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, math.inf)
+_CONNECT_STARTED_KEY = "pool_connect_started"
+
+
+class PoolMetrics:
+    """Checkout wait histogram and timeout count of one pool."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(WAIT_BUCKETS)
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+
+    def observe(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds += seconds
+        for i, bound in enumerate(WAIT_BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+
+    def stats(self) -> dict[str, Any]:
+        """Cumulative histogram, as Prometheus buckets are."""
+        buckets, running = {}, 0
+        for bound, count in zip(WAIT_BUCKETS, self.counts):
+            running += count
+            buckets["+Inf" if bound == math.inf else str(bound)] = running
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds, 6),
+            "wait_seconds_buckets": buckets,
+        }
+
+
+def _record_connect_start(dbapi_connection: Any, record: Any) -> None:
+    # The record's starttime is set just before the driver is called
+    record.info[_CONNECT_STARTED_KEY] = record.starttime
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Asyncio queue pool that times checkouts.
+
+    Pass ``metrics`` through ``create_async_engine`` like any pool argument.
+    """
+
+    def __init__(
+        self, creator: Any, metrics: PoolMetrics | None = None, **kw: Any
+    ) -> None:
+        super().__init__(creator, **kw)
+        self.metrics = metrics or PoolMetrics()
+        # As configured; -1 lets the pool overflow without limit
+        self.max_overflow: int = kw.get("max_overflow", 10)
+        # A recreated pool inherits its predecessor's listeners
+        if not event.contains(self, "connect", _record_connect_start):
+            event.listen(self, "connect", _record_connect_start)
+
+    def connect(self) -> Any:
+        # Wall clock, as the connection record's starttime
+        started = time.time()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        # A new connection ends the wait when the pool starts opening it
+        ended = connection.info.pop(_CONNECT_STARTED_KEY, None) or time.time()
+        self.metrics.observe(max(ended - started, 0.0))
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        # Disposing the engine recreates the pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def pool_stats(pool: Pool) -> dict[str, Any]:
+    """Live counters and, for instrumented pools, saturation and checkout metrics."""
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+    stats: dict[str, Any] = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+    if isinstance(pool, InstrumentedQueuePool):
+        stats["max_overflow"] = pool.max_overflow
+        # An unlimited overflow never runs out of connections
+        stats["saturated"] = pool.max_overflow >= 0 and (
+            stats["checked_out"] >= stats["size"] + pool.max_overflow
+        )
+        stats.update(pool.metrics.stats())
+    return stats
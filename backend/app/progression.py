@@ -0,0 +1,82 @@
+"""Single-statement updates of program enrollment progress.
+
+Each advance is one ``UPDATE ... RETURNING`` whose new values are computed
+by the database from the row as it is at write time, so two devices
+finishing workouts at once both count instead of one overwriting the
+other. The returned rows carry the program fields ``UserProgramResponse``
+needs, so callers never re-select the enrollment.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.changes import record_changes
+from app.models import Program, ProgramRoutine, UserProgram
+
+
+def _program_column(column: Any, name: str) -> Any:
+    return (
+        select(column)
+        .where(Program.id == UserProgram.program_id)
+        .scalar_subquery()
+        .label(name)
+    )
+
+
+_RETURNING = (
+    *UserProgram.__table__.c,
+    _program_column(Program.name, "program_name"),
+    _program_column(Program.program_type, "program_type"),
+    _program_column(Program.deload_every_n_weeks, "deload_every_n_weeks"),
+)
+
+
+async def update_enrollments(
+    db: AsyncSession,
+    user_id: str,
+    *criteria: ColumnElement[bool],
+    **values: Any,
+) -> list[Row]:
+    """Set ``values`` on the user's enrollments matching ``criteria``.
+
+    Returns the updated rows; an empty list means nothing matched.
+    """
+    result = await db.execute(
+        update(UserProgram)
+        .where(UserProgram.user_id == user_id, *criteria)
+        .values(**values)
+        .returning(*_RETURNING)
+    )
+    rows = list(result.all())
+    await record_changes(db, user_id, {UserProgram: [row.id for row in rows]})
+    return rows
+
+
+async def advance_rotation(
+    db: AsyncSession, user_id: str, *criteria: ColumnElement[bool]
+) -> list[Row]:
+    """Move matching enrollments to their program's next routine.
+
+    Wrapping past the last routine completes a week. Enrollments whose
+    program has no routines are left alone.
+    """
+    routine_count = (
+        select(func.count(ProgramRoutine.id))
+        .where(ProgramRoutine.program_id == UserProgram.program_id)
+        .scalar_subquery()
+    )
+    wraps = UserProgram.current_routine_index + 1 >= routine_count
+    return await update_enrollments(
+        db,
+        user_id,
+        routine_count > 0,
+        *criteria,
+        current_routine_index=case(
+            (wraps, 0), else_=UserProgram.current_routine_index + 1
+        ),
+        weeks_completed=UserProgram.weeks_completed + case((wraps, 1), else_=0),
+        last_workout_at=datetime.utcnow(),
+    )
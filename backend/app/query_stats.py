@@ -0,0 +1,158 @@
+"""Per-request SQL statement counts, timings and N+1 detection.
+
+Listeners on every :class:`~sqlalchemy.engine.Engine` add each statement a
+request executes, and the time the database took for it, to that request's
+:class:`QueryStats`. :class:`QueryStatsMiddleware` opens the collection for
+each HTTP request, sends the totals in a ``Server-Timing`` header and logs
+one JSON line per request to the ``app.queries`` logger.
+
+The line is a warning when the request ran more than ``budget`` statements,
+or ran one statement shape ``repeat_threshold`` times or more. Shapes are
+statements with their placeholder lists collapsed, so a loop issuing the
+same SELECT per row is caught whatever its bound values and ``IN`` sizes.
+Statements that a streamed body runs after the headers are sent are only
+in the log.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.serialization import dumps
+
+logger = logging.getLogger("app.queries")
+
+_PLACEHOLDER = r"\s*(?:\?|\$\d+|%\(\w+\)s|:\w+)\s*"
+_PLACEHOLDER_LIST = re.compile(rf"\((?:{_PLACEHOLDER},)*{_PLACEHOLDER}\)")
+_VALUES_ROWS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_STARTED_KEY = "query_stats_started"
+
+
+def statement_shape(statement: str) -> str:
+    """``statement`` with whitespace and placeholder lists normalised."""
+    shape = _PLACEHOLDER_LIST.sub("(...)", " ".join(statement.split()))
+    return _VALUES_ROWS.sub("(...)", shape)
+
+
+class QueryStats:
+    """Statements executed within one collection, with their DB time."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Shapes executed at least ``threshold`` times, most frequent first."""
+        return [(s, n) for s, n in self.shapes.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.count} queries"'
+
+    def report(self) -> str:
+        """Human-readable breakdown, for test failures."""
+        lines = [f"{self.count} statements in {self.seconds * 1000:.1f} ms"]
+        lines += [f"  {n} x {shape}" for shape, n in self.shapes.most_common()]
+        return "\n".join(lines)
+
+
+# Every collection open in this context; they nest
+_active: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+
+
+@contextmanager
+def collect_queries() -> Iterator[QueryStats]:
+    """Count the statements run in this context, on any engine.
+
+    Collections nest: an outer one also counts what inner ones see.
+    """
+    stats = QueryStats()
+    token = _active.set((*_active.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    if _active.get():
+        conn.info[_STARTED_KEY] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop(_STARTED_KEY, None)
+    if started is not None:
+        seconds = time.perf_counter() - started
+        for stats in _active.get():
+            stats.record(statement, seconds)
+
+
+class QueryStatsMiddleware:
+    """Report each HTTP request's statements in headers and logs."""
+
+    def __init__(self, app: ASGIApp, *, budget: int, repeat_threshold: int) -> None:
+        self.app = app
+        self.budget = budget
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status: int | None = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", stats.server_timing()
+                )
+            await send(message)
+
+        started = time.perf_counter()
+        with collect_queries() as stats:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, status, stats, time.perf_counter() - started)
+
+    def _log(
+        self, scope: Scope, status: int | None, stats: QueryStats, seconds: float
+    ) -> None:
+        route = scope.get("route")
+        record: dict[str, Any] = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": getattr(route, "path", None),
+            "status": status,
+            "queries": stats.count,
+            "db_ms": round(stats.seconds * 1000, 2),
+            "total_ms": round(seconds * 1000, 2),
+        }
+        repeated = stats.repeated(self.repeat_threshold)
+        if repeated:
+            record["repeated"] = [
+                {"statement": shape[:200], "count": n} for shape, n in repeated
+            ]
+        level = (
+            logging.WARNING if repeated or stats.count > self.budget else logging.INFO
+        )
+        logger.log(level, dumps(record).decode())
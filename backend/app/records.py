@@ -0,0 +1,236 @@
+"""Incrementally maintained personal records.
+
+Every set write offers the written sets as candidates against the stored
+records for their exercises, which costs one lookup and at most one upsert.
+History is only rescanned for the records a changed or deleted set used to
+hold, because only then can the best set be something other than the
+incumbent or a candidate.
+"""
+
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from datetime import datetime
+from decimal import Decimal
+from typing import NamedTuple
+
+from sqlalchemy import ColumnElement, delete, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.bulk import bulk_upsert
+from app.models import PersonalRecord, WorkoutSession, WorkoutSet
+
+REP_MAX_RANGE = range(1, 13)
+RECORD_TYPES: tuple[str, ...] = ("max_weight", "max_reps", "e1rm") + tuple(
+    f"rm_{n}" for n in REP_MAX_RANGE
+)
+
+# (exercise_id, record_type)
+RecordKey = tuple[str, str]
+
+_CHUNK = 5000
+
+
+class _Set(NamedTuple):
+    id: str
+    exercise_id: str
+    weight: Decimal
+    reps: int
+    achieved_at: datetime
+
+    @property
+    def e1rm(self) -> Decimal:
+        return estimate_1rm(self.weight, self.reps)
+
+
+def estimate_1rm(weight: Decimal, reps: int) -> Decimal:
+    """Epley estimate, the same formula the client uses for offline records."""
+    if reps <= 1:
+        return Decimal(weight)
+    return (Decimal(weight) * (30 + reps) / 30).quantize(Decimal("0.01"))
+
+
+def _rank(record_type: str, s: _Set) -> tuple | None:
+    """Sort key of ``s`` under ``record_type``; None if it does not qualify."""
+    if s.reps <= 0:
+        return None
+    if record_type == "max_weight":
+        return (s.weight, s.reps)
+    if record_type == "max_reps":
+        return (s.reps, s.weight)
+    if record_type == "e1rm":
+        return (s.e1rm,) if s.weight > 0 else None
+    return (s.weight,) if s.reps == int(record_type[3:]) else None
+
+
+def _offer(best: dict[RecordKey, _Set], s: _Set) -> set[RecordKey]:
+    """Let ``s`` take every record it strictly beats; ties keep the holder."""
+    taken = set()
+    for record_type in RECORD_TYPES:
+        rank = _rank(record_type, s)
+        if rank is None:
+            continue
+        key = (s.exercise_id, record_type)
+        holder = best.get(key)
+        if holder is None or rank > _rank(record_type, holder):
+            best[key] = s
+            taken.add(key)
+    return taken
+
+
+def _working_sets(user_id: str | None, *criteria: ColumnElement[bool]):
+    query = (
+        select(
+            WorkoutSet.id,
+            WorkoutSet.exercise_id,
+            WorkoutSet.weight,
+            WorkoutSet.reps,
+            WorkoutSession.started_at,
+        )
+        .join(WorkoutSession, WorkoutSet.session_id == WorkoutSession.id)
+        .where(WorkoutSet.set_type == "working", *criteria)
+    )
+    if user_id is not None:
+        query = query.where(WorkoutSession.user_id == user_id)
+    return query
+
+
+def _record_row(user_id: str, record_type: str, s: _Set) -> dict:
+    return dict(
+        user_id=user_id,
+        exercise_id=s.exercise_id,
+        record_type=record_type,
+        set_id=s.id,
+        weight=s.weight,
+        reps=s.reps,
+        e1rm=s.e1rm,
+        achieved_at=s.achieved_at,
+    )
+
+
+async def held_records(
+    db: AsyncSession, user_id: str, set_ids: Iterable[str]
+) -> set[RecordKey]:
+    """Records currently held by any of ``set_ids``."""
+    set_ids = list(set_ids)
+    if not set_ids:
+        return set()
+    result = await db.execute(
+        select(PersonalRecord.exercise_id, PersonalRecord.record_type).where(
+            PersonalRecord.user_id == user_id, PersonalRecord.set_id.in_(set_ids)
+        )
+    )
+    return {(row.exercise_id, row.record_type) for row in result.all()}
+
+
+async def update_records(
+    db: AsyncSession,
+    user_id: str,
+    set_ids: Iterable[str],
+    held: Iterable[RecordKey] = (),
+) -> None:
+    """Fold freshly written sets into the user's records.
+
+    ``held`` are the records those sets held before the write (from
+    :func:`held_records`); they are recomputed from history because the
+    write may have weakened or removed the holder.
+    """
+    set_ids = list(set_ids)
+    held = set(held)
+    candidates = []
+    if set_ids:
+        result = await db.execute(_working_sets(user_id, WorkoutSet.id.in_(set_ids)))
+        candidates = [_Set(*row) for row in result.all()]
+    exercise_ids = {s.exercise_id for s in candidates} | {ex for ex, _ in held}
+    if not exercise_ids:
+        return
+
+    result = await db.execute(
+        select(PersonalRecord).where(
+            PersonalRecord.user_id == user_id,
+            PersonalRecord.exercise_id.in_(exercise_ids),
+        )
+    )
+    best = {
+        (r.exercise_id, r.record_type): _Set(
+            r.set_id, r.exercise_id, r.weight, r.reps, r.achieved_at
+        )
+        for r in result.scalars().all()
+        if (r.exercise_id, r.record_type) not in held
+    }
+    changed: set[RecordKey] = set()
+
+    if held:
+        rescan: dict[RecordKey, _Set] = {}
+        result = await db.execute(
+            _working_sets(
+                user_id, WorkoutSet.exercise_id.in_({ex for ex, _ in held})
+            ).order_by(WorkoutSession.started_at, WorkoutSet.created_at)
+        )
+        for row in result.all():
+            _offer(rescan, _Set(*row))
+        for key in held:
+            if key in rescan:
+                best[key] = rescan[key]
+        changed |= held
+
+    for s in candidates:
+        changed |= _offer(best, s)
+
+    await bulk_upsert(
+        db,
+        PersonalRecord,
+        [_record_row(user_id, key[1], best[key]) for key in changed if key in best],
+        index_elements=["user_id", "exercise_id", "record_type"],
+        update_columns=("set_id", "weight", "reps", "e1rm", "achieved_at"),
+    )
+    vacated = [key for key in changed if key not in best]
+    if vacated:
+        await db.execute(
+            delete(PersonalRecord).where(
+                PersonalRecord.user_id == user_id,
+                tuple_(PersonalRecord.exercise_id, PersonalRecord.record_type).in_(
+                    vacated
+                ),
+            )
+        )
+
+
+@asynccontextmanager
+async def tracking_records(
+    db: AsyncSession, user_id: str, set_ids: Iterable[str]
+) -> AsyncIterator[None]:
+    """Keep records in step with ORM changes made to ``set_ids``."""
+    set_ids = list(set_ids)
+    held = await held_records(db, user_id, set_ids)
+    yield
+    await db.flush()
+    await update_records(db, user_id, set_ids, held)
+
+
+async def rebuild_personal_records(db: AsyncSession, user_id: str | None = None) -> int:
+    """Recompute records from raw sets for one user, or everyone.
+
+    Returns the number of record rows written. The caller commits.
+    """
+    clear = delete(PersonalRecord)
+    if user_id is not None:
+        clear = clear.where(PersonalRecord.user_id == user_id)
+    await db.execute(clear)
+
+    best: dict[str, dict[RecordKey, _Set]] = {}
+    result = await db.stream(
+        _working_sets(user_id)
+        .add_columns(WorkoutSession.user_id)
+        .order_by(WorkoutSession.started_at, WorkoutSet.created_at)
+    )
+    async for row in result:
+        _offer(best.setdefault(row.user_id, {}), _Set(*row[:5]))
+
+    rows = [
+        _record_row(uid, record_type, s)
+        for uid, records in best.items()
+        for (_, record_type), s in records.items()
+    ]
+    for i in range(0, len(rows), _CHUNK):
+        await db.execute(insert(PersonalRecord), rows[i : i + _CHUNK])
+    return len(rows)
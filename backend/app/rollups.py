@@ -0,0 +1,221 @@
+"""Incrementally maintained weekly volume rollup.
+
+Write paths snapshot the volume of the sets they are about to touch with
+:func:`volume_totals`, make their change, snapshot the same sets again and
+hand both to :func:`apply_volume_change`, which folds the difference into
+``weekly_volume`` with one upsert. Backfills use :func:`rebuild_weekly_volume`;
+the command below rebuilds it together with exercise progress, the personal
+records store and the per-session summaries::
+
+    python -m app.rollups [--user-id ID]
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from decimal import Decimal
+
+from sqlalchemy import ColumnElement, delete, func, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.bulk import bulk_upsert
+from app.changes import record_changes
+from app.database import async_session
+from app.models import (
+    Exercise,
+    ExerciseProgress,
+    WeeklyVolume,
+    WorkoutSession,
+    WorkoutSet,
+)
+from app.records import rebuild_personal_records
+from app.summaries import rebuild_session_summaries
+
+# (user_id, year_week, muscle_group) -> (total volume, working set count)
+VolumeTotals = dict[tuple[str, str, str], tuple[Decimal, int]]
+
+_CHUNK = 5000
+
+
+async def volume_totals(
+    db: AsyncSession, *criteria: ColumnElement[bool]
+) -> VolumeTotals:
+    """Sum working-set volume per user, week and muscle group for matching sets."""
+    result = await db.execute(
+        select(
+            WorkoutSession.user_id,
+            WorkoutSession.year_week,
+            Exercise.muscle_group,
+            func.sum(WorkoutSet.reps * WorkoutSet.weight),
+            func.count(),
+        )
+        .join(WorkoutSession, WorkoutSet.session_id == WorkoutSession.id)
+        .join(Exercise, WorkoutSet.exercise_id == Exercise.id)
+        .where(
+            WorkoutSet.set_type == "working",
+            WorkoutSession.year_week.isnot(None),
+            *criteria,
+        )
+        .group_by(
+            WorkoutSession.user_id, WorkoutSession.year_week, Exercise.muscle_group
+        )
+    )
+    return {
+        (user_id, year_week, muscle_group): (Decimal(str(total)), count)
+        for user_id, year_week, muscle_group, total, count in result.all()
+    }
+
+
+async def apply_volume_change(
+    db: AsyncSession, before: VolumeTotals, after: VolumeTotals
+) -> None:
+    """Add ``after - before`` to the rollup, dropping groups left with no sets."""
+    rows = []
+    for key in before.keys() | after.keys():
+        old_total, old_count = before.get(key, (Decimal(0), 0))
+        new_total, new_count = after.get(key, (Decimal(0), 0))
+        if new_total == old_total and new_count == old_count:
+            continue
+        user_id, year_week, muscle_group = key
+        rows.append(
+            dict(
+                user_id=user_id,
+                year_week=year_week,
+                muscle_group=muscle_group,
+                total_volume=new_total - old_total,
+                set_count=new_count - old_count,
+            )
+        )
+    await bulk_upsert(
+        db,
+        WeeklyVolume,
+        rows,
+        index_elements=["user_id", "year_week", "muscle_group"],
+        update_columns=(),
+        increment_columns=("total_volume", "set_count"),
+    )
+    emptied = [key for key in before if key not in after]
+    if emptied:
+        await db.execute(
+            delete(WeeklyVolume).where(
+                tuple_(
+                    WeeklyVolume.user_id,
+                    WeeklyVolume.year_week,
+                    WeeklyVolume.muscle_group,
+                ).in_(emptied),
+                WeeklyVolume.set_count <= 0,
+            )
+        )
+
+
+@asynccontextmanager
+async def tracking_volume(
+    db: AsyncSession, *criteria: ColumnElement[bool]
+) -> AsyncIterator[None]:
+    """Keep the rollup in step with ORM changes made to the matching sets."""
+    before = await volume_totals(db, *criteria)
+    yield
+    await db.flush()
+    await apply_volume_change(db, before, await volume_totals(db, *criteria))
+
+
+async def rebuild_weekly_volume(db: AsyncSession, user_id: str | None = None) -> int:
+    """Recompute the rollup from raw sets for one user, or everyone.
+
+    Returns the number of rollup rows written. The caller commits.
+    """
+    clear = delete(WeeklyVolume)
+    criteria = []
+    if user_id is not None:
+        clear = clear.where(WeeklyVolume.user_id == user_id)
+        criteria.append(WorkoutSession.user_id == user_id)
+    await db.execute(clear)
+
+    rows = [
+        dict(
+            user_id=uid,
+            year_week=year_week,
+            muscle_group=muscle_group,
+            total_volume=total,
+            set_count=count,
+        )
+        for (uid, year_week, muscle_group), (total, count) in (
+            await volume_totals(db, *criteria)
+        ).items()
+    ]
+    for i in range(0, len(rows), _CHUNK):
+        await db.execute(insert(WeeklyVolume), rows[i : i + _CHUNK])
+    return len(rows)
+
+
+async def rebuild_exercise_progress(
+    db: AsyncSession, user_id: str | None = None
+) -> int:
+    """Fold every week's best working weight into ``exercise_progress``.
+
+    Like the write paths, this only ever raises ``max_weight``. Written rows
+    are stamped onto the change feed. Returns the number of rows written; the
+    caller commits.
+    """
+    criteria = [] if user_id is None else [WorkoutSession.user_id == user_id]
+    result = await db.execute(
+        select(
+            WorkoutSession.user_id,
+            WorkoutSet.exercise_id,
+            WorkoutSession.year_week,
+            func.max(WorkoutSet.weight),
+        )
+        .join(WorkoutSession, WorkoutSet.session_id == WorkoutSession.id)
+        .where(
+            WorkoutSet.set_type == "working",
+            WorkoutSession.year_week.isnot(None),
+            *criteria,
+        )
+        .group_by(
+            WorkoutSession.user_id, WorkoutSet.exercise_id, WorkoutSession.year_week
+        )
+    )
+    by_user: dict[str, list[dict]] = {}
+    for uid, exercise_id, year_week, max_weight in result.all():
+        by_user.setdefault(uid, []).append(
+            dict(
+                user_id=uid,
+                exercise_id=exercise_id,
+                year_week=year_week,
+                max_weight=max_weight,
+            )
+        )
+    written = 0
+    for uid, rows in by_user.items():
+        for i in range(0, len(rows), _CHUNK):
+            ids = await bulk_upsert(
+                db,
+                ExerciseProgress,
+                rows[i : i + _CHUNK],
+                index_elements=["user_id", "exercise_id", "year_week"],
+                update_columns=(),
+                greatest_columns=("max_weight",),
+            )
+            await record_changes(db, uid, {ExerciseProgress: ids})
+            written += len(ids)
+    return written
+
+
+async def _main(user_id: str | None) -> None:
+    async with async_session() as db:
+        volume = await rebuild_weekly_volume(db, user_id)
+        progress = await rebuild_exercise_progress(db, user_id)
+        records = await rebuild_personal_records(db, user_id)
+        sessions = await rebuild_session_summaries(db, user_id)
+        await db.commit()
+    print(
+        f"Rebuilt weekly_volume: {volume} rows, exercise_progress: {progress} rows, "
+        f"personal_records: {records} rows, session summaries: {sessions} sessions"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the stats rollups")
+    parser.add_argument("--user-id", help="Only rebuild this user's rows")
+    asyncio.run(_main(parser.parse_args().user_id))
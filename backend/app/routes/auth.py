@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_current_user, get_db
+from app.dependencies import get_current_user, get_db, identity_cache
 from app.models import User
 from app.schemas import (
     MessageResponse,
@@ -54,6 +54,7 @@ async def update_me(
         current_user.preferred_unit = body.preferred_unit
     await db.commit()
     await db.refresh(current_user)
+    identity_cache.invalidate(current_user.email)
     return UserResponse.model_validate(current_user)
 
 
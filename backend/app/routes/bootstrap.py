@@ -0,0 +1,115 @@
+"""Single-request snapshot of everything a client needs to hydrate offline."""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.dependencies import get_current_user, get_read_db
+from app.models import (
+    Exercise,
+    ExerciseSubstitution,
+    PhaseWorkout,
+    PhaseWorkoutExercise,
+    PhaseWorkoutSection,
+    Program,
+    ProgramPhase,
+    ProgramRoutine,
+    User,
+    UserProgram,
+    WorkoutSession,
+    WorkoutTemplate,
+)
+from app.schemas import BootstrapResponse
+
+router = APIRouter(prefix="/api/bootstrap", tags=["bootstrap"])
+
+
+@router.get("", response_model=BootstrapResponse)
+async def get_bootstrap(
+    session_limit: int = Query(
+        100, ge=0, le=1000, description="Number of most recent sessions to include"
+    ),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> BootstrapResponse:
+    """Return the user-visible catalog, enrollments and recent sessions.
+
+    Every collection is loaded with ``selectinload``, so the number of queries
+    is fixed no matter how many templates, programs or phases exist.
+    """
+    exercises = await db.execute(
+        select(Exercise)
+        .where(or_(Exercise.user_id.is_(None), Exercise.user_id == current_user.id))
+        .options(
+            selectinload(Exercise.substitutions).selectinload(
+                ExerciseSubstitution.substitute_exercise
+            )
+        )
+        .order_by(Exercise.name)
+    )
+
+    templates = await db.execute(
+        select(WorkoutTemplate)
+        .where(
+            (WorkoutTemplate.user_id.is_(None))
+            | (WorkoutTemplate.user_id == current_user.id)
+        )
+        .options(selectinload(WorkoutTemplate.template_exercises))
+        .order_by(WorkoutTemplate.created_at.desc())
+    )
+
+    programs = await db.execute(
+        select(Program)
+        .where((Program.user_id.is_(None)) | (Program.user_id == current_user.id))
+        .options(selectinload(Program.routines).selectinload(ProgramRoutine.template))
+        .order_by(Program.created_at.desc())
+    )
+    programs = list(programs.scalars().all())
+
+    phased_ids = [p.id for p in programs if p.program_type == "phased"]
+    phases = []
+    if phased_ids:
+        phase_exercises = (
+            selectinload(ProgramPhase.workouts)
+            .selectinload(PhaseWorkout.sections)
+            .selectinload(PhaseWorkoutSection.exercises)
+        )
+        phases_result = await db.execute(
+            select(ProgramPhase)
+            .where(ProgramPhase.program_id.in_(phased_ids))
+            .options(
+                phase_exercises.selectinload(PhaseWorkoutExercise.exercise),
+                phase_exercises.selectinload(PhaseWorkoutExercise.substitute1),
+                phase_exercises.selectinload(PhaseWorkoutExercise.substitute2),
+            )
+            .order_by(ProgramPhase.program_id, ProgramPhase.order)
+        )
+        phases = list(phases_result.scalars().all())
+
+    enrollments = await db.execute(
+        select(UserProgram)
+        .where(UserProgram.user_id == current_user.id)
+        .options(selectinload(UserProgram.program))
+        .order_by(UserProgram.created_at.desc())
+    )
+
+    sessions = await db.execute(
+        select(WorkoutSession)
+        .where(WorkoutSession.user_id == current_user.id)
+        .options(selectinload(WorkoutSession.sets))
+        .order_by(WorkoutSession.started_at.desc())
+        .limit(session_limit)
+    )
+
+    return BootstrapResponse.model_validate(
+        dict(
+            exercises=list(exercises.scalars().all()),
+            templates=list(templates.scalars().all()),
+            programs=programs,
+            phases=phases,
+            enrollments=list(enrollments.scalars().all()),
+            sessions=list(sessions.scalars().all()),
+        ),
+        from_attributes=True,
+    )
@@ -3,42 +3,67 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
-from app.dependencies import get_current_user, get_db
-from app.models import Exercise, ExerciseSubstitution, User
+from app.dependencies import (
+    catalog_cache_headers,
+    get_current_user,
+    get_db,
+    get_read_db,
+)
+from app.models import Exercise, ExerciseSubstitution, User, WorkoutSet
+from app.rollups import tracking_volume
 from app.schemas import (
     ExerciseCreate,
     ExerciseResponse,
     SubstitutionCreate,
     SubstitutionResponse,
 )
+from app.serialization import ORJSONResponse, schema_columns, shape
 
 router = APIRouter(prefix="/api/exercises", tags=["exercises"])
 
 
 @router.get("", response_model=list[ExerciseResponse])
 async def list_exercises(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
-) -> list[Exercise]:
+    cache_headers: dict[str, str] = Depends(catalog_cache_headers),
+) -> ORJSONResponse:
     """List all pre-seeded exercises and the current user's custom exercises."""
+    visible = or_(Exercise.user_id.is_(None), Exercise.user_id == current_user.id)
     result = await db.execute(
-        select(Exercise)
-        .where(
-            or_(
-                Exercise.user_id.is_(None),
-                Exercise.user_id == current_user.id,
-            )
+        select(*schema_columns(ExerciseResponse, Exercise))
+        .where(visible)
+        .order_by(Exercise.name)
+    )
+    exercises = result.mappings().all()
+
+    substitute = aliased(Exercise)
+    result = await db.execute(
+        select(
+            ExerciseSubstitution.exercise_id,
+            *schema_columns(SubstitutionResponse, ExerciseSubstitution),
+            substitute.name.label("substitute_exercise_name"),
         )
-        .options(
-            selectinload(Exercise.substitutions).selectinload(
-                ExerciseSubstitution.substitute_exercise
-            )
+        .outerjoin(
+            substitute, substitute.id == ExerciseSubstitution.substitute_exercise_id
         )
-        .order_by(Exercise.name)
+        .where(ExerciseSubstitution.exercise_id.in_(select(Exercise.id).where(visible)))
+        .order_by(ExerciseSubstitution.priority, ExerciseSubstitution.id)
+    )
+    substitutions: dict[str, list[dict]] = {}
+    for row in result.mappings():
+        substitutions.setdefault(row["exercise_id"], []).append(
+            shape(SubstitutionResponse, row)
+        )
+    return ORJSONResponse(
+        [
+            shape(ExerciseResponse, ex, substitutions=substitutions.get(ex["id"], []))
+            for ex in exercises
+        ],
+        headers=cache_headers,
     )
-    return list(result.scalars().all())
 
 
 @router.post("", response_model=ExerciseResponse, status_code=status.HTTP_201_CREATED)
@@ -67,7 +92,7 @@ async def create_exercise(
 @router.get("/{exercise_id}", response_model=ExerciseResponse)
 async def get_exercise(
     exercise_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> Exercise:
     """Get exercise detail with substitutions."""
@@ -123,7 +148,10 @@ async def update_exercise(
         )
 
     exercise.name = body.name
-    exercise.muscle_group = body.muscle_group
+    if body.muscle_group != exercise.muscle_group:
+        # Moves every logged set of this exercise to another volume bucket
+        async with tracking_volume(db, WorkoutSet.exercise_id == exercise.id):
+            exercise.muscle_group = body.muscle_group
     exercise.equipment = body.equipment
     exercise.youtube_url = body.youtube_url
     exercise.notes = body.notes
@@ -0,0 +1,83 @@
+"""Full-account export route."""
+
+from collections.abc import AsyncIterator
+from datetime import date
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies import get_current_user, get_read_db
+from app.export import (
+    EXPORT_TABLES,
+    csv_stream,
+    ndjson_stream,
+    parquet_available,
+    parquet_stream,
+)
+from app.models import User
+
+router = APIRouter(prefix="/api/export", tags=["export"])
+
+ExportTable = Literal[tuple(EXPORT_TABLES)]  # type: ignore[valid-type]
+
+_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+async def _closing(
+    db: AsyncSession, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    # The session's dependency has closed it by the time the body streams;
+    # the export's queries check out a new connection, returned here
+    try:
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await db.close()
+
+
+@router.get("", response_class=StreamingResponse)
+async def export_account(
+    format: Literal["ndjson", "csv", "parquet"] = "ndjson",
+    table: Optional[ExportTable] = Query(
+        None,
+        description="Table for CSV and Parquet, which hold one each (default sets)",
+    ),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream the user's sessions, sets, progress and custom catalog rows.
+
+    NDJSON holds every table, each row tagged with its ``table``. Rows are
+    read with a server-side cursor, so memory use stays flat however large
+    the account is.
+    """
+    if format == "ndjson":
+        if table is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="NDJSON exports every table; table applies to CSV and Parquet",
+            )
+        chunks = ndjson_stream(db, current_user.id)
+        name = "export"
+    else:
+        if format == "parquet" and not parquet_available():
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Parquet export is not available on this server",
+            )
+        table = table or "sets"
+        stream = csv_stream if format == "csv" else parquet_stream
+        chunks = stream(db, current_user.id, table)
+        name = f"export-{table}"
+    filename = f"gym-tracker-{name}-{date.today().isoformat()}.{format}"
+    return StreamingResponse(
+        _closing(db, chunks),
+        media_type=_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
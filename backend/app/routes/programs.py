@@ -1,39 +1,64 @@
 """Program CRUD routes with UserProgram enrollment and progress tracking."""
 
+from collections.abc import Iterable
 from datetime import datetime
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, update
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Row, RowMapping, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
-from app.dependencies import get_current_user, get_db
+from sqlalchemy.orm import aliased, selectinload
+
+from app.changes import record_changes
+from app.dependencies import (
+    catalog_cache_headers,
+    get_current_user,
+    get_db,
+    get_read_db,
+)
 from app.models import (
+    Exercise,
     PhaseWorkout,
     PhaseWorkoutExercise,
     PhaseWorkoutSection,
     Program,
     ProgramPhase,
     ProgramRoutine,
-    TemplateExercise,
     User,
     UserProgram,
 )
+from app.performance import last_performance
+from app.plans import (
+    ProgramPlan,
+    load_plan,
+    phase_workout,
+    routine_exercises,
+)
+from app.progression import advance_rotation, update_enrollments
 from app.schemas import (
     MessageResponse,
     PhasedTodayResponse,
+    PhaseWorkoutExerciseResponse,
+    PhaseWorkoutResponse,
+    PhaseWorkoutSectionResponse,
     ProgramCreate,
     ProgramDetailResponse,
     ProgramPhaseDetailResponse,
+    ProgramPhaseResponse,
     ProgramResponse,
-    ProgramRoutineResponse,
-    TemplateExerciseResponse,
+    ScheduleDayResponse,
+    ScheduleSkipRequest,
     TodayResponse,
     UserProgramResponse,
+    days_per_week,
 )
+from app.serialization import ORJSONResponse, schema_columns, shape
 
 router = APIRouter(prefix="/api/programs", tags=["programs"])
 
+# Optimistic retries of a phased advance that raced another one
+_ADVANCE_ATTEMPTS = 3
+
 
 # ---------------------------------------------------------------------------
 # UserProgram endpoints
@@ -42,7 +67,7 @@ router = APIRouter(prefix="/api/programs", tags=["programs"])
 
 @router.get("/enrollments", response_model=list[UserProgramResponse])
 async def list_enrollments(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> list[UserProgram]:
     """List the current user's program enrollments with progress."""
@@ -62,10 +87,13 @@ async def list_enrollments(
 
 @router.get("", response_model=list[ProgramResponse])
 async def list_programs(
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
+    cache_headers: dict[str, str] = Depends(catalog_cache_headers),
 ) -> list[Program]:
     """List shared programs and user's custom programs."""
+    response.headers.update(cache_headers)
     result = await db.execute(
         select(Program)
         .where((Program.user_id.is_(None)) | (Program.user_id == current_user.id))
@@ -125,37 +153,66 @@ async def create_program(
 
 @router.get("/today", response_model=None)
 async def get_today(
-    db: AsyncSession = Depends(get_db),
+    include: Optional[Literal["last_performance"]] = Query(
+        None, description="Also return what was lifted last time on each exercise"
+    ),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> TodayResponse | PhasedTodayResponse:
     """Get today's workout data from the active user program."""
     result = await db.execute(
-        select(UserProgram)
-        .where(
+        select(UserProgram.__table__).where(
             UserProgram.user_id == current_user.id,
             UserProgram.is_active == True,  # noqa: E712
         )
-        .options(
-            selectinload(UserProgram.program)
-            .selectinload(Program.routines)
-            .selectinload(ProgramRoutine.template),
-            selectinload(UserProgram.program).selectinload(Program.phases),
-        )
     )
-    user_program = result.scalar_one_or_none()
-    if not user_program:
+    enrollment = result.mappings().one_or_none()
+    plan = enrollment and await load_plan(db, enrollment["program_id"])
+    if not plan:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No active program found",
         )
 
-    program = user_program.program
+    program = plan.program
+    user_program = UserProgramResponse(
+        **enrollment,
+        program_name=program.name,
+        program_type=program.program_type,
+        deload_every_n_weeks=program.deload_every_n_weeks,
+    )
 
     if program.program_type == "phased":
-        return await _get_phased_today(db, program, user_program)
+        today = await _get_phased_today(db, plan, user_program)
+        exercise_ids = [
+            exercise_id
+            for section in today.workout.sections
+            for ex in section.exercises
+            for exercise_id in (
+                ex.exercise_id,
+                ex.substitute1_exercise_id,
+                ex.substitute2_exercise_id,
+            )
+            if exercise_id
+        ]
+    else:
+        today = await _get_rotating_today(db, plan, user_program)
+        exercise_ids = [te.exercise_id for te in today.template_exercises]
+
+    if include == "last_performance":
+        today.last_performance = await last_performance(
+            db, current_user.id, exercise_ids
+        )
+    return today
+
 
-    # --- Rotating program logic ---
-    if not program.routines:
+async def _get_rotating_today(
+    db: AsyncSession, plan: ProgramPlan, user_program: UserProgramResponse
+) -> TodayResponse:
+    """Build the rotating today response."""
+    program = plan.program
+
+    if not plan.routines:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Active program has no routines",
@@ -168,32 +225,19 @@ async def get_today(
     week_type = "deload" if is_deload else "normal"
 
     # Current routine
-    idx = user_program.current_routine_index % len(program.routines)
-    current_routine = program.routines[idx]
-
-    # Load template exercises for the week_type
-    te_result = await db.execute(
-        select(TemplateExercise)
-        .where(
-            TemplateExercise.template_id == current_routine.template_id,
-            TemplateExercise.week_type == week_type,
-        )
-        .order_by(TemplateExercise.order)
-    )
-    template_exercises = list(te_result.scalars().all())
+    idx = user_program.current_routine_index % len(plan.routines)
+    current_routine = plan.routines[idx]
 
     # Next routine name
-    next_idx = (idx + 1) % len(program.routines)
-    next_routine_name = program.routines[next_idx].template.name
+    next_idx = (idx + 1) % len(plan.routines)
+    next_routine_name = plan.routines[next_idx].template_name
 
     return TodayResponse(
-        program=ProgramResponse.model_validate(program),
-        user_program=UserProgramResponse.model_validate(user_program),
-        current_routine=ProgramRoutineResponse.model_validate(current_routine),
-        template_name=current_routine.template.name,
-        template_exercises=[
-            TemplateExerciseResponse.model_validate(te) for te in template_exercises
-        ],
+        program=program,
+        user_program=user_program,
+        current_routine=current_routine,
+        template_name=current_routine.template_name,
+        template_exercises=await routine_exercises(db, plan, idx, week_type),
         week_type=week_type,
         week_number=user_program.weeks_completed + 1,
         is_deload=is_deload,
@@ -202,132 +246,156 @@ async def get_today(
 
 
 async def _get_phased_today(
-    db: AsyncSession, program: Program, user_program: UserProgram
+    db: AsyncSession, plan: ProgramPlan, user_program: UserProgramResponse
 ) -> PhasedTodayResponse:
     """Build the phased today response."""
-    if not program.phases:
+    if not plan.phases:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Phased program has no phases",
         )
 
-    phase_idx = user_program.current_phase_index % len(program.phases)
-    current_phase = program.phases[phase_idx]
-
-    # week_number is 1-indexed in PhaseWorkout
-    week_num = (user_program.current_week_in_phase % current_phase.duration_weeks) + 1
-    day_idx = user_program.current_day_index % 3  # 3 days per week
-
-    # Load workout with sections and exercises
-    workout_result = await db.execute(
-        select(PhaseWorkout)
-        .where(
-            PhaseWorkout.phase_id == current_phase.id,
-            PhaseWorkout.week_number == week_num,
-            PhaseWorkout.day_index == day_idx,
-        )
-        .options(
-            selectinload(PhaseWorkout.sections)
-            .selectinload(PhaseWorkoutSection.exercises)
-            .selectinload(PhaseWorkoutExercise.exercise),
-            selectinload(PhaseWorkout.sections)
-            .selectinload(PhaseWorkoutSection.exercises)
-            .selectinload(PhaseWorkoutExercise.substitute1),
-            selectinload(PhaseWorkout.sections)
-            .selectinload(PhaseWorkoutSection.exercises)
-            .selectinload(PhaseWorkoutExercise.substitute2),
-        )
-    )
-    workout = workout_result.scalar_one_or_none()
-    if not workout:
+    pos = plan.position(user_program)
+    if pos is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No workout found for phase {phase_idx}, week {week_num}, day {day_idx}",
+            detail=(
+                f"No workout found for phase {user_program.current_phase_index}, "
+                f"week {user_program.current_week_in_phase + 1}, "
+                f"day {user_program.current_day_index}"
+            ),
         )
-
-    from app.schemas import (
-        PhaseWorkoutExerciseResponse,
-        PhaseWorkoutResponse,
-        PhaseWorkoutSectionResponse,
-        ProgramPhaseResponse,
-    )
+    today = plan.schedule[pos]
 
     return PhasedTodayResponse(
-        program=ProgramResponse.model_validate(program),
-        user_program=UserProgramResponse.model_validate(user_program),
-        phase=ProgramPhaseResponse.model_validate(current_phase),
-        workout=PhaseWorkoutResponse(
-            id=workout.id,
-            name=workout.name,
-            day_index=workout.day_index,
-            week_number=workout.week_number,
-            sections=[
-                PhaseWorkoutSectionResponse(
-                    id=s.id,
-                    name=s.name,
-                    order=s.order,
-                    notes=s.notes,
-                    exercises=[
-                        PhaseWorkoutExerciseResponse.model_validate(ex)
-                        for ex in s.exercises
-                    ],
-                )
-                for s in sorted(workout.sections, key=lambda s: s.order)
-            ],
-        ),
-        phase_number=phase_idx + 1,
-        week_in_phase=week_num,
-        day_number=day_idx + 1,
-        total_phases=len(program.phases),
+        program=plan.program,
+        user_program=user_program,
+        phase=plan.phases[today.phase_index],
+        workout=await phase_workout(db, plan, today.workout_id),
+        phase_number=today.phase_index + 1,
+        week_in_phase=today.week_number,
+        day_number=today.day_index + 1,
+        total_phases=len(plan.phases),
+        schedule_day=pos + 1,
+        total_days=len(plan.schedule),
     )
 
 
 @router.get("/{program_id}/phases", response_model=list[ProgramPhaseDetailResponse])
 async def list_phases(
     program_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
-) -> list:
+    cache_headers: dict[str, str] = Depends(catalog_cache_headers),
+) -> ORJSONResponse:
     """Get all phases for a phased program with full workout hierarchy."""
     # Allow access to shared programs or user's own
     result = await db.execute(
-        select(Program).where(
+        select(Program.id).where(
             Program.id == program_id,
             (Program.user_id.is_(None)) | (Program.user_id == current_user.id),
         )
     )
-    program = result.scalar_one_or_none()
-    if not program:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Program not found"
         )
 
-    phases_result = await db.execute(
-        select(ProgramPhase)
+    # One flat query per level, nested back together by parent id
+    result = await db.execute(
+        select(*schema_columns(ProgramPhaseResponse, ProgramPhase))
         .where(ProgramPhase.program_id == program_id)
-        .options(
-            selectinload(ProgramPhase.workouts)
-            .selectinload(PhaseWorkout.sections)
-            .selectinload(PhaseWorkoutSection.exercises)
-            .selectinload(PhaseWorkoutExercise.exercise),
-            selectinload(ProgramPhase.workouts)
-            .selectinload(PhaseWorkout.sections)
-            .selectinload(PhaseWorkoutSection.exercises)
-            .selectinload(PhaseWorkoutExercise.substitute1),
-            selectinload(ProgramPhase.workouts)
-            .selectinload(PhaseWorkout.sections)
-            .selectinload(PhaseWorkoutSection.exercises)
-            .selectinload(PhaseWorkoutExercise.substitute2),
-        )
         .order_by(ProgramPhase.order)
     )
-    return list(phases_result.scalars().all())
+    phases = result.mappings().all()
+    in_program = PhaseWorkout.phase_id.in_(
+        select(ProgramPhase.id).where(ProgramPhase.program_id == program_id)
+    )
+
+    result = await db.execute(
+        select(
+            PhaseWorkout.phase_id, *schema_columns(PhaseWorkoutResponse, PhaseWorkout)
+        )
+        .where(in_program)
+        .order_by(PhaseWorkout.week_number, PhaseWorkout.day_index, PhaseWorkout.id)
+    )
+    workout_rows = result.mappings().all()
+
+    result = await db.execute(
+        select(
+            PhaseWorkoutSection.workout_id,
+            *schema_columns(PhaseWorkoutSectionResponse, PhaseWorkoutSection),
+        )
+        .join(PhaseWorkout, PhaseWorkout.id == PhaseWorkoutSection.workout_id)
+        .where(in_program)
+        .order_by(PhaseWorkoutSection.order)
+    )
+    section_rows = result.mappings().all()
+
+    exercise, sub1, sub2 = aliased(Exercise), aliased(Exercise), aliased(Exercise)
+    pwe = PhaseWorkoutExercise
+    result = await db.execute(
+        select(
+            pwe.section_id,
+            *schema_columns(PhaseWorkoutExerciseResponse, pwe),
+            exercise.name.label("exercise_name"),
+            sub1.name.label("substitute1_exercise_name"),
+            sub2.name.label("substitute2_exercise_name"),
+        )
+        .join(PhaseWorkoutSection, PhaseWorkoutSection.id == pwe.section_id)
+        .join(PhaseWorkout, PhaseWorkout.id == PhaseWorkoutSection.workout_id)
+        .outerjoin(exercise, exercise.id == pwe.exercise_id)
+        .outerjoin(sub1, sub1.id == pwe.substitute1_exercise_id)
+        .outerjoin(sub2, sub2.id == pwe.substitute2_exercise_id)
+        .where(in_program)
+        .order_by(pwe.order)
+    )
+    exercises = _group(PhaseWorkoutExerciseResponse, "section_id", result.mappings())
+    sections = _group(
+        PhaseWorkoutSectionResponse, "workout_id", section_rows, "exercises", exercises
+    )
+    workouts = _group(
+        PhaseWorkoutResponse, "phase_id", workout_rows, "sections", sections
+    )
+    return ORJSONResponse(
+        [
+            shape(
+                ProgramPhaseDetailResponse,
+                p,
+                days_per_week=days_per_week(
+                    p["duration_weeks"],
+                    (
+                        (w["week_number"], w["day_index"])
+                        for w in workouts.get(p["id"], [])
+                    ),
+                ),
+                workouts=workouts.get(p["id"], []),
+            )
+            for p in phases
+        ],
+        headers=cache_headers,
+    )
+
+
+def _group(
+    schema: type,
+    parent_key: str,
+    rows: Iterable[RowMapping],
+    child_field: str | None = None,
+    children: dict[str, list[dict]] | None = None,
+) -> dict[str, list[dict]]:
+    """Shape ``rows`` into ``schema`` dicts, listed under their parent's id."""
+    grouped: dict[str, list[dict]] = {}
+    for row in rows:
+        values = {child_field: children.get(row["id"], [])} if child_field else {}
+        grouped.setdefault(row[parent_key], []).append(shape(schema, row, **values))
+    return grouped
 
 
 @router.get("/{program_id}", response_model=ProgramDetailResponse)
 async def get_program(
     program_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> Program:
     """Get program detail with routines. Allows shared access."""
@@ -470,11 +538,16 @@ async def activate_program(
         await db.flush()
 
     # Deactivate all user enrollments
-    await db.execute(
+    deactivated = await db.scalars(
         update(UserProgram)
-        .where(UserProgram.user_id == current_user.id)
+        .where(
+            UserProgram.user_id == current_user.id,
+            UserProgram.is_active == True,  # noqa: E712
+        )
         .values(is_active=False)
+        .returning(UserProgram.id)
     )
+    await record_changes(db, current_user.id, {UserProgram: deactivated.all()})
 
     # Activate this one and reset counters
     enrollment.is_active = True
@@ -497,49 +570,58 @@ async def activate_program(
     return result.scalar_one()
 
 
-@router.post("/{program_id}/advance", response_model=UserProgramResponse)
-async def advance_program(
-    program_id: str,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> UserProgram:
-    """Advance the user's enrollment to the next routine after a workout."""
+async def _enrollment(db: AsyncSession, program_id: str, user_id: str) -> Row:
     result = await db.execute(
-        select(UserProgram)
-        .where(
-            UserProgram.user_id == current_user.id,
+        select(UserProgram.__table__).where(
+            UserProgram.user_id == user_id,
             UserProgram.program_id == program_id,
         )
-        .options(selectinload(UserProgram.program).selectinload(Program.routines))
     )
-    enrollment = result.scalar_one_or_none()
+    enrollment = result.one_or_none()
     if not enrollment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Enrollment not found"
         )
+    return enrollment
+
 
-    routines = enrollment.program.routines
-    if not routines:
+@router.post("/{program_id}/advance", response_model=UserProgramResponse)
+async def advance_program(
+    program_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Row:
+    """Advance the user's enrollment to the next routine after a workout."""
+    advanced = await advance_rotation(
+        db, current_user.id, UserProgram.program_id == program_id
+    )
+    if not advanced:
+        # Nothing matched: tell a missing enrollment from an empty program
+        await _enrollment(db, program_id, current_user.id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Program has no routines",
         )
-
-    next_index = enrollment.current_routine_index + 1
-    if next_index >= len(routines):
-        next_index = 0
-        enrollment.weeks_completed += 1
-
-    enrollment.current_routine_index = next_index
-    enrollment.last_workout_at = datetime.utcnow()
     await db.commit()
+    return advanced[0]
 
-    result = await db.execute(
-        select(UserProgram)
-        .where(UserProgram.id == enrollment.id)
-        .options(selectinload(UserProgram.program))
-    )
-    return result.scalar_one()
+
+async def _phased_enrollment(
+    db: AsyncSession, program_id: str, user_id: str
+) -> tuple[Row, ProgramPlan]:
+    """The user's enrollment in a phased program and the program's plan."""
+    enrollment = await _enrollment(db, program_id, user_id)
+    plan = await load_plan(db, program_id)
+    if plan is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Program not found"
+        )
+    if plan.program.program_type != "phased" or not plan.schedule:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Not a phased program or no phases",
+        )
+    return enrollment, plan
 
 
 @router.post("/{program_id}/advance-phased", response_model=UserProgramResponse)
@@ -547,60 +629,80 @@ async def advance_phased_program(
     program_id: str,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> UserProgram:
-    """Advance a phased program enrollment: day -> week -> phase."""
-    result = await db.execute(
-        select(UserProgram)
-        .where(
-            UserProgram.user_id == current_user.id,
-            UserProgram.program_id == program_id,
-        )
-        .options(
-            selectinload(UserProgram.program).selectinload(Program.phases),
-        )
+) -> Row:
+    """Advance a phased program enrollment to the next day in its schedule.
+
+    The update only applies if the enrollment is still on the day it was
+    read on; if another advance got there first, the new position is read
+    and advanced again.
+    """
+    for _ in range(_ADVANCE_ATTEMPTS):
+        enrollment, plan = await _phased_enrollment(db, program_id, current_user.id)
+        next_day = plan.schedule[plan.next_position(enrollment)]
+        advanced = await update_enrollments(
+            db,
+            current_user.id,
+            UserProgram.id == enrollment.id,
+            UserProgram.current_phase_index == enrollment.current_phase_index,
+            UserProgram.current_week_in_phase == enrollment.current_week_in_phase,
+            UserProgram.current_day_index == enrollment.current_day_index,
+            **next_day.enrollment_fields,
+            last_workout_at=datetime.utcnow(),
+        )
+        if advanced:
+            await db.commit()
+            return advanced[0]
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Enrollment is being advanced concurrently",
     )
-    enrollment = result.scalar_one_or_none()
-    if not enrollment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Enrollment not found"
-        )
 
-    program = enrollment.program
-    if program.program_type != "phased" or not program.phases:
+
+@router.post("/{program_id}/skip-to-day", response_model=UserProgramResponse)
+async def skip_to_day(
+    program_id: str,
+    body: ScheduleSkipRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Row:
+    """Move a phased program enrollment to day N (1-indexed) of its schedule."""
+    enrollment, plan = await _phased_enrollment(db, program_id, current_user.id)
+    if body.day > len(plan.schedule):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Not a phased program or no phases",
+            detail=f"Program has {len(plan.schedule)} days",
+        )
+    moved = await update_enrollments(
+        db,
+        current_user.id,
+        UserProgram.id == enrollment.id,
+        **plan.schedule[body.day - 1].enrollment_fields,
+    )
+    if not moved:
+        # Unenrolled between the read and the update
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Enrollment not found"
         )
-
-    days_per_week = 3
-    current_phase = program.phases[enrollment.current_phase_index % len(program.phases)]
-
-    new_day = enrollment.current_day_index + 1
-    new_week = enrollment.current_week_in_phase
-    new_phase = enrollment.current_phase_index
-
-    if new_day >= days_per_week:
-        new_day = 0
-        new_week += 1
-        if new_week >= current_phase.duration_weeks:
-            new_week = 0
-            new_phase += 1
-            if new_phase >= len(program.phases):
-                new_phase = 0
-
-    enrollment.current_day_index = new_day
-    enrollment.current_week_in_phase = new_week
-    enrollment.current_phase_index = new_phase
-    enrollment.last_workout_at = datetime.utcnow()
-
     await db.commit()
+    return moved[0]
 
-    result = await db.execute(
-        select(UserProgram)
-        .where(UserProgram.id == enrollment.id)
-        .options(selectinload(UserProgram.program))
-    )
-    return result.scalar_one()
+
+@router.get("/{program_id}/upcoming", response_model=list[ScheduleDayResponse])
+async def upcoming_days(
+    program_id: str,
+    count: int = Query(default=7, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> list[ScheduleDayResponse]:
+    """Preview the next ``count`` workouts, starting with the current day."""
+    enrollment, plan = await _phased_enrollment(db, program_id, current_user.id)
+    start = plan.position(enrollment)
+    if start is None:
+        start = plan.next_position(enrollment)
+    return [
+        ScheduleDayResponse(day=pos + 1, **day._asdict())
+        for pos, day in plan.upcoming(start, count)
+    ]
 
 
 @router.post("/{program_id}/deactivate", response_model=UserProgramResponse)
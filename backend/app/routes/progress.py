@@ -4,31 +4,32 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_current_user, get_db
+from app.dependencies import get_current_user, get_read_db
 from app.models import ExerciseProgress, User
 from app.schemas import ProgressDetailResponse, ProgressResponse
+from app.serialization import ORJSONResponse, rows_response, schema_columns
 
 router = APIRouter(prefix="/api/progress", tags=["progress"])
 
 
 @router.get("", response_model=list[ProgressDetailResponse])
 async def list_all_progress(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
-) -> list[ExerciseProgress]:
+) -> ORJSONResponse:
     """Get all exercise progress records for the current user."""
     result = await db.execute(
-        select(ExerciseProgress)
+        select(*schema_columns(ProgressDetailResponse, ExerciseProgress))
         .where(ExerciseProgress.user_id == current_user.id)
         .order_by(ExerciseProgress.year_week)
     )
-    return list(result.scalars().all())
+    return rows_response(ProgressDetailResponse, result.mappings())
 
 
 @router.get("/exercise/{exercise_id}", response_model=list[ProgressResponse])
 async def get_exercise_progress(
     exercise_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> list[ExerciseProgress]:
     """Get year-week history for an exercise (max weight, warmup info per week)."""
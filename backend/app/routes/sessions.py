@@ -1,15 +1,19 @@
 """Workout session and set logging routes with auto-progress tracking."""
 
-from datetime import datetime
+import base64
+import uuid
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from sqlalchemy import Row, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.dependencies import get_current_user, get_db
+from app.bulk import bulk_upsert
+from app.changes import record_changes
+from app.dependencies import get_current_user, get_db, get_read_db
 from app.models import (
     ExerciseProgress,
     Program,
@@ -18,20 +22,52 @@ from app.models import (
     WorkoutSession,
     WorkoutSet,
 )
+from app.performance import invalidate_last_performance
+from app.progression import advance_rotation
+from app.records import tracking_records, update_records
+from app.rollups import apply_volume_change, tracking_volume, volume_totals
 from app.schemas import (
     MessageResponse,
     SessionCreate,
     SessionDetailResponse,
+    SessionPageItem,
+    SessionPageResponse,
     SessionResponse,
     SessionUpdate,
+    SetBatchCreate,
     SetCreate,
     SetResponse,
     SetUpdate,
 )
+from app.summaries import refresh_session_summaries
 
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 
 
+def _naive_utc(dt: datetime) -> datetime:
+    """Compare aware filter times against the naive UTC ``started_at`` column."""
+    if dt.tzinfo is not None:
+        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _encode_cursor(started_at: datetime, session_id: str) -> str:
+    raw = f"{started_at.isoformat()}|{session_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        started_at, session_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        )
+        return datetime.fromisoformat(started_at), session_id
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from None
+
+
 @router.get("", response_model=list[SessionResponse])
 async def list_sessions(
     year_week: Optional[str] = Query(
@@ -40,11 +76,16 @@ async def list_sessions(
     week_type: Optional[str] = Query(
         None, description="Filter by week type: normal or deload"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
-) -> list[WorkoutSession]:
-    """List the current user's workout sessions with optional filters."""
-    query = select(WorkoutSession).where(WorkoutSession.user_id == current_user.id)
+) -> list[Row]:
+    """List the current user's workout sessions with optional filters.
+
+    Returns every matching session; ``GET /api/sessions/page`` pages them.
+    """
+    query = select(WorkoutSession.__table__).where(
+        WorkoutSession.user_id == current_user.id
+    )
     if year_week is not None:
         query = query.where(WorkoutSession.year_week == year_week)
     if week_type is not None:
@@ -52,7 +93,85 @@ async def list_sessions(
     query = query.order_by(WorkoutSession.started_at.desc())
 
     result = await db.execute(query)
-    return list(result.scalars().all())
+    return list(result.all())
+
+
+@router.get("/page", response_model=SessionPageResponse)
+async def list_session_pages(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(50, ge=1, le=200, description="Sessions per page"),
+    started_after: Optional[datetime] = Query(
+        None, description="Only sessions started at or after this time"
+    ),
+    started_before: Optional[datetime] = Query(
+        None, description="Only sessions started before this time"
+    ),
+    program_id: Optional[str] = Query(None, description="Filter by program"),
+    template_id: Optional[str] = Query(None, description="Filter by template"),
+    year_week: Optional[str] = Query(
+        None, description="Filter by year-week, e.g. 2025-27"
+    ),
+    week_type: Optional[str] = Query(
+        None, description="Filter by week type: normal or deload"
+    ),
+    include: Optional[Literal["sets"]] = Query(
+        None, description="Also return each session's sets"
+    ),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> SessionPageResponse:
+    """List the current user's workout sessions, newest first, one page at a time.
+
+    Pages are keyed on ``(started_at, id)`` rather than offsets, so each page
+    is an index range scan no matter how deep into the history it is.
+    """
+    query = select(WorkoutSession.__table__).where(
+        WorkoutSession.user_id == current_user.id
+    )
+    if cursor is not None:
+        query = query.where(
+            tuple_(WorkoutSession.started_at, WorkoutSession.id)
+            < tuple_(*_decode_cursor(cursor))
+        )
+    if started_after is not None:
+        query = query.where(WorkoutSession.started_at >= _naive_utc(started_after))
+    if started_before is not None:
+        query = query.where(WorkoutSession.started_at < _naive_utc(started_before))
+    if program_id is not None:
+        query = query.where(WorkoutSession.program_id == program_id)
+    if template_id is not None:
+        query = query.where(WorkoutSession.template_id == template_id)
+    if year_week is not None:
+        query = query.where(WorkoutSession.year_week == year_week)
+    if week_type is not None:
+        query = query.where(WorkoutSession.week_type == week_type)
+    query = query.order_by(
+        WorkoutSession.started_at.desc(), WorkoutSession.id.desc()
+    ).limit(limit + 1)
+
+    rows = (await db.execute(query)).mappings().all()
+    page = rows[:limit]
+
+    sets: dict[str, list[WorkoutSet]] | None = None
+    if include == "sets":
+        sets = {row["id"]: [] for row in page}
+        if sets:
+            result = await db.execute(
+                select(WorkoutSet)
+                .where(WorkoutSet.session_id.in_(list(sets)))
+                .order_by(WorkoutSet.created_at, WorkoutSet.set_number)
+            )
+            for workout_set in result.scalars():
+                sets[workout_set.session_id].append(workout_set)
+
+    last = page[-1] if len(rows) > limit else None
+    return SessionPageResponse(
+        sessions=[
+            SessionPageItem(**row, sets=sets[row["id"]] if sets is not None else None)
+            for row in page
+        ],
+        next_cursor=_encode_cursor(last["started_at"], last["id"]) if last else None,
+    )
 
 
 @router.post("", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
@@ -82,7 +201,7 @@ async def create_session(
 @router.get("/{session_id}", response_model=SessionDetailResponse)
 async def get_session(
     session_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> WorkoutSession:
     """Get session detail with all warmup and working sets."""
@@ -129,24 +248,12 @@ async def update_session(
 
         # Advance program rotation when finishing a program-linked session
         if session.user_program_id:
-            up_result = await db.execute(
-                select(UserProgram)
-                .where(UserProgram.id == session.user_program_id)
-                .options(
-                    selectinload(UserProgram.program).selectinload(Program.routines),
-                )
+            await advance_rotation(
+                db,
+                current_user.id,
+                UserProgram.id == session.user_program_id,
+                UserProgram.program.has(Program.program_type == "rotating"),
             )
-            enrollment = up_result.scalar_one_or_none()
-            if (
-                enrollment
-                and enrollment.program.program_type == "rotating"
-                and enrollment.program.routines
-            ):
-                enrollment.current_routine_index += 1
-                if enrollment.current_routine_index >= len(enrollment.program.routines):
-                    enrollment.current_routine_index = 0
-                    enrollment.weeks_completed += 1
-                enrollment.last_workout_at = datetime.utcnow()
             # Phased advancement is handled via /advance-phased endpoint
 
     await db.commit()
@@ -191,6 +298,11 @@ async def log_set(
     )
     db.add(workout_set)
     await db.flush()
+    await apply_volume_change(
+        db, {}, await volume_totals(db, WorkoutSet.id == workout_set.id)
+    )
+    await update_records(db, current_user.id, [workout_set.id])
+    await refresh_session_summaries(db, current_user.id, [session_id])
 
     # Auto-update exercise progress
     if session.year_week:
@@ -204,10 +316,98 @@ async def log_set(
         )
 
     await db.commit()
+    invalidate_last_performance(current_user.id)
     await db.refresh(workout_set)
     return workout_set
 
 
+@router.post(
+    "/{session_id}/sets:batch",
+    response_model=list[SetResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def log_sets(
+    session_id: str,
+    body: SetBatchCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> list[Row]:
+    """Log many sets to one session in a single round trip.
+
+    The sets are written with one multi-row INSERT and exercise progress
+    with one upsert covering every exercise in the batch.
+    """
+    result = await db.execute(
+        select(WorkoutSession.year_week).where(
+            WorkoutSession.id == session_id,
+            WorkoutSession.user_id == current_user.id,
+        )
+    )
+    session = result.one_or_none()
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
+        )
+
+    now = datetime.utcnow()
+    result = await db.execute(
+        insert(WorkoutSet).returning(
+            *WorkoutSet.__table__.c, sort_by_parameter_order=True
+        ),
+        [
+            dict(
+                set_data.model_dump(),
+                id=str(uuid.uuid4()),
+                session_id=session_id,
+                created_at=now,
+            )
+            for set_data in body.sets
+        ],
+    )
+    created = list(result.all())
+    set_ids = [row.id for row in created]
+    await apply_volume_change(
+        db, {}, await volume_totals(db, WorkoutSet.id.in_(set_ids))
+    )
+    await update_records(db, current_user.id, set_ids)
+    await refresh_session_summaries(db, current_user.id, [session_id])
+
+    progress_ids: list[str] = []
+    if session.year_week:
+        best: dict[str, Decimal] = {}
+        for set_data in body.sets:
+            if set_data.set_type == "working":
+                best[set_data.exercise_id] = max(
+                    set_data.weight, best.get(set_data.exercise_id, set_data.weight)
+                )
+        progress_ids = await bulk_upsert(
+            db,
+            ExerciseProgress,
+            [
+                dict(
+                    user_id=current_user.id,
+                    exercise_id=exercise_id,
+                    year_week=session.year_week,
+                    max_weight=weight,
+                )
+                for exercise_id, weight in best.items()
+            ],
+            index_elements=["user_id", "exercise_id", "year_week"],
+            update_columns=(),
+            greatest_columns=("max_weight",),
+        )
+
+    # Core writes bypass the ORM, so stamp them onto the change feed explicitly
+    await record_changes(
+        db,
+        current_user.id,
+        {WorkoutSet: set_ids, ExerciseProgress: progress_ids},
+    )
+    await db.commit()
+    invalidate_last_performance(current_user.id)
+    return created
+
+
 @router.put("/sets/{set_id}", response_model=SetResponse)
 async def update_set(
     set_id: str,
@@ -232,16 +432,22 @@ async def update_set(
             detail="Not allowed to update this set",
         )
 
-    if body.reps is not None:
-        workout_set.reps = body.reps
-    if body.weight is not None:
-        workout_set.weight = body.weight
-    if body.rpe is not None:
-        workout_set.rpe = body.rpe
-    if body.notes is not None:
-        workout_set.notes = body.notes
+    async with (
+        tracking_volume(db, WorkoutSet.id == set_id),
+        tracking_records(db, current_user.id, [set_id]),
+    ):
+        if body.reps is not None:
+            workout_set.reps = body.reps
+        if body.weight is not None:
+            workout_set.weight = body.weight
+        if body.rpe is not None:
+            workout_set.rpe = body.rpe
+        if body.notes is not None:
+            workout_set.notes = body.notes
+    await refresh_session_summaries(db, current_user.id, [workout_set.session_id])
 
     await db.commit()
+    invalidate_last_performance(current_user.id)
     await db.refresh(workout_set)
     return workout_set
 
@@ -269,8 +475,14 @@ async def delete_set(
             detail="Not allowed to delete this set",
         )
 
-    await db.delete(workout_set)
+    async with (
+        tracking_volume(db, WorkoutSet.id == set_id),
+        tracking_records(db, current_user.id, [set_id]),
+    ):
+        await db.delete(workout_set)
+    await refresh_session_summaries(db, current_user.id, [workout_set.session_id])
     await db.commit()
+    invalidate_last_performance(current_user.id)
     return {"message": "Set deleted successfully"}
 
 
@@ -1,80 +1,117 @@
-"""Volume and personal records statistics routes."""
+"""Volume, personal records and last performance statistics routes."""
 
-from decimal import Decimal
-
-from fastapi import APIRouter, Depends
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_current_user, get_db
-from app.models import Exercise, User, WorkoutSession, WorkoutSet
-from app.schemas import RecordResponse, VolumeResponse
+from app.dependencies import get_current_user, get_read_db
+from app.models import Exercise, PersonalRecord, User, WeeklyVolume
+from app.performance import last_performance
+from app.records import REP_MAX_RANGE
+from app.schemas import (
+    LastPerformanceResponse,
+    RecordResponse,
+    RecordSetResponse,
+    VolumeResponse,
+)
+from app.serialization import ORJSONResponse, rows_response, schema_columns
 
 router = APIRouter(prefix="/api/stats", tags=["stats"])
 
 
 @router.get("/volume", response_model=list[VolumeResponse])
 async def get_volume_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
-) -> list[VolumeResponse]:
-    """Calculate volume (sets x reps x weight) per muscle group per year-week."""
+) -> ORJSONResponse:
+    """Volume (sets x reps x weight) per muscle group per year-week.
+
+    Served from the ``weekly_volume`` rollup, so the cost depends on the number
+    of weeks charted rather than on how many sets the user has logged.
+    """
     result = await db.execute(
-        select(
-            WorkoutSession.year_week,
-            Exercise.muscle_group,
-            func.sum(WorkoutSet.reps * WorkoutSet.weight).label("total_volume"),
-        )
-        .join(WorkoutSession, WorkoutSet.session_id == WorkoutSession.id)
-        .join(Exercise, WorkoutSet.exercise_id == Exercise.id)
-        .where(
-            WorkoutSession.user_id == current_user.id,
-            WorkoutSet.set_type == "working",
-            WorkoutSession.year_week.isnot(None),
-        )
-        .group_by(WorkoutSession.year_week, Exercise.muscle_group)
-        .order_by(WorkoutSession.year_week)
+        select(*schema_columns(VolumeResponse, WeeklyVolume))
+        .where(WeeklyVolume.user_id == current_user.id)
+        .order_by(WeeklyVolume.year_week, WeeklyVolume.muscle_group)
+    )
+    return rows_response(VolumeResponse, result.mappings())
+
+
+def _record_response(
+    exercise_id: str, exercise_name: str, records: list[PersonalRecord]
+) -> RecordResponse:
+    by_type = {r.record_type: RecordSetResponse.model_validate(r) for r in records}
+    return RecordResponse(
+        exercise_id=exercise_id,
+        exercise_name=exercise_name,
+        max_weight=by_type["max_weight"].weight,
+        max_reps=by_type["max_reps"].reps,
+        best_weight=by_type["max_weight"],
+        best_reps=by_type["max_reps"],
+        best_e1rm=by_type.get("e1rm"),
+        rep_maxes={
+            n: by_type[f"rm_{n}"] for n in REP_MAX_RANGE if f"rm_{n}" in by_type
+        },
     )
-    rows = result.all()
-    return [
-        VolumeResponse(
-            year_week=row.year_week,
-            muscle_group=row.muscle_group,
-            total_volume=Decimal(str(row.total_volume)),
-        )
-        for row in rows
-    ]
 
 
 @router.get("/records", response_model=list[RecordResponse])
 async def get_personal_records(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> list[RecordResponse]:
-    """Get personal records per exercise (max weight, max reps)."""
+    """Get personal records per exercise from the personal records store.
+
+    Each exercise carries its best set by weight, by reps and by estimated 1RM,
+    plus a 1-12 rep-max table.
+    """
     result = await db.execute(
-        select(
-            WorkoutSet.exercise_id,
-            Exercise.name.label("exercise_name"),
-            func.max(WorkoutSet.weight).label("max_weight"),
-            func.max(WorkoutSet.reps).label("max_reps"),
-        )
-        .join(WorkoutSession, WorkoutSet.session_id == WorkoutSession.id)
-        .join(Exercise, WorkoutSet.exercise_id == Exercise.id)
+        select(PersonalRecord, Exercise.name)
+        .join(Exercise, PersonalRecord.exercise_id == Exercise.id)
+        .where(PersonalRecord.user_id == current_user.id)
+        .order_by(Exercise.name, PersonalRecord.exercise_id)
+    )
+    grouped: dict[str, tuple[str, list[PersonalRecord]]] = {}
+    for record, name in result.all():
+        grouped.setdefault(record.exercise_id, (name, []))[1].append(record)
+    return [
+        _record_response(exercise_id, name, records)
+        for exercise_id, (name, records) in grouped.items()
+    ]
+
+
+@router.get("/records/{exercise_id}", response_model=RecordResponse)
+async def get_exercise_records(
+    exercise_id: str,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> RecordResponse:
+    """Personal records for a single exercise."""
+    result = await db.execute(
+        select(PersonalRecord, Exercise.name)
+        .join(Exercise, PersonalRecord.exercise_id == Exercise.id)
         .where(
-            WorkoutSession.user_id == current_user.id,
-            WorkoutSet.set_type == "working",
+            PersonalRecord.user_id == current_user.id,
+            PersonalRecord.exercise_id == exercise_id,
         )
-        .group_by(WorkoutSet.exercise_id, Exercise.name)
-        .order_by(Exercise.name)
     )
     rows = result.all()
-    return [
-        RecordResponse(
-            exercise_id=row.exercise_id,
-            exercise_name=row.exercise_name,
-            max_weight=Decimal(str(row.max_weight)),
-            max_reps=row.max_reps,
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No records for exercise"
         )
-        for row in rows
-    ]
+    return _record_response(exercise_id, rows[0][1], [record for record, _ in rows])
+
+
+@router.get("/last-performance", response_model=list[LastPerformanceResponse])
+async def get_last_performance(
+    exercise_id: list[str] = Query(..., max_length=50),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+) -> list[LastPerformanceResponse]:
+    """Most recent working sets and best recent set for each given exercise.
+
+    Exercises the user has never trained are left out.
+    """
+    found = await last_performance(db, current_user.id, exercise_id)
+    return list(found.values())
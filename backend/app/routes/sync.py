@@ -1,24 +1,46 @@
-"""Bulk sync endpoint for offline-first client data."""
+"""Bulk sync and delta-pull endpoints for offline-first client data."""
 
+from collections import defaultdict
+from collections.abc import Collection
 from datetime import datetime, timezone
 from decimal import Decimal
+from typing import Optional
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sqlalchemy.orm import selectinload
 
+from app.bulk import bulk_upsert, bulk_upsert_rows, fetch_rows, missing_ids
+from app.changes import feed_watermark, record_changes
 from app.dependencies import get_current_user, get_db
 from app.models import (
+    ChangeLog,
+    Exercise,
     ExerciseProgress,
+    PhaseWorkout,
     Program,
+    ProgramRoutine,
+    TemplateExercise,
     User,
     UserProgram,
     WorkoutSession,
     WorkoutSet,
+    WorkoutTemplate,
 )
-from app.schemas import SyncRequest, SyncResponse
+from app.performance import invalidate_last_performance
+from app.progression import advance_rotation
+from app.records import held_records, update_records
+from app.rollups import apply_volume_change, volume_totals
+from app.schemas import (
+    ChangeTombstone,
+    SyncChangesResponse,
+    SyncRequest,
+    SyncResponse,
+    SyncSetData,
+)
+from app.summaries import refresh_session_summaries
 
 router = APIRouter(prefix="/api/sync", tags=["sync"])
 
@@ -32,179 +54,395 @@ def _naive(dt: datetime | None) -> datetime | None:
     return dt
 
 
+_SESSION_UPDATE_COLUMNS = (
+    "template_id",
+    "program_id",
+    "phase_workout_id",
+    "user_program_id",
+    "year_week",
+    "week_type",
+    "started_at",
+    "finished_at",
+    "notes",
+    "synced",
+)
+# Foreign keys checked up front, so a dangling id rejects only its own row
+_SESSION_REFERENCES = (
+    ("template_id", WorkoutTemplate),
+    ("program_id", Program),
+    ("phase_workout_id", PhaseWorkout),
+    ("user_program_id", UserProgram),
+)
+_SET_UPDATE_COLUMNS = (
+    "session_id",
+    "exercise_id",
+    "set_type",
+    "set_number",
+    "reps",
+    "weight",
+    "rpe",
+    "notes",
+)
+
+
 @router.post("", response_model=SyncResponse)
 async def sync_data(
     body: SyncRequest,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> SyncResponse:
-    """Accept bulk sync data from the client and upsert sessions and sets."""
-    synced_session_ids: list[str] = []
-    synced_set_ids: list[str] = []
+    """Accept bulk sync data from the client and upsert sessions and sets.
+
+    Ownership and foreign keys are checked with one ``IN`` lookup per table
+    and each table is then written with a single upsert, so round trips stay
+    constant as the batch grows. Rows that fail a check, or that the
+    database still rejects, are reported in ``errors`` and the rest of the
+    batch is written.
+    """
     errors: list[str] = []
-    new_finished_program_ids: list[str] = []
+    new_finished_programs: dict[str, str] = {}  # session id -> user_program_id
 
-    # Upsert sessions
+    # Upsert sessions (last-write-wins)
+    existing_sessions = await fetch_rows(
+        db,
+        select(WorkoutSession.id, WorkoutSession.user_id, WorkoutSession.year_week),
+        WorkoutSession.id,
+        (s.id for s in body.sessions),
+    )
+    missing = {
+        field: await missing_ids(
+            db, model.id, (getattr(s, field) for s in body.sessions)
+        )
+        for field, model in _SESSION_REFERENCES
+    }
+    session_rows: dict[str, dict] = {}
     for session_data in body.sessions:
-        try:
-            result = await db.execute(
-                select(WorkoutSession).where(WorkoutSession.id == session_data.id)
+        existing = existing_sessions.get(session_data.id)
+        owner = existing.user_id if existing is not None else None
+        if owner is not None and owner != current_user.id:
+            errors.append(f"Session {session_data.id}: not owned by current user")
+            continue
+        dangling = [
+            field
+            for field, _ in _SESSION_REFERENCES
+            if getattr(session_data, field) in missing[field]
+        ]
+        if dangling:
+            errors.extend(
+                f"Session {session_data.id}: {field} "
+                f"{getattr(session_data, field)} not found"
+                for field in dangling
             )
-            existing = result.scalar_one_or_none()
-            if existing:
-                # Update existing session (last-write-wins)
-                if existing.user_id != current_user.id:
-                    errors.append(
-                        f"Session {session_data.id}: not owned by current user"
-                    )
-                    continue
-                existing.template_id = session_data.template_id
-                existing.program_id = session_data.program_id
-                existing.phase_workout_id = session_data.phase_workout_id
-                existing.user_program_id = session_data.user_program_id
-                existing.year_week = session_data.year_week
-                existing.week_type = session_data.week_type
-                existing.started_at = _naive(session_data.started_at)
-                existing.finished_at = _naive(session_data.finished_at)
-                existing.notes = session_data.notes
-                existing.synced = True
-            else:
-                session = WorkoutSession(
-                    id=session_data.id,
-                    user_id=current_user.id,
-                    template_id=session_data.template_id,
-                    program_id=session_data.program_id,
-                    phase_workout_id=session_data.phase_workout_id,
-                    user_program_id=session_data.user_program_id,
-                    year_week=session_data.year_week,
-                    week_type=session_data.week_type,
-                    started_at=_naive(session_data.started_at),
-                    finished_at=_naive(session_data.finished_at),
-                    notes=session_data.notes,
-                    synced=True,
-                )
-                db.add(session)
-                # Track new finished sessions with a user_program for rotation
-                if session_data.finished_at and session_data.user_program_id:
-                    new_finished_program_ids.append(session_data.user_program_id)
-            synced_session_ids.append(session_data.id)
-        except Exception as exc:
-            errors.append(f"Session {session_data.id}: {str(exc)}")
+            continue
+        session_rows[session_data.id] = dict(
+            id=session_data.id,
+            user_id=current_user.id,
+            template_id=session_data.template_id,
+            program_id=session_data.program_id,
+            phase_workout_id=session_data.phase_workout_id,
+            user_program_id=session_data.user_program_id,
+            year_week=session_data.year_week,
+            week_type=session_data.week_type,
+            started_at=_naive(session_data.started_at),
+            finished_at=_naive(session_data.finished_at),
+            notes=session_data.notes,
+            synced=True,
+        )
+        # Track new finished sessions with a user_program for rotation
+        if owner is None and session_data.finished_at and session_data.user_program_id:
+            new_finished_programs[session_data.id] = session_data.user_program_id
 
-    await db.flush()
+    # Snapshot the volume of every set this batch can move between rollup
+    # buckets: the incoming sets plus all sets of sessions changing week
+    rewritten_sessions = [
+        sid
+        for sid, row in session_rows.items()
+        if sid in existing_sessions
+        and existing_sessions[sid].year_week != row["year_week"]
+    ]
+    volume_scope = (
+        WorkoutSession.user_id == current_user.id,
+        or_(
+            WorkoutSet.id.in_([s.id for s in body.sets]),
+            WorkoutSet.session_id.in_(rewritten_sessions),
+        ),
+    )
+    volume_before = await volume_totals(db, *volume_scope)
+    records_before = await held_records(db, current_user.id, (s.id for s in body.sets))
+
+    written_sessions, rejected = await bulk_upsert_rows(
+        db,
+        WorkoutSession,
+        list(session_rows.values()),
+        index_elements=["id"],
+        update_columns=_SESSION_UPDATE_COLUMNS,
+        where=WorkoutSession.user_id == current_user.id,
+    )
+    for sid, error in rejected.items():
+        errors.append(f"Session {sid}: {error}")
+        del session_rows[sid]
+        new_finished_programs.pop(sid, None)
+
+    # Upsert sets, accepting only those attached to the user's own sessions
+    existing_sets = await fetch_rows(
+        db,
+        select(WorkoutSet.id, WorkoutSession.user_id, WorkoutSet.session_id).join(
+            WorkoutSession, WorkoutSet.session_id == WorkoutSession.id
+        ),
+        WorkoutSet.id,
+        (s.id for s in body.sets),
+    )
+    session_weeks = {sid: row["year_week"] for sid, row in session_rows.items()}
+    referenced = await fetch_rows(
+        db,
+        select(WorkoutSession.id, WorkoutSession.user_id, WorkoutSession.year_week),
+        WorkoutSession.id,
+        (s.session_id for s in body.sets if s.session_id not in session_weeks),
+    )
+    session_weeks.update(
+        (sid, row.year_week)
+        for sid, row in referenced.items()
+        if row.user_id == current_user.id
+    )
+
+    missing_exercises = await missing_ids(
+        db, Exercise.id, (s.exercise_id for s in body.sets)
+    )
 
-    # Upsert sets
+    set_rows: dict[str, dict] = {}
     for set_data in body.sets:
-        try:
-            result = await db.execute(
-                select(WorkoutSet).where(WorkoutSet.id == set_data.id)
+        existing = existing_sets.get(set_data.id)
+        if existing is not None and existing.user_id != current_user.id:
+            errors.append(f"Set {set_data.id}: not owned by current user")
+            continue
+        if set_data.session_id not in session_weeks:
+            errors.append(f"Set {set_data.id}: session {set_data.session_id} not found")
+            continue
+        if set_data.exercise_id in missing_exercises:
+            errors.append(
+                f"Set {set_data.id}: exercise {set_data.exercise_id} not found"
             )
-            existing = result.scalar_one_or_none()
-            if existing:
-                existing.exercise_id = set_data.exercise_id
-                existing.set_type = set_data.set_type
-                existing.set_number = set_data.set_number
-                existing.reps = set_data.reps
-                existing.weight = set_data.weight
-                existing.rpe = set_data.rpe
-                existing.notes = set_data.notes
-            else:
-                workout_set = WorkoutSet(
-                    id=set_data.id,
-                    session_id=set_data.session_id,
-                    exercise_id=set_data.exercise_id,
-                    set_type=set_data.set_type,
-                    set_number=set_data.set_number,
-                    reps=set_data.reps,
-                    weight=set_data.weight,
-                    rpe=set_data.rpe,
-                    notes=set_data.notes,
-                )
-                db.add(workout_set)
-
-            # Auto-update progress for working sets
-            if set_data.set_type == "working":
-                # Retrieve the session to get year_week
-                sess_result = await db.execute(
-                    select(WorkoutSession).where(
-                        WorkoutSession.id == set_data.session_id
-                    )
-                )
-                sess = sess_result.scalar_one_or_none()
-                if sess and sess.year_week:
-                    await _sync_update_progress(
-                        db=db,
-                        user_id=current_user.id,
-                        exercise_id=set_data.exercise_id,
-                        year_week=sess.year_week,
-                        weight=set_data.weight,
-                    )
-
-            synced_set_ids.append(set_data.id)
-        except Exception as exc:
-            errors.append(f"Set {set_data.id}: {str(exc)}")
+            continue
+        set_rows[set_data.id] = dict(
+            id=set_data.id,
+            session_id=set_data.session_id,
+            exercise_id=set_data.exercise_id,
+            set_type=set_data.set_type,
+            set_number=set_data.set_number,
+            reps=set_data.reps,
+            weight=set_data.weight,
+            rpe=set_data.rpe,
+            notes=set_data.notes,
+        )
+
+    written_sets, rejected = await bulk_upsert_rows(
+        db,
+        WorkoutSet,
+        list(set_rows.values()),
+        index_elements=["id"],
+        update_columns=_SET_UPDATE_COLUMNS,
+    )
+    for sid, error in rejected.items():
+        errors.append(f"Set {sid}: {error}")
+        del set_rows[sid]
+
+    # Fold working sets into one progress row per (exercise, year_week)
+    written_progress = await bulk_upsert(
+        db,
+        ExerciseProgress,
+        _aggregate_progress(current_user.id, body.sets, set_rows.keys(), session_weeks),
+        index_elements=["user_id", "exercise_id", "year_week"],
+        update_columns=(),
+        greatest_columns=("max_weight",),
+    )
+
+    await apply_volume_change(db, volume_before, await volume_totals(db, *volume_scope))
+    await update_records(db, current_user.id, written_sets, records_before)
+    # A set moved to another session also changes the totals of the one it left
+    await refresh_session_summaries(
+        db,
+        current_user.id,
+        [
+            *(
+                existing_sets[sid].session_id
+                for sid in set_rows
+                if sid in existing_sets
+            ),
+            *(row["session_id"] for row in set_rows.values()),
+        ],
+    )
 
     # Advance user_programs for newly synced finished sessions
-    for up_id in dict.fromkeys(new_finished_program_ids):
+    if new_finished_programs:
         try:
-            up_result = await db.execute(
-                select(UserProgram)
-                .where(
-                    UserProgram.id == up_id,
-                    UserProgram.user_id == current_user.id,
-                )
-                .options(
-                    selectinload(UserProgram.program).selectinload(Program.routines)
-                )
+            await advance_rotation(
+                db,
+                current_user.id,
+                UserProgram.id.in_(list(dict.fromkeys(new_finished_programs.values()))),
+                UserProgram.program.has(Program.program_type == "rotating"),
             )
-            enrollment = up_result.scalar_one_or_none()
-            if (
-                enrollment
-                and enrollment.program.program_type == "rotating"
-                and enrollment.program.routines
-            ):
-                next_index = enrollment.current_routine_index + 1
-                if next_index >= len(enrollment.program.routines):
-                    next_index = 0
-                    enrollment.weeks_completed += 1
-                enrollment.current_routine_index = next_index
-                enrollment.last_workout_at = datetime.utcnow()
             # Phased advancement is handled via /advance-phased endpoint
         except Exception as exc:
-            errors.append(f"UserProgram advance {up_id}: {str(exc)}")
+            errors.append(f"UserProgram advance: {str(exc)}")
 
+    # Upserts bypass the ORM, so stamp them onto the change feed explicitly
+    await record_changes(
+        db,
+        current_user.id,
+        {
+            WorkoutSession: written_sessions,
+            WorkoutSet: written_sets,
+            ExerciseProgress: written_progress,
+        },
+    )
     await db.commit()
+    if written_sessions or written_sets:
+        invalidate_last_performance(current_user.id)
 
     return SyncResponse(
-        synced_sessions=synced_session_ids,
-        synced_sets=synced_set_ids,
+        synced_sessions=list(session_rows),
+        synced_sets=list(set_rows),
         errors=errors,
     )
 
 
-async def _sync_update_progress(
-    db: AsyncSession,
-    user_id: str,
-    exercise_id: str,
-    year_week: str,
-    weight: Decimal,
-) -> None:
-    """Update exercise progress during sync for working sets."""
+@router.get("/changes", response_model=SyncChangesResponse)
+async def list_changes(
+    since: Optional[int] = Query(
+        None, ge=0, description="Cursor returned by the previous pull"
+    ),
+    limit: int = Query(1000, ge=1, le=5000, description="Max change entries"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> SyncChangesResponse:
+    """Return rows changed after ``since`` plus tombstones for deleted rows.
+
+    Omitting ``since`` returns only the current cursor, which a client stores
+    after a full hydrate. When ``has_more`` is set, pull again from ``cursor``.
+    On PostgreSQL the cursor is a transaction id: the feed stops below the
+    oldest transaction still in flight, and pages end on whole transactions,
+    so an entry committed late is never skipped.
+    """
+    visible = or_(ChangeLog.user_id.is_(None), ChangeLog.user_id == current_user.id)
+    watermark = await feed_watermark(db)
+    if since is None:
+        if watermark is not None:
+            return SyncChangesResponse(cursor=watermark - 1)
+        head = await db.scalar(select(func.max(ChangeLog.id)).where(visible))
+        return SyncChangesResponse(cursor=head or 0)
+
+    key = ChangeLog.id if watermark is None else ChangeLog.txid
+    criteria = [visible, key > since]
+    if watermark is not None:
+        criteria.append(ChangeLog.txid < watermark)
+    columns = (
+        key.label("position"),
+        ChangeLog.entity,
+        ChangeLog.entity_id,
+        ChangeLog.deleted,
+    )
     result = await db.execute(
-        select(ExerciseProgress).where(
-            ExerciseProgress.user_id == user_id,
-            ExerciseProgress.exercise_id == exercise_id,
-            ExerciseProgress.year_week == year_week,
+        select(*columns).where(*criteria).order_by(key, ChangeLog.id).limit(limit + 1)
+    )
+    entries = result.all()
+    has_more = len(entries) > limit
+    if has_more and watermark is not None:
+        # Never split a transaction across pages; one larger than the page
+        # is served whole
+        boundary = entries[limit].position
+        entries = [entry for entry in entries if entry.position != boundary]
+        if not entries:
+            result = await db.execute(
+                select(*columns)
+                .where(visible, ChangeLog.txid == boundary)
+                .order_by(ChangeLog.id)
+            )
+            entries = result.all()
+    else:
+        entries = entries[:limit]
+
+    # Later entries for the same row supersede earlier ones
+    latest: dict[tuple[str, str], bool] = {}
+    for entry in entries:
+        latest[(entry.entity, entry.entity_id)] = entry.deleted
+    changed: dict[str, list[str]] = defaultdict(list)
+    deleted: list[ChangeTombstone] = []
+    for (entity, entity_id), is_deleted in latest.items():
+        if is_deleted:
+            deleted.append(ChangeTombstone(entity=entity, id=entity_id))
+        else:
+            changed[entity].append(entity_id)
+
+    async def load(model: type, *criteria, options: tuple = ()) -> list:
+        ids = changed.get(model.__tablename__)
+        if not ids:
+            return []
+        rows = await db.execute(
+            select(model).where(model.id.in_(ids), *criteria).options(*options)
         )
+        return list(rows.scalars().all())
+
+    own = current_user.id
+    shared_or_own_template = or_(
+        WorkoutTemplate.user_id.is_(None), WorkoutTemplate.user_id == own
+    )
+    shared_or_own_program = or_(Program.user_id.is_(None), Program.user_id == own)
+
+    return SyncChangesResponse.model_validate(
+        dict(
+            cursor=entries[-1].position if entries else since,
+            has_more=has_more,
+            sessions=await load(WorkoutSession, WorkoutSession.user_id == own),
+            sets=await load(WorkoutSet, WorkoutSet.session.has(user_id=own)),
+            progress=await load(ExerciseProgress, ExerciseProgress.user_id == own),
+            enrollments=await load(
+                UserProgram,
+                UserProgram.user_id == own,
+                options=(selectinload(UserProgram.program),),
+            ),
+            templates=await load(WorkoutTemplate, shared_or_own_template),
+            template_exercises=await load(
+                TemplateExercise, TemplateExercise.template.has(shared_or_own_template)
+            ),
+            programs=await load(
+                Program,
+                shared_or_own_program,
+                options=(selectinload(Program.routines),),
+            ),
+            program_routines=await load(
+                ProgramRoutine,
+                ProgramRoutine.program.has(shared_or_own_program),
+                options=(selectinload(ProgramRoutine.template),),
+            ),
+            deleted=deleted,
+        ),
+        from_attributes=True,
     )
-    progress = result.scalar_one_or_none()
-    if not progress:
-        progress = ExerciseProgress(
+
+
+def _aggregate_progress(
+    user_id: str,
+    sets: list[SyncSetData],
+    accepted_set_ids: Collection[str],
+    session_weeks: dict[str, str | None],
+) -> list[dict]:
+    """Group accepted working sets by (exercise, year_week) keeping the max weight."""
+    best: dict[tuple[str, str], Decimal] = {}
+    for set_data in sets:
+        if set_data.set_type != "working" or set_data.id not in accepted_set_ids:
+            continue
+        year_week = session_weeks.get(set_data.session_id)
+        if not year_week:
+            continue
+        key = (set_data.exercise_id, year_week)
+        if key not in best or set_data.weight > best[key]:
+            best[key] = set_data.weight
+    return [
+        dict(
             user_id=user_id,
             exercise_id=exercise_id,
             year_week=year_week,
             max_weight=weight,
         )
-        db.add(progress)
-    elif weight > progress.max_weight:
-        progress.max_weight = weight
+        for (exercise_id, year_week), weight in best.items()
+    ]
@@ -1,11 +1,16 @@
 """Workout template CRUD routes with exercise prescriptions."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.dependencies import get_current_user, get_db
+from app.dependencies import (
+    catalog_cache_headers,
+    get_current_user,
+    get_db,
+    get_read_db,
+)
 from app.models import TemplateExercise, WorkoutTemplate, User
 from app.schemas import (
     MessageResponse,
@@ -19,10 +24,13 @@ router = APIRouter(prefix="/api/templates", tags=["templates"])
 
 @router.get("", response_model=list[TemplateResponse])
 async def list_templates(
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
+    cache_headers: dict[str, str] = Depends(catalog_cache_headers),
 ) -> list[WorkoutTemplate]:
     """List shared and user's workout templates."""
+    response.headers.update(cache_headers)
     result = await db.execute(
         select(WorkoutTemplate)
         .where(
@@ -89,7 +97,7 @@ async def create_template(
 @router.get("/{template_id}", response_model=TemplateDetailResponse)
 async def get_template(
     template_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> WorkoutTemplate:
     """Get a template with all exercise prescriptions grouped by week type."""
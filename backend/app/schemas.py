@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import datetime
 from decimal import Decimal
 
@@ -171,6 +172,10 @@ class SetCreate(BaseModel):
     notes: str | None = None
 
 
+class SetBatchCreate(BaseModel):
+    sets: list[SetCreate] = Field(..., min_length=1, max_length=500)
+
+
 class SetResponse(BaseModel):
     id: str
     exercise_id: str
@@ -218,25 +223,36 @@ class SessionResponse(BaseModel):
     finished_at: datetime | None = None
     notes: str | None = None
     synced: bool
+    working_set_count: int = 0
+    total_volume: Decimal = Decimal(0)
+    exercise_count: int = 0
+    duration_seconds: int | None = None
 
     model_config = {"from_attributes": True}
 
+    @model_validator(mode="after")
+    def compute_duration(self) -> "SessionResponse":
+        """Seconds from start to finish, once the session is finished."""
+        if self.finished_at is not None:
+            self.duration_seconds = int(
+                (self.finished_at - self.started_at).total_seconds()
+            )
+        return self
 
-class SessionDetailResponse(BaseModel):
-    id: str
-    template_id: str | None = None
-    program_id: str | None = None
-    phase_workout_id: str | None = None
-    user_program_id: str | None = None
-    year_week: str | None = None
-    week_type: str
-    started_at: datetime
-    finished_at: datetime | None = None
-    notes: str | None = None
-    synced: bool
+
+class SessionDetailResponse(SessionResponse):
     sets: list[SetResponse] = []
 
-    model_config = {"from_attributes": True}
+
+class SessionPageItem(SessionResponse):
+    # Only filled in with include=sets
+    sets: list[SetResponse] | None = None
+
+
+class SessionPageResponse(BaseModel):
+    sessions: list[SessionPageItem]
+    # Pass back as ``cursor`` for the next page; None on the last page
+    next_cursor: str | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -267,11 +283,35 @@ class VolumeResponse(BaseModel):
     total_volume: Decimal
 
 
+class RecordSetResponse(BaseModel):
+    model_config = {"from_attributes": True}
+
+    set_id: str
+    weight: Decimal
+    reps: int
+    e1rm: Decimal
+    achieved_at: datetime
+
+
 class RecordResponse(BaseModel):
     exercise_id: str
     exercise_name: str
     max_weight: Decimal
     max_reps: int
+    best_weight: RecordSetResponse
+    best_reps: RecordSetResponse
+    best_e1rm: RecordSetResponse | None = None
+    rep_maxes: dict[int, RecordSetResponse] = {}
+
+
+class LastPerformanceResponse(BaseModel):
+    exercise_id: str
+    session_id: str
+    performed_at: datetime
+    # Working sets of the most recent session with this exercise
+    sets: list[SetResponse]
+    # Best estimated 1RM over the exercise's last few sessions
+    best_set: RecordSetResponse
 
 
 # ---------------------------------------------------------------------------
@@ -433,6 +473,8 @@ class TodayResponse(BaseModel):
     week_number: int
     is_deload: bool
     next_routine_name: str | None = None
+    # Only filled in with include=last_performance, keyed by exercise id
+    last_performance: dict[str, LastPerformanceResponse] | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -500,9 +542,39 @@ class ProgramPhaseResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+def days_per_week(duration_weeks: int, days: Iterable[tuple[int, int]]) -> int:
+    """Workout days per week of a phase, from its ``(week_number, day_index)``s.
+
+    Only weeks within ``duration_weeks`` are scheduled, so only they count.
+    """
+    return len({day for week, day in days if week <= duration_weeks})
+
+
 class ProgramPhaseDetailResponse(ProgramPhaseResponse):
+    # How many days an enrollment advances through before its week ends
+    days_per_week: int = 0
     workouts: list[PhaseWorkoutResponse] = []
 
+    @model_validator(mode="after")
+    def count_days(self) -> "ProgramPhaseDetailResponse":
+        self.days_per_week = days_per_week(
+            self.duration_weeks, ((w.week_number, w.day_index) for w in self.workouts)
+        )
+        return self
+
+
+class ScheduleDayResponse(BaseModel):
+    day: int  # 1-indexed position in the program's schedule
+    phase_index: int
+    week_number: int
+    day_index: int
+    workout_id: str
+    workout_name: str
+
+
+class ScheduleSkipRequest(BaseModel):
+    day: int = Field(..., ge=1)
+
 
 class PhasedTodayResponse(BaseModel):
     program: ProgramResponse
@@ -513,3 +585,62 @@ class PhasedTodayResponse(BaseModel):
     week_in_phase: int
     day_number: int
     total_phases: int
+    schedule_day: int
+    total_days: int
+    # Only filled in with include=last_performance, keyed by exercise id;
+    # covers the listed substitutes too
+    last_performance: dict[str, LastPerformanceResponse] | None = None
+
+
+# ---------------------------------------------------------------------------
+# Change feed schemas
+# ---------------------------------------------------------------------------
+
+
+class ChangedSetResponse(SetResponse):
+    session_id: str
+
+
+class ChangedTemplateExerciseResponse(TemplateExerciseResponse):
+    template_id: str
+
+
+class ChangeTombstone(BaseModel):
+    entity: str
+    id: str
+
+
+class ChangedProgramRoutineResponse(ProgramRoutineResponse):
+    program_id: str
+
+
+class SyncChangesResponse(BaseModel):
+    cursor: int
+    has_more: bool = False
+    sessions: list[SessionResponse] = []
+    sets: list[ChangedSetResponse] = []
+    progress: list[ProgressDetailResponse] = []
+    enrollments: list[UserProgramResponse] = []
+    templates: list[TemplateResponse] = []
+    template_exercises: list[ChangedTemplateExerciseResponse] = []
+    programs: list[ProgramResponse] = []
+    program_routines: list[ChangedProgramRoutineResponse] = []
+    deleted: list[ChangeTombstone] = []
+
+
+# ---------------------------------------------------------------------------
+# Bootstrap schemas
+# ---------------------------------------------------------------------------
+
+
+class BootstrapPhaseResponse(ProgramPhaseDetailResponse):
+    program_id: str
+
+
+class BootstrapResponse(BaseModel):
+    exercises: list[ExerciseResponse] = []
+    templates: list[TemplateDetailResponse] = []
+    programs: list[ProgramDetailResponse] = []
+    phases: list[BootstrapPhaseResponse] = []
+    enrollments: list[UserProgramResponse] = []
+    sessions: list[SessionDetailResponse] = []
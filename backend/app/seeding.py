@@ -0,0 +1,407 @@
+"""Loaders, bulk writers and the version registry for shared seed data.
+
+Seed datasets live as JSON files in ``app/seed_data`` and are only parsed
+when a seed actually runs. Each dataset is identified by a hash of its file
+recorded in ``seed_versions``; startup compares all of them with one query
+and only re-applies datasets whose content changed. Applying a dataset
+writes each table with one multi-row upsert keyed on the deterministic
+shared ids, so re-seeding updates rows in place instead of duplicating them,
+and deletes the rows under the re-seeded parents that the new data no longer
+defines.
+"""
+
+import gzip
+import hashlib
+import json
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import ColumnElement, delete, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.bulk import bulk_upsert, insert_for
+from app.catalog import SHARED_SCOPE, bump_catalog_versions
+from app.changes import TRACKED_MODELS, record_changes
+from app.models import (
+    Exercise,
+    ExerciseSubstitution,
+    PhaseWorkout,
+    PhaseWorkoutExercise,
+    PhaseWorkoutSection,
+    Program,
+    ProgramPhase,
+    SeedVersion,
+    WorkoutSession,
+)
+
+
+SEED_DATA_DIR = Path(__file__).parent / "seed_data"
+
+
+class SeedDataError(ValueError):
+    """A seed data file does not fit the tables it is loaded into."""
+
+
+def _dataset_path(name: str) -> Path:
+    """``<name>.json``, or its gzipped form ``<name>.json.gz``."""
+    path = SEED_DATA_DIR / f"{name}.json"
+    if path.exists():
+        return path
+    return path.with_suffix(".json.gz")
+
+
+def load_dataset(name: str) -> Any:
+    path = _dataset_path(name)
+    raw = path.read_bytes()
+    if path.suffix == ".gz":
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
+def dataset_hash(*names: str) -> str:
+    """SHA-256 over the named data files, without parsing them."""
+    digest = hashlib.sha256()
+    for name in names:
+        digest.update(name.encode() + b"\0")
+        digest.update(_dataset_path(name).read_bytes())
+    return digest.hexdigest()
+
+
+def validate_rows(model: type, rows: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Check seed rows against ``model``'s columns before they are written.
+
+    Rejects unknown fields, missing required values, values of the wrong
+    type and strings longer than their column. Fields some rows omit are
+    filled with the column default so the rows can share one INSERT.
+    """
+    table = model.__table__
+    keys = list(dict.fromkeys(key for row in rows for key in row))
+    unknown = [key for key in keys if key not in table.c]
+    if unknown:
+        raise SeedDataError(f"{table.name}: unknown fields {', '.join(unknown)}")
+    for column in table.c:
+        if (
+            column.key not in keys
+            and not column.nullable
+            and column.default is None
+            and column.server_default is None
+        ):
+            raise SeedDataError(f"{table.name}: {column.key} is required")
+
+    checked = []
+    for i, row in enumerate(rows):
+        out = {}
+        for key in keys:
+            column = table.c[key]
+            default = column.default
+            value = row.get(
+                key, default.arg if default is not None and default.is_scalar else None
+            )
+            if value is None:
+                if not column.nullable:
+                    raise SeedDataError(f"{table.name}[{i}]: {key} is required")
+            else:
+                expected = column.type.python_type
+                if expected is Decimal:
+                    expected = (int, float, Decimal)
+                if not isinstance(value, expected):
+                    kind = type(value).__name__
+                    raise SeedDataError(
+                        f"{table.name}[{i}]: {key} has the wrong type {kind}"
+                    )
+                length = getattr(column.type, "length", None)
+                if isinstance(value, str) and length and len(value) > length:
+                    raise SeedDataError(
+                        f"{table.name}[{i}]: {key} is longer than {length} characters"
+                    )
+            out[key] = value
+        checked.append(out)
+    return checked
+
+
+async def applied_seed_hashes(db: AsyncSession) -> dict[str, str]:
+    result = await db.execute(select(SeedVersion.name, SeedVersion.content_hash))
+    return dict(result.tuples().all())
+
+
+async def mark_seed_applied(db: AsyncSession, name: str, digest: str) -> None:
+    stmt = insert_for(db, SeedVersion).values(
+        name=name, content_hash=digest, applied_at=datetime.utcnow()
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "content_hash": stmt.excluded.content_hash,
+                "applied_at": stmt.excluded.applied_at,
+            },
+        )
+    )
+
+
+async def upsert_shared(
+    db: AsyncSession, model: type, rows: Sequence[dict[str, Any]]
+) -> None:
+    """Write shared rows with deterministic ids, overwriting earlier versions.
+
+    Tracked models are stamped on the change feed with no owner, so every
+    user's next pull picks them up.
+    """
+    if not rows:
+        return
+    rows = validate_rows(model, rows)
+    await bulk_upsert(
+        db,
+        model,
+        rows,
+        index_elements=["id"],
+        update_columns=sorted(rows[0].keys() - {"id"}),
+    )
+    if model in TRACKED_MODELS:
+        await record_changes(db, None, {model: [row["id"] for row in rows]})
+    await bump_catalog_versions(db, [SHARED_SCOPE])
+
+
+async def delete_stale_shared(
+    db: AsyncSession,
+    model: type,
+    rows: Sequence[dict[str, Any]],
+    *criteria: ColumnElement[bool],
+) -> list[str]:
+    """Delete the shared rows matching ``criteria`` that ``rows`` no longer define.
+
+    ``criteria`` select the children of the parents being re-seeded; the
+    upsert only overwrites ids that still exist, so without this a row
+    dropped from the data would stay attached to its parent. Children go
+    before their parents: SQLite does not cascade the deletes. Returns the
+    deleted ids.
+    """
+    result = await db.execute(
+        delete(model)
+        .where(*criteria, model.id.not_in([row["id"] for row in rows]))
+        .returning(model.id)
+        .execution_options(synchronize_session=False)
+    )
+    ids = list(result.scalars().all())
+    if ids:
+        if model in TRACKED_MODELS:
+            await record_changes(db, None, {model: ids}, deleted=True)
+        await bump_catalog_versions(db, [SHARED_SCOPE])
+    return ids
+
+
+async def shared_exercise_ids(db: AsyncSession) -> dict[str, str]:
+    """Map shared exercise names to ids."""
+    result = await db.execute(
+        select(Exercise.name, Exercise.id).where(Exercise.user_id.is_(None))
+    )
+    return dict(result.tuples().all())
+
+
+async def insert_missing_exercises(
+    db: AsyncSession,
+    datasets: Iterable[Sequence[dict[str, Any]]],
+    substitutions: Iterable[dict[str, Any]] = (),
+) -> None:
+    """Add shared exercises and substitutions that do not exist yet.
+
+    Exercises are matched by name, so the first dataset to define a name wins.
+    Substitutions name an ``exercise``, its ``substitute`` and a ``priority``.
+    """
+    name_to_id = await shared_exercise_ids(db)
+    new_rows: dict[str, dict[str, Any]] = {}
+    for dataset in datasets:
+        for data in dataset:
+            if data["name"] in name_to_id or data["name"] in new_rows:
+                continue
+            new_rows[data["name"]] = dict(data, user_id=None, is_custom=False)
+    if new_rows:
+        result = await db.execute(
+            insert_for(db, Exercise).returning(Exercise.name, Exercise.id),
+            validate_rows(Exercise, list(new_rows.values())),
+        )
+        name_to_id.update(result.tuples().all())
+        await bump_catalog_versions(db, [SHARED_SCOPE])
+
+    try:
+        pairs = {
+            (name_to_id[sub["exercise"]], name_to_id[sub["substitute"]]): sub[
+                "priority"
+            ]
+            for sub in substitutions
+        }
+    except KeyError as exc:
+        raise SeedDataError(f"exercise_substitutions: unknown exercise {exc}") from None
+    if not pairs:
+        return
+    result = await db.execute(
+        select(
+            ExerciseSubstitution.exercise_id,
+            ExerciseSubstitution.substitute_exercise_id,
+        ).where(
+            tuple_(
+                ExerciseSubstitution.exercise_id,
+                ExerciseSubstitution.substitute_exercise_id,
+            ).in_(list(pairs))
+        )
+    )
+    for pair in result.tuples().all():
+        pairs.pop(pair, None)
+    if pairs:
+        await db.execute(
+            insert_for(db, ExerciseSubstitution),
+            validate_rows(
+                ExerciseSubstitution,
+                [
+                    dict(
+                        exercise_id=exercise_id,
+                        substitute_exercise_id=substitute_id,
+                        priority=priority,
+                    )
+                    for (exercise_id, substitute_id), priority in pairs.items()
+                ],
+            ),
+        )
+        await bump_catalog_versions(db, [SHARED_SCOPE])
+
+
+def exercise_id_for(name_to_id: dict[str, str], dataset: str, name: str) -> str:
+    """The shared exercise ``dataset`` refers to by ``name``."""
+    try:
+        return name_to_id[name]
+    except KeyError:
+        raise SeedDataError(f"{dataset}: unknown exercise {name!r}") from None
+
+
+def _without(data: dict[str, Any], *keys: str) -> dict[str, Any]:
+    return {k: v for k, v in data.items() if k not in keys}
+
+
+async def seed_phased_program(
+    db: AsyncSession,
+    program_id: str,
+    dataset: str,
+    shared_id: Any,
+    key: str,
+) -> None:
+    """Upsert a shared phased program blueprint in one statement per table.
+
+    ``shared_id(f"{key}:...")`` must produce the same ids the program has
+    always been seeded with, so existing rows are updated rather than copied.
+    Fields in the dataset other than the nesting and exercise names are
+    written to the matching column as-is; every exercise it names must
+    already be seeded.
+    """
+    data = load_dataset(dataset)
+    name_to_id = await shared_exercise_ids(db)
+
+    def exercise_id(name: str | None) -> str | None:
+        return exercise_id_for(name_to_id, dataset, name) if name else None
+
+    phases, workouts, sections, exercises = [], [], [], []
+
+    for phase_order, phase_data in enumerate(data["phases"]):
+        phase_id = shared_id(f"{key}:phase:{phase_order}")
+        phases.append(
+            dict(
+                _without(phase_data, "workouts"),
+                id=phase_id,
+                program_id=program_id,
+                order=phase_order,
+            )
+        )
+        for workout_data in phase_data["workouts"]:
+            slot = (
+                f"{phase_order}:{workout_data['day_index']}"
+                f":{workout_data['week_number']}"
+            )
+            workout_id = shared_id(f"{key}:workout:{slot}")
+            workouts.append(
+                dict(
+                    _without(workout_data, "sections"), id=workout_id, phase_id=phase_id
+                )
+            )
+            for section_order, section_data in enumerate(workout_data["sections"]):
+                section_id = shared_id(f"{key}:section:{slot}:{section_order}")
+                sections.append(
+                    dict(
+                        _without(section_data, "exercises"),
+                        id=section_id,
+                        workout_id=workout_id,
+                        order=section_order,
+                    )
+                )
+                for ex_order, ex_data in enumerate(section_data["exercises"]):
+                    exercises.append(
+                        dict(
+                            _without(ex_data, "name", "sub1", "sub2"),
+                            id=shared_id(
+                                f"{key}:pwe:{slot}:{section_order}:{ex_order}"
+                            ),
+                            section_id=section_id,
+                            exercise_id=exercise_id(ex_data["name"]),
+                            order=ex_order,
+                            substitute1_exercise_id=exercise_id(ex_data.get("sub1")),
+                            substitute2_exercise_id=exercise_id(ex_data.get("sub2")),
+                        )
+                    )
+
+    phase_ids = select(ProgramPhase.id).where(ProgramPhase.program_id == program_id)
+    workout_ids = select(PhaseWorkout.id).where(PhaseWorkout.phase_id.in_(phase_ids))
+    section_ids = select(PhaseWorkoutSection.id).where(
+        PhaseWorkoutSection.workout_id.in_(workout_ids)
+    )
+    await delete_stale_shared(
+        db,
+        PhaseWorkoutExercise,
+        exercises,
+        PhaseWorkoutExercise.section_id.in_(section_ids),
+    )
+    await delete_stale_shared(
+        db,
+        PhaseWorkoutSection,
+        sections,
+        PhaseWorkoutSection.workout_id.in_(workout_ids),
+    )
+    # Logged sessions keep their history but lose the link to a dropped workout
+    stale_workouts = workout_ids.where(
+        PhaseWorkout.id.not_in([row["id"] for row in workouts])
+    )
+    detached = await db.execute(
+        update(WorkoutSession)
+        .where(WorkoutSession.phase_workout_id.in_(stale_workouts))
+        .values(phase_workout_id=None)
+        .returning(WorkoutSession.user_id, WorkoutSession.id)
+        .execution_options(synchronize_session=False)
+    )
+    by_user: dict[str, list[str]] = {}
+    for user_id, session_id in detached.tuples().all():
+        by_user.setdefault(user_id, []).append(session_id)
+    for user_id, session_ids in by_user.items():
+        await record_changes(db, user_id, {WorkoutSession: session_ids})
+    await delete_stale_shared(
+        db, PhaseWorkout, workouts, PhaseWorkout.phase_id.in_(phase_ids)
+    )
+    await delete_stale_shared(
+        db, ProgramPhase, phases, ProgramPhase.program_id == program_id
+    )
+
+    await upsert_shared(
+        db,
+        Program,
+        [
+            dict(
+                _without(data, "phases"),
+                id=program_id,
+                user_id=None,
+                program_type="phased",
+            )
+        ],
+    )
+    await upsert_shared(db, ProgramPhase, phases)
+    await upsert_shared(db, PhaseWorkout, workouts)
+    await upsert_shared(db, PhaseWorkoutSection, sections)
+    await upsert_shared(db, PhaseWorkoutExercise, exercises)
@@ -0,0 +1,61 @@
+"""Fast JSON rendering for read endpoints.
+
+By default FastAPI validates a route's return value against its
+``response_model``, dumps the result to JSON-compatible Python and then
+encodes that with the stdlib ``json`` module. :class:`ORJSONResponse` is the
+app's default response class, so that last step goes through orjson for
+every route. Large endpoints skip the first two steps as well: they select
+plain row mappings, shape them into the response schema's fields and
+return the response object directly, which FastAPI sends untouched. The
+route's ``response_model`` still documents the payload.
+
+Decimal policy: weights, volumes and RPE are encoded as JSON strings with
+their stored precision, e.g. ``"102.50"``. That is what Pydantic's JSON mode
+produces, so both paths emit the same bytes for the same values.
+"""
+
+from collections.abc import Iterable, Mapping
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from sqlalchemy import Column
+
+from app.database import Base
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def schema_columns(schema: type, model: type[Base]) -> list[Column]:
+    """``model``'s columns that ``schema`` has fields for."""
+    table = model.__table__
+    return [table.c[name] for name in schema.model_fields if name in table.c]
+
+
+def shape(schema: type, row: Mapping[str, Any], **values: Any) -> dict[str, Any]:
+    """``row`` as a dict of exactly ``schema``'s fields, in field order.
+
+    ``values`` supply fields the row lacks, such as nested lists. A field
+    with no value raises KeyError instead of silently dropping out.
+    """
+    data = {**row, **values} if values else row
+    return {name: data[name] for name in schema.model_fields}
+
+
+def rows_response(schema: type, rows: Iterable[Mapping[str, Any]]) -> ORJSONResponse:
+    """Render rows as a JSON array of ``schema`` objects without validating them."""
+    return ORJSONResponse([shape(schema, row) for row in rows])
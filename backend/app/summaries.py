@@ -0,0 +1,66 @@
+"""Per-session totals stored on ``workout_sessions``.
+
+Every path that writes sets calls :func:`refresh_session_summaries` for the
+sessions it touched, which recomputes their working-set count, working
+volume and number of distinct exercises from those sessions' sets in one
+``UPDATE``. Session lists and history can then show totals without reading
+``workout_sets``. :func:`rebuild_session_summaries` backfills every session
+and runs as part of ``python -m app.rollups``.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.changes import record_changes
+from app.models import WorkoutSession, WorkoutSet
+
+
+def _per_session(value: Any, *criteria: ColumnElement[bool]) -> Any:
+    """``value`` aggregated over the sets of the session being updated."""
+    return (
+        select(value)
+        .where(WorkoutSet.session_id == WorkoutSession.id, *criteria)
+        .scalar_subquery()
+    )
+
+
+_WORKING = WorkoutSet.set_type == "working"
+_SUMMARY_VALUES = dict(
+    working_set_count=_per_session(func.count(), _WORKING),
+    total_volume=func.coalesce(
+        _per_session(func.sum(WorkoutSet.reps * WorkoutSet.weight), _WORKING), 0
+    ),
+    exercise_count=_per_session(func.count(WorkoutSet.exercise_id.distinct())),
+)
+
+
+async def refresh_session_summaries(
+    db: AsyncSession, user_id: str, session_ids: Iterable[str]
+) -> None:
+    """Recompute the totals of the given sessions from their current sets."""
+    session_ids = list(dict.fromkeys(session_ids))
+    if not session_ids:
+        return
+    await db.execute(
+        update(WorkoutSession)
+        .where(WorkoutSession.id.in_(session_ids))
+        .values(**_SUMMARY_VALUES)
+    )
+    await record_changes(db, user_id, {WorkoutSession: session_ids})
+
+
+async def rebuild_session_summaries(
+    db: AsyncSession, user_id: str | None = None
+) -> int:
+    """Recompute the totals of every session, or one user's.
+
+    Returns the number of sessions updated. The caller commits.
+    """
+    stmt = update(WorkoutSession).values(**_SUMMARY_VALUES)
+    if user_id is not None:
+        stmt = stmt.where(WorkoutSession.user_id == user_id)
+    result = await db.execute(stmt.execution_options(synchronize_session=False))
+    return result.rowcount
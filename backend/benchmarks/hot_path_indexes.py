@@ -0,0 +1,382 @@
+"""Benchmark the hot-path indexes from migrations 0004, 0008 and 0010.
+
+Builds a synthetic multi-user training history, then times the route queries
+and prints their plans with the composite indexes dropped and recreated::
+
+    python -m benchmarks.hot_path_indexes
+    python -m benchmarks.hot_path_indexes --url postgresql+asyncpg://u:p@host/scratch
+
+Defaults to an in-memory SQLite database. A Postgres URL must point at an
+empty scratch database: the tables are created and dropped by the script.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import Select, func, insert, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+import app.database as _db_module
+
+HOT_PATH_INDEXES = (
+    "ix_workout_sessions_user_id_started_at_id",
+    "ix_workout_sessions_user_id_year_week",
+    "ix_workout_sets_session_id_exercise_id",
+    "ix_workout_sets_exercise_id",
+    "ix_template_exercises_template_id_week_type_order",
+    "ix_phase_workouts_phase_id_week_number_day_index",
+    "ix_program_routines_program_id_order",
+    "ix_program_phases_program_id_order",
+    "ix_phase_workout_sections_workout_id_order",
+    "ix_phase_workout_exercises_section_id_order",
+)
+
+MUSCLE_GROUPS = ("chest", "back", "legs", "shoulders", "arms", "core")
+CHUNK = 5000
+
+
+def _uuid() -> str:
+    return str(uuid.uuid4())
+
+
+def build_dataset(
+    m, users: int, years: int, sessions_per_week: int, sets_per_session: int
+) -> dict[type, list[dict]]:
+    """Generate rows for every table touched by the benchmarked queries."""
+    rng = random.Random(42)
+    now = datetime(2026, 1, 1)
+    rows: dict[type, list[dict]] = {model: [] for model in _insert_order(m)}
+
+    exercises = [
+        dict(
+            id=_uuid(),
+            name=f"Exercise {i}",
+            muscle_group=MUSCLE_GROUPS[i % len(MUSCLE_GROUPS)],
+            equipment="barbell",
+            is_custom=False,
+        )
+        for i in range(60)
+    ]
+    rows[m.Exercise] = exercises
+    exercise_ids = [e["id"] for e in exercises]
+
+    weeks = years * 52
+    for u in range(users):
+        user_id = _uuid()
+        rows[m.User].append(
+            dict(id=user_id, email=f"user{u}@bench.local", display_name=f"User {u}")
+        )
+
+        template_ids = []
+        for t in range(4):
+            template_id = _uuid()
+            template_ids.append(template_id)
+            rows[m.WorkoutTemplate].append(
+                dict(id=template_id, user_id=user_id, name=f"Day {t}")
+            )
+            for week_type in ("normal", "deload"):
+                for order, exercise_id in enumerate(rng.sample(exercise_ids, 6)):
+                    rows[m.TemplateExercise].append(
+                        dict(
+                            id=_uuid(),
+                            template_id=template_id,
+                            exercise_id=exercise_id,
+                            week_type=week_type,
+                            order=order,
+                            working_sets=3,
+                            min_reps=6,
+                            max_reps=10,
+                            early_set_rpe_min=7,
+                            early_set_rpe_max=8,
+                            last_set_rpe_min=9,
+                            last_set_rpe_max=10,
+                            rest_period="2-3 min",
+                        )
+                    )
+
+        program_id = _uuid()
+        rows[m.Program].append(
+            dict(id=program_id, user_id=user_id, name="Phased", program_type="phased")
+        )
+        for order, template_id in enumerate(template_ids):
+            rows[m.ProgramRoutine].append(
+                dict(
+                    id=_uuid(),
+                    program_id=program_id,
+                    template_id=template_id,
+                    order=order,
+                )
+            )
+        for p in range(3):
+            phase_id = _uuid()
+            rows[m.ProgramPhase].append(
+                dict(
+                    id=phase_id,
+                    program_id=program_id,
+                    name=f"Phase {p}",
+                    order=p,
+                    duration_weeks=6,
+                )
+            )
+            for week in range(1, 7):
+                for day in range(5):
+                    workout_id = _uuid()
+                    rows[m.PhaseWorkout].append(
+                        dict(
+                            id=workout_id,
+                            phase_id=phase_id,
+                            name=f"W{week}D{day}",
+                            week_number=week,
+                            day_index=day,
+                        )
+                    )
+                    for s in range(2):
+                        section_id = _uuid()
+                        rows[m.PhaseWorkoutSection].append(
+                            dict(
+                                id=section_id,
+                                workout_id=workout_id,
+                                name=f"Block {s}",
+                                order=s,
+                            )
+                        )
+                        for order, exercise_id in enumerate(
+                            rng.sample(exercise_ids, 4)
+                        ):
+                            rows[m.PhaseWorkoutExercise].append(
+                                dict(
+                                    id=_uuid(),
+                                    section_id=section_id,
+                                    exercise_id=exercise_id,
+                                    order=order,
+                                    working_sets=3,
+                                    reps_display="8-10",
+                                )
+                            )
+
+        start = now - timedelta(weeks=weeks)
+        for week in range(weeks):
+            for day in range(sessions_per_week):
+                started_at = start + timedelta(weeks=week, days=day * 2, hours=18)
+                iso = started_at.isocalendar()
+                session_id = _uuid()
+                rows[m.WorkoutSession].append(
+                    dict(
+                        id=session_id,
+                        user_id=user_id,
+                        template_id=template_ids[day % len(template_ids)],
+                        year_week=f"{iso.year}-{iso.week:02d}",
+                        week_type="deload" if week % 6 == 5 else "normal",
+                        started_at=started_at,
+                        finished_at=started_at + timedelta(hours=1),
+                        synced=True,
+                    )
+                )
+                for n in range(sets_per_session):
+                    rows[m.WorkoutSet].append(
+                        dict(
+                            id=_uuid(),
+                            session_id=session_id,
+                            exercise_id=rng.choice(exercise_ids),
+                            set_type="warmup" if n % 6 == 0 else "working",
+                            set_number=n + 1,
+                            reps=rng.randint(5, 12),
+                            weight=rng.randint(20, 200),
+                            created_at=started_at,
+                        )
+                    )
+    return rows
+
+
+def _insert_order(m) -> tuple[type, ...]:
+    return (
+        m.Exercise,
+        m.User,
+        m.WorkoutTemplate,
+        m.TemplateExercise,
+        m.Program,
+        m.ProgramRoutine,
+        m.ProgramPhase,
+        m.PhaseWorkout,
+        m.PhaseWorkoutSection,
+        m.PhaseWorkoutExercise,
+        m.WorkoutSession,
+        m.WorkoutSet,
+    )
+
+
+def build_queries(m, sample: dict[str, str]) -> dict[str, Select]:
+    """The statements issued by the routes that the new indexes target."""
+    user_id = sample["user_id"]
+    return {
+        "list_sessions": select(m.WorkoutSession)
+        .where(m.WorkoutSession.user_id == user_id)
+        .order_by(m.WorkoutSession.started_at.desc(), m.WorkoutSession.id.desc())
+        .limit(50),
+        "sessions_in_week": select(m.WorkoutSession).where(
+            m.WorkoutSession.user_id == user_id,
+            m.WorkoutSession.year_week == sample["year_week"],
+        ),
+        "session_sets": select(m.WorkoutSet).where(
+            m.WorkoutSet.session_id == sample["session_id"]
+        ),
+        "exercise_history": select(m.WorkoutSet)
+        .join(m.WorkoutSession, m.WorkoutSet.session_id == m.WorkoutSession.id)
+        .where(
+            m.WorkoutSet.exercise_id == sample["exercise_id"],
+            m.WorkoutSession.user_id == user_id,
+        ),
+        "stats_volume": select(
+            m.WorkoutSession.year_week,
+            m.Exercise.muscle_group,
+            func.sum(m.WorkoutSet.reps * m.WorkoutSet.weight),
+        )
+        .join(m.WorkoutSession, m.WorkoutSet.session_id == m.WorkoutSession.id)
+        .join(m.Exercise, m.WorkoutSet.exercise_id == m.Exercise.id)
+        .where(
+            m.WorkoutSession.user_id == user_id,
+            m.WorkoutSet.set_type == "working",
+            m.WorkoutSession.year_week.isnot(None),
+        )
+        .group_by(m.WorkoutSession.year_week, m.Exercise.muscle_group)
+        .order_by(m.WorkoutSession.year_week),
+        "today_template": select(m.TemplateExercise)
+        .where(
+            m.TemplateExercise.template_id == sample["template_id"],
+            m.TemplateExercise.week_type == "normal",
+        )
+        .order_by(m.TemplateExercise.order),
+        "today_phase_workout": select(m.PhaseWorkout).where(
+            m.PhaseWorkout.phase_id == sample["phase_id"],
+            m.PhaseWorkout.week_number == 3,
+            m.PhaseWorkout.day_index == 2,
+        ),
+        "phase_sections": select(m.PhaseWorkoutSection)
+        .where(m.PhaseWorkoutSection.workout_id == sample["workout_id"])
+        .order_by(m.PhaseWorkoutSection.order),
+        "program_routines": select(m.ProgramRoutine)
+        .where(m.ProgramRoutine.program_id == sample["program_id"])
+        .order_by(m.ProgramRoutine.order),
+    }
+
+
+async def explain(conn: AsyncConnection, stmt: Select) -> list[str]:
+    dialect = conn.dialect
+    sql = str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    if dialect.name == "postgresql":
+        result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {sql}")
+        return [row[0] for row in result]
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+    return [row[-1] for row in result]
+
+
+async def time_query(conn: AsyncConnection, stmt: Select, repeat: int) -> float:
+    """Median wall time in milliseconds, rows fully fetched."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        (await conn.execute(stmt)).all()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def measure(
+    conn: AsyncConnection, queries: dict[str, Select], repeat: int
+) -> dict[str, tuple[float, list[str]]]:
+    await conn.exec_driver_sql("ANALYZE")
+    return {
+        name: (await time_query(conn, stmt, repeat), await explain(conn, stmt))
+        for name, stmt in queries.items()
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    if args.url.startswith("sqlite"):
+        _db_module.Base.metadata.schema = None
+    from app import models as m
+
+    metadata = _db_module.Base.metadata
+    indexes = {ix.name: ix for table in metadata.sorted_tables for ix in table.indexes}
+    hot_path = [indexes[name] for name in HOT_PATH_INDEXES]
+
+    engine = create_async_engine(args.url)
+    async with engine.begin() as conn:
+        if metadata.schema:
+            await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {metadata.schema}"))
+        has_users = await conn.run_sync(
+            lambda sync: inspect(sync).has_table("users", schema=metadata.schema)
+        )
+        if has_users:
+            raise SystemExit("Refusing to run: target database already has tables")
+        await conn.run_sync(metadata.create_all)
+
+    try:
+        print("Generating dataset...", flush=True)
+        rows = build_dataset(
+            m, args.users, args.years, args.sessions_per_week, args.sets_per_session
+        )
+        async with engine.begin() as conn:
+            for model, model_rows in rows.items():
+                for i in range(0, len(model_rows), CHUNK):
+                    await conn.execute(
+                        insert(model.__table__), model_rows[i : i + CHUNK]
+                    )
+        print(", ".join(f"{model.__tablename__}={len(r)}" for model, r in rows.items()))
+
+        session = rows[m.WorkoutSession][len(rows[m.WorkoutSession]) // 2]
+        workout = rows[m.PhaseWorkout][0]
+        sample = dict(
+            user_id=session["user_id"],
+            year_week=session["year_week"],
+            session_id=session["id"],
+            exercise_id=rows[m.Exercise][0]["id"],
+            template_id=session["template_id"],
+            phase_id=workout["phase_id"],
+            workout_id=workout["id"],
+            program_id=rows[m.ProgramRoutine][0]["program_id"],
+        )
+        queries = build_queries(m, sample)
+
+        async with engine.begin() as conn:
+            for ix in hot_path:
+                await conn.run_sync(ix.drop)
+            before = await measure(conn, queries, args.repeat)
+            for ix in hot_path:
+                await conn.run_sync(ix.create)
+            after = await measure(conn, queries, args.repeat)
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+        await engine.dispose()
+
+    print(f"\n{'query':<22}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name in queries:
+        b, a = before[name][0], after[name][0]
+        print(f"{name:<22}{b:>12.3f}{a:>12.3f}{b / a if a else 0:>9.1f}x")
+
+    for name in queries:
+        print(f"\n== {name}")
+        print("-- before")
+        print("\n".join(f"   {line}" for line in before[name][1]))
+        print("-- after")
+        print("\n".join(f"   {line}" for line in after[name][1]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--sessions-per-week", type=int, default=4)
+    parser.add_argument("--sets-per-session", type=int, default=18)
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Benchmark response serialization of the large read endpoints.
+
+Seeds an in-memory SQLite database with the shared exercises and programs
+plus a synthetic training history for one user, then times full requests
+through the ASGI app (query, serialization and encoding) for each endpoint::
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --years 10 --repeat 50
+
+Request timings include database work. To isolate serialization, each
+endpoint's payload is also rendered both ways in the same run: through
+orjson as the routes now do, and through the stdlib path FastAPI takes by
+default (validate against the route's ``response_model``, dump it to JSON
+mode, encode with ``json``).
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import app.database as _db_module
+
+# SQLite has no schemas; must happen before the models are imported
+_db_module.Base.metadata.schema = None
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import APIRoute  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool  # noqa: E402
+from starlette.routing import Match  # noqa: E402
+
+from app.dependencies import get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import (  # noqa: E402
+    Exercise,
+    ExerciseProgress,
+    User,
+    WeeklyVolume,
+)
+from app.seed import run_seeds  # noqa: E402
+from app.seed_minimalift_5day import SHARED_MINIMALIFT_5DAY_PROGRAM_ID  # noqa: E402
+from app.serialization import ORJSONResponse  # noqa: E402
+
+EMAIL = "bench@bench.local"
+MUSCLE_GROUPS = ("chest", "back", "legs", "shoulders", "arms", "core")
+
+
+def _endpoints() -> dict[str, str]:
+    return {
+        "list_exercises": "/api/exercises",
+        "list_all_progress": "/api/progress",
+        "list_phases": f"/api/programs/{SHARED_MINIMALIFT_5DAY_PROGRAM_ID}/phases",
+        "stats_volume": "/api/stats/volume",
+    }
+
+
+def _p95(timings: list[float]) -> float:
+    """Nearest-rank 95th percentile of sorted ``timings``."""
+    return timings[math.ceil(len(timings) * 0.95) - 1]
+
+
+def _median_ms(render: Callable[[], bytes], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def _response_model(url: str) -> object:
+    scope = {"type": "http", "method": "GET", "path": url}
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.matches(scope)[0] == Match.FULL:
+            return route.response_model
+    raise LookupError(url)
+
+
+def _renderers(url: str, body: bytes) -> tuple[Callable[[], bytes], ...]:
+    """Render ``body``'s payload through orjson and through the stdlib path."""
+    adapter = TypeAdapter(_response_model(url))
+    # What the routes hand to ORJSONResponse: plain values, Decimals intact
+    content = adapter.dump_python(adapter.validate_json(body))
+
+    def fast() -> bytes:
+        return ORJSONResponse(content).body
+
+    def stdlib() -> bytes:
+        validated = adapter.validate_python(content)
+        return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+    return fast, stdlib
+
+
+async def _populate(db: AsyncSession, years: int) -> None:
+    rng = random.Random(42)
+    await run_seeds(db)
+    user_id = str(uuid.uuid4())
+    await db.execute(insert(User).values(id=user_id, email=EMAIL, display_name="Bench"))
+    exercise_ids = [
+        row.id for row in (await db.execute(Exercise.__table__.select())).all()
+    ]
+    start = datetime(2026, 1, 1) - timedelta(weeks=52 * years)
+    weeks = [(start + timedelta(weeks=w)).isocalendar() for w in range(52 * years)]
+    year_weeks = [f"{iso.year}-{iso.week:02d}" for iso in weeks]
+    await db.execute(
+        insert(ExerciseProgress),
+        [
+            dict(
+                id=str(uuid.uuid4()),
+                user_id=user_id,
+                exercise_id=exercise_id,
+                year_week=year_week,
+                max_weight=rng.randint(20, 200),
+            )
+            for year_week in year_weeks
+            for exercise_id in rng.sample(exercise_ids, 12)
+        ],
+    )
+    await db.execute(
+        insert(WeeklyVolume),
+        [
+            dict(
+                id=str(uuid.uuid4()),
+                user_id=user_id,
+                year_week=year_week,
+                muscle_group=group,
+                total_volume=rng.randint(1000, 20000),
+                set_count=rng.randint(5, 30),
+            )
+            for year_week in year_weeks
+            for group in MUSCLE_GROUPS
+        ],
+    )
+    await db.commit()
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(_db_module.Base.metadata.create_all)
+    async with sessions() as db:
+        await _populate(db, args.years)
+
+    async def override_get_db():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        headers={"Remote-Email": EMAIL},
+    ) as client:
+        print(
+            f"{'endpoint':<20}{'bytes':>10}{'median ms':>12}{'p95 ms':>10}"
+            f"{'orjson ms':>12}{'stdlib ms':>12}{'speedup':>10}"
+        )
+        for name, url in _endpoints().items():
+            resp = await client.get(url)
+            resp.raise_for_status()
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                (await client.get(url)).raise_for_status()
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            fast, stdlib = (
+                _median_ms(render, args.repeat)
+                for render in _renderers(url, resp.content)
+            )
+            print(
+                f"{name:<20}{len(resp.content):>10}"
+                f"{statistics.median(timings):>12.2f}{_p95(timings):>10.2f}"
+                f"{fast:>12.2f}{stdlib:>12.2f}{stdlib / fast:>9.1f}x"
+            )
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=30)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
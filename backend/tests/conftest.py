@@ -1,5 +1,6 @@
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
 
 import pytest
 import pytest_asyncio
@@ -12,8 +13,11 @@ import app.database as _db_module
 _db_module.Base.metadata.schema = None
 
 from app.database import Base  # noqa: E402
-from app.dependencies import get_db  # noqa: E402
+from app.dependencies import get_db, identity_cache  # noqa: E402
 from app.main import app  # noqa: E402
+from app.performance import last_performance_cache  # noqa: E402
+from app.plans import plan_cache  # noqa: E402
+from app.query_stats import QueryStats, collect_queries  # noqa: E402
 from app.seed import seed_exercises  # noqa: E402
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -31,6 +35,18 @@ AUTHELIA_HEADERS = {
 }
 
 
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """Fail if the block runs more than ``limit`` SQL statements.
+
+    The failure lists every statement shape with its count, so an N+1 loop
+    stands out.
+    """
+    with collect_queries() as stats:
+        yield stats
+    assert stats.count <= limit, f"query budget is {limit}, ran {stats.report()}"
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     loop = asyncio.new_event_loop()
@@ -56,6 +72,9 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    identity_cache.clear()
+    plan_cache.clear()
+    last_performance_cache.clear()
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
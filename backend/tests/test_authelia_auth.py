@@ -60,3 +60,43 @@ async def test_existing_user_matched_by_email(client: AsyncClient):
     resp2 = await client.get("/api/auth/me", headers=headers)
     assert resp2.json()["id"] == user_id
     assert resp2.json()["display_name"] == "Original Name"
+
+
+@pytest.mark.asyncio
+async def test_repeat_requests_hit_identity_cache(client: AsyncClient):
+    """Subsequent requests resolve the user from the cache, not the DB."""
+    headers = {
+        "Remote-User": "cacheduser",
+        "Remote-Email": "cached@example.com",
+        "Remote-Name": "Cached User",
+        "Remote-Groups": "users",
+    }
+    await client.get("/api/auth/me", headers=headers)
+    before = (await client.get("/health/identity-cache")).json()
+
+    for _ in range(3):
+        resp = await client.get("/api/auth/me", headers=headers)
+        assert resp.status_code == 200
+
+    after = (await client.get("/health/identity-cache")).json()
+    assert after["hits"] - before["hits"] == 3
+    assert after["misses"] == before["misses"]
+
+
+@pytest.mark.asyncio
+async def test_profile_update_invalidates_identity_cache(client: AsyncClient):
+    """Updating the profile is visible on the next request."""
+    headers = {
+        "Remote-User": "renamed",
+        "Remote-Email": "renamed@example.com",
+        "Remote-Name": "Before",
+        "Remote-Groups": "users",
+    }
+    await client.get("/api/auth/me", headers=headers)
+    resp = await client.put(
+        "/api/auth/me", headers=headers, json={"display_name": "After"}
+    )
+    assert resp.json()["display_name"] == "After"
+
+    resp = await client.get("/api/auth/me", headers=headers)
+    assert resp.json()["display_name"] == "After"
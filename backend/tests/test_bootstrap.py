@@ -0,0 +1,95 @@
+"""Tests for the single-request bootstrap snapshot."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.seed import SHARED_JN_PROGRAM_ID, seed_default_program
+from app.seed_minimalift import seed_minimalift_program
+from app.database import settings
+from tests.conftest import assert_max_queries
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_returns_full_catalog(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession
+):
+    await seed_default_program(db_session)
+    await seed_minimalift_program(db_session)
+
+    session = (
+        await auth_seeded_client.post(
+            "/api/sessions", json={"week_type": "normal", "year_week": "2025-27"}
+        )
+    ).json()
+
+    resp = await auth_seeded_client.get("/api/bootstrap")
+    assert resp.status_code == 200
+    data = resp.json()
+
+    assert any(e["substitutions"] for e in data["exercises"])
+    jn_templates = [t for t in data["templates"] if t["template_exercises"]]
+    assert len(jn_templates) == 5
+    names = {p["name"] for p in data["programs"]}
+    assert "Jeff Nippard 5 Day Program" in names
+    rotating = next(p for p in data["programs"] if p["program_type"] == "rotating")
+    assert rotating["routine_count"] == len(rotating["routines"]) == 5
+    phased = next(p for p in data["programs"] if p["program_type"] == "phased")
+    phases = [ph for ph in data["phases"] if ph["program_id"] == phased["id"]]
+    assert phases and all(ph["workouts"] for ph in phases)
+    first_exercise = phases[0]["workouts"][0]["sections"][0]["exercises"][0]
+    assert first_exercise["exercise_name"]
+    assert [s["id"] for s in data["sessions"]] == [session["id"]]
+    assert data["sessions"][0]["sets"] == []
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_query_count_is_constant(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession
+):
+    await seed_default_program(db_session)
+    await seed_minimalift_program(db_session)
+    await auth_seeded_client.post(f"/api/programs/{SHARED_JN_PROGRAM_ID}/activate")
+    exercise_id = (await auth_seeded_client.get("/api/exercises")).json()[0]["id"]
+    with assert_max_queries(settings.QUERY_BUDGET) as before:
+        assert (await auth_seeded_client.get("/api/bootstrap")).status_code == 200
+
+    template_ids = []
+    for i in range(5):
+        resp = await auth_seeded_client.post(
+            "/api/templates",
+            json={
+                "name": f"Custom {i}",
+                "template_exercises": [
+                    {
+                        "exercise_id": exercise_id,
+                        "week_type": "normal",
+                        "order": 0,
+                        "working_sets": 3,
+                        "min_reps": 8,
+                        "max_reps": 12,
+                        "early_set_rpe_min": 7,
+                        "early_set_rpe_max": 8,
+                        "last_set_rpe_min": 8,
+                        "last_set_rpe_max": 9,
+                        "rest_period": "2 min",
+                        "warmup_sets": 1,
+                    }
+                ],
+            },
+        )
+        template_ids.append(resp.json()["id"])
+    await auth_seeded_client.post(
+        "/api/programs",
+        json={
+            "name": "Custom Rotation",
+            "routines": [
+                {"template_id": tid, "order": i} for i, tid in enumerate(template_ids)
+            ],
+        },
+    )
+
+    with assert_max_queries(before.count):
+        resp = await auth_seeded_client.get("/api/bootstrap")
+    assert resp.status_code == 200
+    assert len(resp.json()["templates"]) == 10
@@ -0,0 +1,98 @@
+"""Tests for response compression."""
+
+import gzip
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+
+from app.compression import CompressionMiddleware, available_codecs, negotiate
+
+
+def test_negotiate_prefers_client_rating_then_server_order():
+    offered = ["zstd", "br", "gzip"]
+    assert negotiate("gzip, br", offered) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", offered) == "gzip"
+    assert negotiate("*", offered) == "zstd"
+    assert negotiate("identity", offered) is None
+    assert negotiate("gzip;q=0, *;q=0.1", ["gzip"]) is None
+    assert negotiate("", offered) is None
+
+
+@pytest.mark.asyncio
+async def test_large_json_is_compressed(auth_seeded_client: AsyncClient):
+    plain = await auth_seeded_client.get(
+        "/api/exercises", headers={"Accept-Encoding": "identity"}
+    )
+    assert "Content-Encoding" not in plain.headers
+
+    resp = await auth_seeded_client.get(
+        "/api/exercises", headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["Vary"]
+    assert int(resp.headers["Content-Length"]) < len(plain.content) / 4
+    assert resp.json() == plain.json()
+
+    # The ETag is weakened, and still validates the cached copy
+    etag = resp.headers["ETag"]
+    assert etag == f"W/{plain.headers['ETag']}"
+    cached = await auth_seeded_client.get(
+        "/api/exercises",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+    # An uncompressed copy revalidates with its strong ETag intact
+    cached = await auth_seeded_client.get(
+        "/api/exercises",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": plain.headers["ETag"]},
+    )
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == plain.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_small_responses_are_not_compressed(client: AsyncClient):
+    resp = await client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert "Content-Encoding" not in resp.headers
+
+
+@pytest.mark.asyncio
+async def test_streams_are_compressed_chunk_by_chunk():
+    chunks = [b'{"row": %d}\n' % i * 50 for i in range(5)]
+
+    async def rows():
+        for chunk in chunks:
+            yield chunk
+
+    async def endpoint(request):
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+    async def text(request):
+        return StreamingResponse(iter([b"x" * 4096]), media_type="image/png")
+
+    app = CompressionMiddleware(
+        Starlette(routes=[Route("/rows", endpoint), Route("/image", text)]),
+        codecs=available_codecs(["gzip"], gzip_level=6, brotli_quality=4, zstd_level=3),
+        minimum_size=1024,
+        content_types=["application/x-ndjson"],
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        async with ac.stream(
+            "GET", "/rows", headers={"Accept-Encoding": "gzip"}
+        ) as resp:
+            assert resp.headers["Content-Encoding"] == "gzip"
+            raw = b"".join([chunk async for chunk in resp.aiter_raw()])
+        assert gzip.decompress(raw) == b"".join(chunks)
+
+        # Content types outside the allowlist pass through
+        resp = await ac.get("/image", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in resp.headers
+        assert resp.content == b"x" * 4096
@@ -2,6 +2,10 @@
 
 import pytest
 from httpx import AsyncClient
+from pydantic import TypeAdapter
+
+from app.schemas import ExerciseResponse
+from tests.conftest import assert_max_queries
 
 
 @pytest.mark.asyncio
@@ -16,6 +20,17 @@ async def test_list_exercises(auth_seeded_client: AsyncClient):
     assert "Barbell Bench Press" in names
     assert "Smith Machine Squat" in names
 
+    lying_leg_curl = next(e for e in data if e["name"] == "Lying Leg Curl")
+    substitutions = lying_leg_curl["substitutions"]
+    assert [s["priority"] for s in substitutions] == sorted(
+        s["priority"] for s in substitutions
+    )
+    assert all(s["substitute_exercise_name"] for s in substitutions)
+
+    # The hand-built payload is exactly what the response model would emit
+    adapter = TypeAdapter(list[ExerciseResponse])
+    assert adapter.dump_python(adapter.validate_python(data), mode="json") == data
+
 
 @pytest.mark.asyncio
 async def test_create_custom_exercise(auth_client: AsyncClient):
@@ -63,3 +78,39 @@ async def test_get_exercise_with_substitutions(auth_seeded_client: AsyncClient):
     subs_by_priority = sorted(data["substitutions"], key=lambda s: s["priority"])
     assert subs_by_priority[0]["priority"] == 1
     assert subs_by_priority[1]["priority"] == 2
+
+
+@pytest.mark.asyncio
+async def test_list_exercises_conditional_get(auth_seeded_client: AsyncClient):
+    first = await auth_seeded_client.get("/api/exercises")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    # Only the version lookup runs, never the listing itself
+    with assert_max_queries(1) as stats:
+        cached = await auth_seeded_client.get(
+            "/api/exercises", headers={"If-None-Match": f'"stale", {etag}'}
+        )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+    assert "catalog_versions" in next(iter(stats.shapes))
+
+    # A custom exercise changes the caller's catalog
+    await auth_seeded_client.post(
+        "/api/exercises", json={"name": "Cable Fly", "muscle_group": "Chest"}
+    )
+    changed = await auth_seeded_client.get(
+        "/api/exercises", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert "Cable Fly" in [e["name"] for e in changed.json()]
+
+    # Other users share the catalog but never each other's ETags
+    other = await auth_seeded_client.get(
+        "/api/exercises",
+        headers={"Remote-Email": "other@example.com", "If-None-Match": etag},
+    )
+    assert other.status_code == 200
+    assert other.headers["ETag"] not in (etag, changed.headers["ETag"])
@@ -0,0 +1,131 @@
+"""Tests for the streaming account export."""
+
+import csv
+import io
+from pathlib import Path
+
+import orjson
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.importer import import_history
+from app.models import User, WorkoutSet
+
+
+async def _log_history(client: AsyncClient) -> None:
+    """Two sessions of a template, with a custom exercise."""
+    custom = (
+        await client.post(
+            "/api/exercises", json={"name": "Cable Fly", "muscle_group": "Chest"}
+        )
+    ).json()
+    template = (
+        await client.post(
+            "/api/templates", json={"name": "Push Day", "template_exercises": []}
+        )
+    ).json()
+    for week in ("2025-26", "2025-27"):
+        session = (
+            await client.post(
+                "/api/sessions",
+                json={
+                    "template_id": template["id"],
+                    "week_type": "normal",
+                    "year_week": week,
+                },
+            )
+        ).json()
+        for n in (1, 2):
+            resp = await client.post(
+                f"/api/sessions/{session['id']}/sets",
+                json={
+                    "exercise_id": custom["id"],
+                    "set_type": "working",
+                    "set_number": n,
+                    "reps": 12,
+                    "weight": 20 + n,
+                },
+            )
+            assert resp.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_has_every_table(auth_seeded_client: AsyncClient):
+    await _log_history(auth_seeded_client)
+
+    resp = await auth_seeded_client.get("/api/export")
+    assert resp.status_code == 200
+    assert resp.headers["Content-Type"] == "application/x-ndjson"
+    assert "attachment" in resp.headers["Content-Disposition"]
+    records = [orjson.loads(line) for line in resp.content.splitlines()]
+
+    tables = [r["table"] for r in records]
+    assert tables.count("exercises") == 1  # custom exercises only
+    assert tables.count("templates") == 1
+    assert tables.count("sessions") == 2
+    assert tables.count("sets") == 4
+    assert tables.count("progress") == 2
+    first_set = next(r for r in records if r["table"] == "sets")
+    assert first_set["exercise"] == "Cable Fly"
+    assert first_set["workout"] == "Push Day"
+    assert first_set["weight"] == "21.00"
+
+    # Other users' rows never leak in
+    other = await auth_seeded_client.get(
+        "/api/export", headers={"Remote-Email": "other@example.com"}
+    )
+    assert other.status_code == 200
+    assert other.content == b""
+
+
+@pytest.mark.asyncio
+async def test_csv_export_round_trips_through_importer(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession, tmp_path: Path
+):
+    await _log_history(auth_seeded_client)
+
+    resp = await auth_seeded_client.get("/api/export?format=csv")
+    assert resp.status_code == 200
+    assert resp.headers["Content-Type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert len(rows) == 4
+    assert rows[0]["exercise"] == "Cable Fly"
+
+    empty = await auth_seeded_client.get("/api/export?format=csv&table=programs")
+    assert empty.text.startswith("id,user_id,name")
+    assert len(empty.text.splitlines()) == 1
+
+    # Import the export into a fresh account
+    await auth_seeded_client.get(
+        "/api/auth/me", headers={"Remote-Email": "other@example.com"}
+    )
+    other_id = await db_session.scalar(
+        select(User.id).where(User.email == "other@example.com")
+    )
+    path = tmp_path / "export.csv"
+    path.write_bytes(resp.content)
+    stats = await import_history(db_session, other_id, path)
+    assert (stats.sessions, stats.sets, stats.exercises_created) == (2, 4, 1)
+    assert await db_session.scalar(select(func.count(WorkoutSet.id))) == 8
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_table_for_ndjson(auth_seeded_client: AsyncClient):
+    resp = await auth_seeded_client.get("/api/export?table=sets")
+    assert resp.status_code == 400
+    resp = await auth_seeded_client.get("/api/export?format=csv&table=nope")
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_parquet_export(auth_seeded_client: AsyncClient):
+    pq = pytest.importorskip("pyarrow.parquet")
+    await _log_history(auth_seeded_client)
+
+    resp = await auth_seeded_client.get("/api/export?format=parquet")
+    assert resp.status_code == 200
+    table = pq.read_table(io.BytesIO(resp.content))
+    assert table.num_rows == 4
+    assert table.column("exercise").to_pylist() == ["Cable Fly"] * 4
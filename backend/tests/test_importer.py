@@ -0,0 +1,218 @@
+"""Tests for the historical data importer."""
+
+import json
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.importer import import_history, read_sets, year_week
+from app.models import (
+    Exercise,
+    ExerciseProgress,
+    User,
+    WorkoutSession,
+    WorkoutSet,
+)
+
+# The owner's history, converted from the former import_historical_data.sql
+HISTORY = Path(__file__).parents[2] / "import_historical_data.ndjson"
+
+STRONG_CSV = """\
+Date,Workout Name,Duration,Exercise Name,Set Order,Weight,Reps,Distance,Seconds,Notes,Workout Notes,RPE
+2025-06-30 18:00:00,Push A,1h 5m,Barbell Bench Press,W,40,10,0,0,,,
+2025-06-30 18:00:00,Push A,1h 5m,Barbell Bench Press,1,80,8,0,0,,,8
+2025-06-30 18:00:00,Push A,1h 5m,Barbell Bench Press,2,82.5,6,0,0,Paused,,
+2025-06-30 18:00:00,Push A,1h 5m,Cable Fly (Low),1,15,12,0,0,,,
+2025-06-30 18:00:00,Push A,1h 5m,Rowing Machine,1,0,,2000,600,,,
+2025-07-02 18:30:00,Push B,45m,Barbell Bench Press,1,85,5,0,0,,,
+2025-07-02 18:30:00,Push B,45m,Plank Hold,1,0,0,0,60,,,
+"""
+
+
+def test_year_week_matches_client():
+    from datetime import datetime
+
+    assert year_week(datetime(2025, 6, 30)) == "2025-26"
+    assert year_week(datetime(2025, 1, 7)) == "2025-01"
+    assert year_week(datetime(2025, 1, 8)) == "2025-02"
+
+
+def test_read_strong_export(tmp_path: Path):
+    path = tmp_path / "strong.csv"
+    path.write_text(STRONG_CSV)
+    rows = list(read_sets(path))
+
+    assert len(rows) == 7
+    warmup, first = rows[0], rows[1]
+    assert (warmup.set_type, warmup.set_number) == ("warmup", 1)
+    assert (first.set_type, first.reps, str(first.weight)) == ("working", 8, "80")
+    assert first.session_key == warmup.session_key
+    assert first.finished_at.hour == 19 and first.finished_at.minute == 5
+    # Timed sets keep their seconds as reps
+    assert rows[4].reps == 600 and rows[6].reps == 60
+
+
+async def _counts(db: AsyncSession) -> tuple[int, int]:
+    sessions = await db.scalar(select(func.count()).select_from(WorkoutSession))
+    sets = await db.scalar(select(func.count()).select_from(WorkoutSet))
+    return sessions, sets
+
+
+@pytest.mark.asyncio
+async def test_import_is_idempotent(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession, tmp_path: Path
+):
+    user_id = (await auth_seeded_client.get("/api/auth/me")).json()["id"]
+    path = tmp_path / "strong.csv"
+    path.write_text(STRONG_CSV)
+
+    stats = await import_history(db_session, user_id, path, batch_size=2)
+    assert (stats.rows, stats.sessions, stats.sets) == (7, 2, 7)
+    # "Cable Fly (Low)", "Rowing Machine" and "Plank Hold" are not in the catalog
+    assert stats.exercises_created == 3
+    custom = await db_session.scalars(
+        select(Exercise.name).where(Exercise.user_id == user_id)
+    )
+    assert "Cable Fly (Low)" in custom.all()
+
+    sessions = (await auth_seeded_client.get("/api/sessions")).json()
+    push_a = next(s for s in sessions if s["year_week"] == "2025-26")
+    assert push_a["synced"] is True
+    assert push_a["working_set_count"] == 4
+
+    progress = await db_session.scalars(
+        select(ExerciseProgress.max_weight).where(
+            ExerciseProgress.user_id == user_id,
+            ExerciseProgress.year_week == "2025-26",
+        )
+    )
+    assert 82.5 in [float(w) for w in progress.all()]
+
+    again = await import_history(db_session, user_id, path)
+    assert (again.sessions, again.sets, again.exercises_created) == (0, 0, 0)
+    assert await _counts(db_session) == (2, 7)
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_committed_rows(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession, tmp_path: Path
+):
+    user_id = (await auth_seeded_client.get("/api/auth/me")).json()["id"]
+    path = tmp_path / "history.ndjson"
+    rows = [
+        dict(
+            session_id=f"s{day}",
+            started_at=f"2025-03-0{day}T07:00:00",
+            workout="Legs",
+            exercise="High-Bar Back Squat",
+            set_number=n,
+            reps=5,
+            weight=100 + day,
+        )
+        for day in (1, 2)
+        for n in (1, 2)
+    ]
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    checkpoint = tmp_path / "history.ndjson.checkpoint.json"
+    checkpoint.write_text(
+        json.dumps(dict(source=path.name, size=path.stat().st_size, rows=2))
+    )
+
+    stats = await import_history(db_session, user_id, path, resume=True)
+    assert (stats.rows, stats.sessions, stats.sets) == (2, 1, 2)
+    assert not checkpoint.exists()
+
+    # A full run afterwards only adds what the resume skipped
+    stats = await import_history(db_session, user_id, path)
+    assert (stats.sessions, stats.sets) == (1, 2)
+    assert await _counts(db_session) == (2, 4)
+
+
+class _Interrupted(Exception):
+    pass
+
+
+def _interrupt(stats) -> None:
+    raise _Interrupted
+
+
+@pytest.mark.asyncio
+async def test_resume_continues_sessions_split_by_the_checkpoint(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession, tmp_path: Path
+):
+    user_id = (await auth_seeded_client.get("/api/auth/me")).json()["id"]
+    path = tmp_path / "history.ndjson"
+    rows = [
+        dict(session_id=session, started_at=started_at, exercise=exercise, reps=5)
+        for session, started_at, exercise in (
+            ("s1", "2025-03-01T07:00:00", "High-Bar Back Squat"),
+            ("s1", "2025-03-01T07:00:00", "High-Bar Back Squat"),
+            ("s2", "2025-03-02T07:00:00", "Barbell Bench Press"),
+            # Back to the first session after the checkpoint
+            ("s1", "2025-03-01T07:00:00", "Barbell RDL"),
+        )
+    ]
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+    # The run stops right after the first batch is committed
+    with pytest.raises(_Interrupted):
+        await import_history(
+            db_session, user_id, path, batch_size=2, progress=_interrupt
+        )
+    assert await _counts(db_session) == (1, 2)
+
+    stats = await import_history(db_session, user_id, path, resume=True)
+    assert stats.sets == 2
+    assert await _counts(db_session) == (2, 4)
+
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not POSTGRES_URL, reason="set TEST_POSTGRES_URL to a migrated database"
+)
+async def test_import_copies_through_staging_on_postgresql(tmp_path: Path):
+    engine = create_async_engine(
+        POSTGRES_URL, connect_args={"server_settings": {"search_path": "gym"}}
+    )
+    path = tmp_path / "strong.csv"
+    path.write_text(STRONG_CSV)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            user = User(email=f"{uuid.uuid4()}@example.com", display_name="Importer")
+            db.add(user)
+            await db.commit()
+
+            stats = await import_history(db, user.id, path, batch_size=2)
+            assert (stats.sessions, stats.sets) == (2, 7)
+            # The staging tables drop their rows on commit, so a second run
+            # finds every row already in place
+            again = await import_history(db, user.id, path)
+            assert (again.sessions, again.sets) == (0, 0)
+            sets = await db.scalar(
+                select(func.count())
+                .select_from(WorkoutSet)
+                .join(WorkoutSession)
+                .where(WorkoutSession.user_id == user.id)
+            )
+            assert sets == 7
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_import_historical_data(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession
+):
+    user_id = (await auth_seeded_client.get("/api/auth/me")).json()["id"]
+
+    stats = await import_history(db_session, user_id, HISTORY)
+    assert (stats.sessions, stats.sets, stats.skipped) == (92, 1103, 0)
+    assert await _counts(db_session) == (92, 1103)
@@ -0,0 +1,100 @@
+"""Tests for connection pool metrics and the readiness check."""
+
+import time
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, exc, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.dependencies import get_db
+from app.main import app
+from app.pool import InstrumentedQueuePool, PoolMetrics, pool_stats
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_waits_and_timeouts(tmp_path: Path):
+    metrics = PoolMetrics()
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        metrics=metrics,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        stats = pool_stats(engine.pool)
+        assert (stats["checked_out"], stats["saturated"]) == (1, True)
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect():
+                pass
+
+    # Disposing recreates the pool but keeps its metrics
+    await engine.dispose()
+    stats = pool_stats(engine.pool)
+    assert (stats["checked_out"], stats["saturated"]) == (0, False)
+    assert (stats["checkouts"], stats["timeouts"]) == (1, 1)
+    assert stats["wait_seconds_buckets"]["+Inf"] == 1
+
+
+@pytest.mark.asyncio
+async def test_opening_a_connection_is_not_a_wait(tmp_path: Path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def slow_connect(dbapi_connection, record):
+        time.sleep(0.2)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    stats = pool_stats(engine.pool)
+    assert stats["checkouts"] == 1
+    assert stats["wait_seconds_total"] < 0.1
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_unlimited_overflow_never_saturates(tmp_path: Path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=-1,
+    )
+    async with engine.connect() as first, engine.connect() as second:
+        await first.execute(text("SELECT 1"))
+        await second.execute(text("SELECT 1"))
+        stats = pool_stats(engine.pool)
+        assert (stats["checked_out"], stats["max_overflow"]) == (2, -1)
+        assert stats["saturated"] is False
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_readiness_checks_database(client: AsyncClient, tmp_path: Path):
+    resp = await client.get("/health/ready")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert (body["status"], body["database"]) == ("ok", "ok")
+    assert "primary" in body["pools"]
+
+    broken = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'gym.db'}"
+    )
+
+    async def unreachable_db():
+        async with AsyncSession(broken) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = unreachable_db
+    resp = await client.get("/health/ready")
+    assert resp.status_code == 503
+    assert resp.json()["database"].startswith("error")
+    await broken.dispose()
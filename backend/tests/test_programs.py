@@ -2,6 +2,11 @@
 
 import pytest
 from httpx import AsyncClient
+from pydantic import TypeAdapter
+
+from app.query_stats import collect_queries
+from app.schemas import ProgramPhaseDetailResponse
+from tests.conftest import assert_max_queries
 
 
 async def _get_exercise_id_by_name(client: AsyncClient, name: str) -> str:
@@ -65,17 +70,18 @@ async def test_create_program_with_routines(auth_seeded_client: AsyncClient):
     t1 = await _create_template(auth_seeded_client, "Push Day", exercise_id)
     t2 = await _create_template(auth_seeded_client, "Pull Day", exercise_id)
 
-    resp = await auth_seeded_client.post(
-        "/api/programs",
-        json={
-            "name": "PPL Program",
-            "deload_every_n_weeks": 4,
-            "routines": [
-                {"template_id": t1, "order": 0},
-                {"template_id": t2, "order": 1},
-            ],
-        },
-    )
+    with assert_max_queries(10):
+        resp = await auth_seeded_client.post(
+            "/api/programs",
+            json={
+                "name": "PPL Program",
+                "deload_every_n_weeks": 4,
+                "routines": [
+                    {"template_id": t1, "order": 0},
+                    {"template_id": t2, "order": 1},
+                ],
+            },
+        )
     assert resp.status_code == 201
     data = resp.json()
     assert data["name"] == "PPL Program"
@@ -205,7 +211,8 @@ async def test_activate_deactivate_program(auth_seeded_client: AsyncClient):
     program_id = create_resp.json()["id"]
 
     # Activate
-    resp = await auth_seeded_client.post(f"/api/programs/{program_id}/activate")
+    with assert_max_queries(7):
+        resp = await auth_seeded_client.post(f"/api/programs/{program_id}/activate")
     assert resp.status_code == 200
     data = resp.json()
     assert data["is_active"] is True
@@ -725,3 +732,302 @@ async def test_list_phases(auth_seeded_client: AsyncClient, db_session):
     assert "sections" in workout
     assert len(workout["sections"]) == 1
     assert len(workout["sections"][0]["exercises"]) == 1
+    assert [w["day_index"] for w in phases[0]["workouts"]] == [0, 1, 2]
+    exercise = workout["sections"][0]["exercises"][0]
+    assert exercise["exercise_name"] == "Barbell Bench Press"
+
+    # The hand-built payload is exactly what the response model would emit
+    adapter = TypeAdapter(list[ProgramPhaseDetailResponse])
+    assert adapter.dump_python(adapter.validate_python(phases), mode="json") == phases
+    assert [p["days_per_week"] for p in phases] == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_phases_report_the_days_the_schedule_advances_through(
+    auth_seeded_client: AsyncClient, db_session
+):
+    user_id = (await auth_seeded_client.get("/api/auth/me")).json()["id"]
+    program_id, _, _ = await _create_phased_program_in_db(
+        db_session, user_id=user_id, num_phases=1, days_per_week=5, duration_weeks=2
+    )
+    await db_session.commit()
+
+    phases = (await auth_seeded_client.get(f"/api/programs/{program_id}/phases")).json()
+    assert phases[0]["days_per_week"] == 5
+    bootstrap = (await auth_seeded_client.get("/api/bootstrap")).json()
+    (phase,) = [p for p in bootstrap["phases"] if p["program_id"] == program_id]
+    assert phase["days_per_week"] == 5
+
+    # The server moves past the fourth day within the same week, as the
+    # client does with days_per_week
+    for _ in range(4):
+        resp = await auth_seeded_client.post(
+            f"/api/programs/{program_id}/advance-phased"
+        )
+        assert resp.status_code == 200
+    advanced = resp.json()
+    assert (advanced["current_week_in_phase"], advanced["current_day_index"]) == (0, 4)
+
+
+# ---------------------------------------------------------------------------
+# Shared program plan cache
+# ---------------------------------------------------------------------------
+
+
+async def _today(client: AsyncClient) -> dict:
+    resp = await client.get("/api/programs/today")
+    assert resp.status_code == 200
+    return resp.json()
+
+
+@pytest.mark.asyncio
+async def test_today_caches_shared_program_plans(
+    auth_seeded_client: AsyncClient, db_session
+):
+    from app.seed import SHARED_JN_PROGRAM_ID, seed_default_program
+    from app.seed_minimalift import (
+        SHARED_MINIMALIFT_PROGRAM_ID,
+        seed_minimalift_program,
+    )
+
+    await seed_default_program(db_session)
+    await seed_minimalift_program(db_session)
+
+    for program_id in (SHARED_JN_PROGRAM_ID, SHARED_MINIMALIFT_PROGRAM_ID):
+        await auth_seeded_client.post(f"/api/programs/{program_id}/activate")
+        with collect_queries() as cold_queries:
+            cold = await _today(auth_seeded_client)
+        # Only the caller's enrollment is read once the plan is cached
+        with assert_max_queries(1):
+            warm = await _today(auth_seeded_client)
+        assert cold_queries.count > 1
+        assert warm == cold
+        assert warm["program"]["id"] == program_id
+        assert warm["user_program"]["program_name"] == warm["program"]["name"]
+
+    phased = warm
+    assert phased["workout"]["sections"][0]["exercises"][0]["exercise_name"]
+
+    # Per-user progress still selects the workout from the cached plan
+    await auth_seeded_client.post(
+        f"/api/programs/{SHARED_MINIMALIFT_PROGRAM_ID}/advance-phased"
+    )
+    advanced = await _today(auth_seeded_client)
+    assert advanced["day_number"] == 2
+    assert advanced["workout"]["id"] != phased["workout"]["id"]
+    assert advanced["user_program"]["current_day_index"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Phased program: compiled schedule
+# ---------------------------------------------------------------------------
+
+
+def test_plan_positions_survive_phases_without_weeks():
+    """Zero-week phases and phaseless plans don't break position lookups."""
+    from types import SimpleNamespace
+
+    from app.plans import ProgramPlan, ScheduleDay
+    from app.schemas import ProgramPhaseResponse
+
+    phases = [
+        ProgramPhaseResponse(id=f"p{i}", name=f"P{i}", order=i, duration_weeks=weeks)
+        for i, weeks in enumerate((0, 2))
+    ]
+    schedule = [
+        ScheduleDay(1, 1, 0, "w1", "Day 1"),
+        ScheduleDay(1, 2, 0, "w2", "Day 2"),
+    ]
+    plan = ProgramPlan(program=None, routines=[], phases=phases, schedule=schedule)
+    stuck = SimpleNamespace(
+        current_phase_index=0, current_week_in_phase=3, current_day_index=0
+    )
+    assert plan.position(stuck) is None
+    assert plan.next_position(stuck) == 0
+
+    empty = ProgramPlan(program=None, routines=[], phases=[])
+    assert empty.position(stuck) is None
+
+
+@pytest.mark.asyncio
+async def test_advance_phased_follows_days_in_data(
+    auth_seeded_client: AsyncClient, db_session
+):
+    """The number of days per week comes from the program's workouts."""
+    user_id = (await auth_seeded_client.get("/api/auth/me")).json()["id"]
+    program_id, _phase_ids, _workout_ids = await _create_phased_program_in_db(
+        db_session,
+        user_id=user_id,
+        program_name="Five Day Test",
+        num_phases=1,
+        days_per_week=5,
+        duration_weeks=1,
+    )
+    await auth_seeded_client.post(f"/api/programs/{program_id}/activate")
+
+    for _ in range(4):
+        resp = await auth_seeded_client.post(
+            f"/api/programs/{program_id}/advance-phased"
+        )
+    assert resp.json()["current_day_index"] == 4
+    today = (await auth_seeded_client.get("/api/programs/today")).json()
+    assert (today["day_number"], today["schedule_day"], today["total_days"]) == (
+        5,
+        5,
+        5,
+    )
+
+    # The last day wraps around to the start of the program
+    resp = await auth_seeded_client.post(f"/api/programs/{program_id}/advance-phased")
+    data = resp.json()
+    assert (data["current_phase_index"], data["current_day_index"]) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_skip_to_day_and_preview_upcoming(
+    auth_seeded_client: AsyncClient, db_session
+):
+    user_id = (await auth_seeded_client.get("/api/auth/me")).json()["id"]
+    # 2 phases x 2 weeks x 3 days = 12 scheduled days
+    program_id, _phase_ids, workout_ids = await _create_phased_program_in_db(
+        db_session,
+        user_id=user_id,
+        program_name="Skip Test",
+    )
+    await auth_seeded_client.post(f"/api/programs/{program_id}/activate")
+
+    resp = await auth_seeded_client.post(
+        f"/api/programs/{program_id}/skip-to-day", json={"day": 8}
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["current_phase_index"] == 1
+    assert data["current_week_in_phase"] == 0
+    assert data["current_day_index"] == 1
+
+    resp = await auth_seeded_client.get(
+        f"/api/programs/{program_id}/upcoming", params={"count": 6}
+    )
+    assert resp.status_code == 200
+    upcoming = resp.json()
+    assert [d["day"] for d in upcoming] == [8, 9, 10, 11, 12, 1]
+    assert [d["workout_id"] for d in upcoming] == workout_ids[7:] + workout_ids[:1]
+    assert upcoming[0]["workout_name"] == "Phase 2 W1 D2"
+
+    resp = await auth_seeded_client.post(
+        f"/api/programs/{program_id}/skip-to-day", json={"day": 13}
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_skip_to_day_after_unenrolling_is_not_found(
+    auth_seeded_client: AsyncClient, db_session, monkeypatch: pytest.MonkeyPatch
+):
+    from sqlalchemy import delete
+
+    from app.models import UserProgram
+    from app.routes import programs
+
+    user_id = (await auth_seeded_client.get("/api/auth/me")).json()["id"]
+    program_id, _phase_ids, _workout_ids = await _create_phased_program_in_db(
+        db_session, user_id=user_id, program_name="Unenrolled"
+    )
+    enrollment_id = (
+        await auth_seeded_client.post(f"/api/programs/{program_id}/activate")
+    ).json()["id"]
+    read_enrollment = programs._phased_enrollment
+
+    async def unenroll_after_reading(db, program_id, user_id):
+        found = await read_enrollment(db, program_id, user_id)
+        await db.execute(delete(UserProgram).where(UserProgram.id == enrollment_id))
+        return found
+
+    monkeypatch.setattr(programs, "_phased_enrollment", unenroll_after_reading)
+    resp = await auth_seeded_client.post(
+        f"/api/programs/{program_id}/skip-to-day", json={"day": 2}
+    )
+    assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Atomic advancement
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_advance_is_a_single_update(auth_seeded_client: AsyncClient):
+    exercise_id = await _get_exercise_id_by_name(
+        auth_seeded_client, "Barbell Bench Press"
+    )
+    t1 = await _create_template(auth_seeded_client, "Atomic A", exercise_id)
+    t2 = await _create_template(auth_seeded_client, "Atomic B", exercise_id)
+    program_id = (
+        await auth_seeded_client.post(
+            "/api/programs",
+            json={
+                "name": "Atomic",
+                "routines": [
+                    {"template_id": t1, "order": 0},
+                    {"template_id": t2, "order": 1},
+                ],
+            },
+        )
+    ).json()["id"]
+    await auth_seeded_client.post(f"/api/programs/{program_id}/activate")
+
+    for expected in [(1, 0), (0, 1), (1, 1)]:
+        with collect_queries() as stats:
+            resp = await auth_seeded_client.post(f"/api/programs/{program_id}/advance")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert (data["current_routine_index"], data["weeks_completed"]) == expected
+        assert data["program_name"] == "Atomic"
+        assert data["last_workout_at"] is not None
+        # The new position is computed and returned by the UPDATE itself
+        enrollment_statements = [
+            (shape, n) for shape, n in stats.shapes.items() if "user_programs" in shape
+        ]
+        assert len(enrollment_statements) == 1
+        shape, n = enrollment_statements[0]
+        assert n == 1 and shape.startswith("UPDATE")
+
+    resp = await auth_seeded_client.post("/api/programs/missing/advance")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_advance_phased_only_applies_to_the_day_read(
+    auth_seeded_client: AsyncClient, db_session
+):
+    from app.models import UserProgram
+    from app.progression import update_enrollments
+    from app.seed_minimalift import (
+        SHARED_MINIMALIFT_PROGRAM_ID,
+        seed_minimalift_program,
+    )
+
+    await seed_minimalift_program(db_session)
+    enrollment = (
+        await auth_seeded_client.post(
+            f"/api/programs/{SHARED_MINIMALIFT_PROGRAM_ID}/activate"
+        )
+    ).json()
+    await auth_seeded_client.post(
+        f"/api/programs/{SHARED_MINIMALIFT_PROGRAM_ID}/advance-phased"
+    )
+
+    # A write conditioned on the day before the advance no longer matches
+    stale = await update_enrollments(
+        db_session,
+        enrollment["user_id"],
+        UserProgram.id == enrollment["id"],
+        UserProgram.current_day_index == enrollment["current_day_index"],
+        current_day_index=0,
+    )
+    assert stale == []
+
+    resp = await auth_seeded_client.post(
+        f"/api/programs/{SHARED_MINIMALIFT_PROGRAM_ID}/advance-phased"
+    )
+    assert resp.json()["current_day_index"] == 2
@@ -68,3 +68,10 @@ async def test_exercise_progress_updated_on_set_log(auth_seeded_client: AsyncCli
     progress_data2 = progress_resp2.json()
     week_data2 = next(p for p in progress_data2 if p["year_week"] == "2025-27")
     assert float(week_data2["max_weight"]) == 90.0
+
+    all_resp = await auth_seeded_client.get("/api/progress")
+    assert all_resp.status_code == 200
+    (detail,) = [p for p in all_resp.json() if p["year_week"] == "2025-27"]
+    assert detail["exercise_id"] == exercise_id
+    assert detail["max_weight"] == week_data2["max_weight"]
+    assert set(detail) == {"id", "exercise_id", "year_week", "max_weight", "created_at"}
@@ -0,0 +1,74 @@
+"""Tests for per-request statement counting."""
+
+import json
+import logging
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.query_stats import QueryStatsMiddleware, statement_shape
+from tests.conftest import engine
+
+
+def test_statement_shape_collapses_placeholders():
+    assert statement_shape("SELECT * FROM t\n  WHERE id IN (?, ?, ?)") == (
+        "SELECT * FROM t WHERE id IN (...)"
+    )
+    assert statement_shape("INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4)") == (
+        "INSERT INTO t (a, b) VALUES (...)"
+    )
+    assert statement_shape("SELECT 1 WHERE x = :x") == "SELECT 1 WHERE x = :x"
+
+
+@pytest.mark.asyncio
+async def test_api_responses_carry_server_timing(auth_seeded_client: AsyncClient):
+    resp = await auth_seeded_client.get("/api/exercises")
+    timing = resp.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert 'queries"' in timing
+
+
+@pytest.mark.asyncio
+async def test_repeated_statements_are_logged(caplog: pytest.LogCaptureFixture):
+    async def one_query_per_row(request):
+        async with engine.connect() as conn:
+            for n in range(1, 4):
+                params = {f"p{i}": i for i in range(n)}
+                placeholders = ", ".join(f":{name}" for name in params)
+                await conn.execute(
+                    text(f"SELECT 1 WHERE 1 IN ({placeholders})"), params
+                )
+        return PlainTextResponse("ok")
+
+    async def cheap(request):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return PlainTextResponse("ok")
+
+    app = QueryStatsMiddleware(
+        Starlette(routes=[Route("/rows", one_query_per_row), Route("/cheap", cheap)]),
+        budget=2,
+        repeat_threshold=3,
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        with caplog.at_level(logging.INFO, logger="app.queries"):
+            await ac.get("/cheap")
+            resp = await ac.get("/rows")
+
+    assert resp.headers["Server-Timing"].endswith('desc="3 queries"')
+    cheap_log, rows_log = caplog.records
+    assert cheap_log.levelno == logging.INFO
+    assert json.loads(cheap_log.message)["queries"] == 1
+
+    assert rows_log.levelno == logging.WARNING
+    record = json.loads(rows_log.message)
+    assert (record["path"], record["status"], record["queries"]) == ("/rows", 200, 3)
+    assert record["repeated"] == [
+        {"statement": "SELECT 1 WHERE 1 IN (...)", "count": 3}
+    ]
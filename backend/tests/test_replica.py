@@ -0,0 +1,60 @@
+"""Tests for read-replica routing."""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.dependencies as dependencies
+from app.dependencies import REPLICA_PIN_COOKIE
+
+
+@pytest.fixture
+def replica(monkeypatch: pytest.MonkeyPatch, db_session: AsyncSession) -> list[str]:
+    """Route replica reads to the test database, recording each checkout."""
+    checkouts: list[str] = []
+
+    @asynccontextmanager
+    async def replica_session():
+        checkouts.append("replica")
+        yield db_session
+
+    monkeypatch.setattr(dependencies, "replica_session", replica_session)
+    return checkouts
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_until_user_writes(
+    auth_seeded_client: AsyncClient, replica: list[str]
+):
+    resp = await auth_seeded_client.get("/api/progress")
+    assert resp.status_code == 200
+    assert len(replica) == 1
+
+    # The change feed and profile always read the primary
+    await auth_seeded_client.get("/api/sync/changes")
+    await auth_seeded_client.get("/api/auth/me")
+    assert len(replica) == 1
+
+    # After a write the user reads from the primary, seeing their own rows
+    resp = await auth_seeded_client.post(
+        "/api/exercises", json={"name": "Cable Fly", "muscle_group": "Chest"}
+    )
+    assert resp.status_code == 201
+    user_id = (await auth_seeded_client.get("/api/auth/me")).json()["id"]
+    assert auth_seeded_client.cookies[REPLICA_PIN_COOKIE] == user_id
+    resp = await auth_seeded_client.get("/api/exercises")
+    assert "Cable Fly" in [e["name"] for e in resp.json()]
+    assert len(replica) == 1
+
+    # Other users are not pinned
+    await auth_seeded_client.get(
+        "/api/stats/volume", headers={"Remote-Email": "other@example.com"}
+    )
+    assert len(replica) == 2
+
+    # Once the pin cookie expires reads return to the replica
+    auth_seeded_client.cookies.clear()
+    await auth_seeded_client.get("/api/stats/volume")
+    assert len(replica) == 3
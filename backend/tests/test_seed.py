@@ -1,22 +1,50 @@
 """Tests for exercise seeding logic."""
 
+import json
+from datetime import datetime
+from pathlib import Path
+
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models import Exercise, ExerciseSubstitution
-from app.seed import exercises_data, seed_exercises
-from app.seed_minimalift import minimalift_exercises_data
-from app.seed_minimalift_5day import minimalift_5day_exercises_data
+from app.models import (
+    Exercise,
+    ExerciseSubstitution,
+    PhaseWorkout,
+    PhaseWorkoutExercise,
+    PhaseWorkoutSection,
+    Program,
+    ProgramPhase,
+    ProgramRoutine,
+    SeedVersion,
+    TemplateExercise,
+    User,
+    WorkoutSession,
+)
+from app.seed import (
+    EXERCISE_DATASETS,
+    SHARED_JN_PROGRAM_ID,
+    run_seeds,
+    seed_default_program,
+    seed_exercises,
+)
+from app.seed_minimalift import SHARED_MINIMALIFT_PROGRAM_ID, seed_minimalift_program
+from app.seed_minimalift_5day import SHARED_MINIMALIFT_5DAY_PROGRAM_ID
+from app import seeding
+from app.seeding import SeedDataError, load_dataset, validate_rows
 
 
 def _unique_exercise_count() -> int:
     """Compute expected unique exercise count across all seed lists."""
-    jn = {e["name"] for e in exercises_data}
-    ml = {e["name"] for e in minimalift_exercises_data}
-    ml5 = {e["name"] for e in minimalift_5day_exercises_data}
-    return len(jn | ml | ml5)
+    return len(
+        {
+            e["name"]
+            for name in EXERCISE_DATASETS
+            for e in load_dataset(name)["exercises"]
+        }
+    )
 
 
 @pytest.mark.asyncio
@@ -29,7 +57,7 @@ async def test_seed_populates_exercises(db_session: AsyncSession):
     exercises = result.scalars().all()
 
     # Includes both Jeff Nippard + Minimalift exercises (deduplicated by name)
-    assert len(exercises) >= len(exercises_data)
+    assert len(exercises) >= len(load_dataset("exercises")["exercises"])
     assert len(exercises) == _unique_exercise_count()
 
     names = {e.name for e in exercises}
@@ -79,3 +107,183 @@ async def test_seed_is_idempotent(db_session: AsyncSession):
     )
     exercises = result.scalars().all()
     assert len(exercises) == _unique_exercise_count()
+
+
+async def _row_counts(db: AsyncSession) -> dict[str, int]:
+    counts = {}
+    for model in (
+        Exercise,
+        ExerciseSubstitution,
+        TemplateExercise,
+        PhaseWorkoutExercise,
+    ):
+        result = await db.execute(select(func.count()).select_from(model))
+        counts[model.__tablename__] = result.scalar_one()
+    return counts
+
+
+@pytest.mark.asyncio
+async def test_run_seeds_skips_unchanged_datasets(db_session: AsyncSession):
+    applied = await run_seeds(db_session)
+    assert applied == ["exercises", "jn_program", "ml_program", "ml5_program"]
+    counts = await _row_counts(db_session)
+    assert all(counts.values())
+
+    assert await run_seeds(db_session) == []
+
+    # A changed hash re-applies just that dataset, in place
+    await db_session.execute(
+        update(SeedVersion)
+        .where(SeedVersion.name == "ml_program")
+        .values(content_hash="stale")
+    )
+    await db_session.commit()
+    assert await run_seeds(db_session) == ["ml_program"]
+    assert await _row_counts(db_session) == counts
+
+
+@pytest.mark.asyncio
+async def test_program_seeds_keep_shared_ids(db_session: AsyncSession):
+    await run_seeds(db_session)
+    await seed_default_program(db_session)
+    await seed_minimalift_program(db_session)
+
+    result = await db_session.execute(
+        select(Program.id).where(Program.user_id.is_(None))
+    )
+    assert set(result.scalars().all()) == {
+        SHARED_JN_PROGRAM_ID,
+        SHARED_MINIMALIFT_PROGRAM_ID,
+        SHARED_MINIMALIFT_5DAY_PROGRAM_ID,
+    }
+    program = await db_session.get(Program, SHARED_JN_PROGRAM_ID)
+    assert program.deload_every_n_weeks == 6
+
+
+@pytest.mark.asyncio
+async def test_reseeding_deletes_rows_the_data_no_longer_defines(
+    db_session: AsyncSession,
+):
+    await run_seeds(db_session)
+    counts = await _row_counts(db_session)
+    exercise_id = await db_session.scalar(select(Exercise.id).limit(1))
+    phase_id = await db_session.scalar(
+        select(ProgramPhase.id).where(
+            ProgramPhase.program_id == SHARED_MINIMALIFT_PROGRAM_ID
+        )
+    )
+    template_id = await db_session.scalar(
+        select(ProgramRoutine.template_id).where(
+            ProgramRoutine.program_id == SHARED_JN_PROGRAM_ID
+        )
+    )
+    # Rows left behind by an earlier version of the data
+    user = User(email="lifter@example.com", display_name="Lifter")
+    workout = PhaseWorkout(
+        phase_id=phase_id, name="Dropped", day_index=9, week_number=1
+    )
+    section = PhaseWorkoutSection(workout=workout, name="Main", order=0)
+    db_session.add_all(
+        [
+            user,
+            workout,
+            section,
+            PhaseWorkoutExercise(
+                section=section,
+                exercise_id=exercise_id,
+                order=0,
+                working_sets=3,
+                reps_display="5",
+            ),
+            ProgramRoutine(
+                program_id=SHARED_JN_PROGRAM_ID, template_id=template_id, order=99
+            ),
+            TemplateExercise(
+                template_id=template_id,
+                exercise_id=exercise_id,
+                week_type="normal",
+                order=99,
+                working_sets=3,
+                min_reps=5,
+                max_reps=8,
+                early_set_rpe_min=7,
+                early_set_rpe_max=8,
+                last_set_rpe_min=8,
+                last_set_rpe_max=9,
+                rest_period="2 min",
+            ),
+        ]
+    )
+    await db_session.flush()
+    session = WorkoutSession(
+        user_id=user.id,
+        phase_workout_id=workout.id,
+        week_type="normal",
+        started_at=datetime(2025, 3, 1),
+    )
+    db_session.add(session)
+    await db_session.commit()
+
+    await seed_default_program(db_session)
+    await seed_minimalift_program(db_session)
+
+    assert await _row_counts(db_session) == counts
+    stale = (
+        (PhaseWorkout, PhaseWorkout.name == "Dropped"),
+        (PhaseWorkoutSection, PhaseWorkoutSection.workout_id == workout.id),
+        (ProgramRoutine, ProgramRoutine.order == 99),
+    )
+    for model, criterion in stale:
+        count = select(func.count()).select_from(model).where(criterion)
+        assert await db_session.scalar(count) == 0
+    # The session keeps its history without the dropped workout
+    await db_session.refresh(session)
+    assert session.phase_workout_id is None
+
+
+@pytest.mark.asyncio
+async def test_seeds_reject_unknown_exercises(
+    db_session: AsyncSession, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    await seed_exercises(db_session)
+    jn = load_dataset("jn_program")
+    jn["templates"][0]["normal"][0]["exercise"] = "Barbell Bench Pres"
+    ml = load_dataset("minimalift_program")
+    ml["phases"][0]["workouts"][0]["sections"][0]["exercises"][0]["sub1"] = "Z Press"
+    for name, data in (("jn_program", jn), ("minimalift_program", ml)):
+        (tmp_path / f"{name}.json").write_text(json.dumps(data))
+    monkeypatch.setattr(seeding, "SEED_DATA_DIR", tmp_path)
+
+    with pytest.raises(
+        SeedDataError, match="jn_program: unknown exercise 'Barbell Bench Pres'"
+    ):
+        await seed_default_program(db_session)
+    with pytest.raises(
+        SeedDataError, match="minimalift_program: unknown exercise 'Z Press'"
+    ):
+        await seed_minimalift_program(db_session)
+
+
+def test_seed_rows_are_checked_against_models():
+    rows = validate_rows(
+        Exercise,
+        [
+            {"name": "Sled Push", "muscle_group": "legs", "exercise_type": "reps"},
+            {"name": "Sled Drag", "muscle_group": "legs"},
+        ],
+    )
+    # Omitted fields fall back to the column default so rows share one INSERT
+    assert rows[1]["exercise_type"] == "reps"
+
+    with pytest.raises(SeedDataError, match="unknown fields musclegroup"):
+        validate_rows(Exercise, [{"name": "Sled Push", "musclegroup": "legs"}])
+    with pytest.raises(SeedDataError, match="muscle_group is required"):
+        validate_rows(Exercise, [{"name": "Sled Push"}])
+    with pytest.raises(SeedDataError, match="muscle_group is required"):
+        validate_rows(Exercise, [{"name": "Sled Push", "muscle_group": None}])
+    with pytest.raises(SeedDataError, match="longer than 200"):
+        validate_rows(Exercise, [{"name": "x" * 201, "muscle_group": "legs"}])
+    with pytest.raises(SeedDataError, match="wrong type"):
+        validate_rows(
+            Exercise, [{"name": "Sled Push", "muscle_group": "legs", "is_custom": 1}]
+        )
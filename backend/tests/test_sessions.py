@@ -1,8 +1,13 @@
 """Tests for workout session and set logging routes."""
 
+import uuid
+
 import pytest
 from httpx import AsyncClient
 
+from app.query_stats import collect_queries
+from tests.conftest import assert_max_queries
+
 
 async def _get_exercise_id_by_name(client: AsyncClient, name: str) -> str:
     resp = await client.get("/api/exercises")
@@ -131,3 +136,226 @@ async def test_get_session_with_sets(auth_seeded_client: AsyncClient):
     set_types = [s["set_type"] for s in data["sets"]]
     assert "warmup" in set_types
     assert "working" in set_types
+
+
+async def _sync_sessions(client: AsyncClient, started: list[str]) -> list[str]:
+    """Sync finished sessions starting at the given times; return their ids."""
+    sessions = [
+        {
+            "id": str(uuid.uuid4()),
+            "week_type": "normal",
+            "year_week": "2025-27",
+            "started_at": started_at,
+        }
+        for started_at in started
+    ]
+    resp = await client.post("/api/sync", json={"sessions": sessions})
+    assert resp.status_code == 200
+    return [s["id"] for s in sessions]
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_pages_by_started_at_and_id(
+    auth_seeded_client: AsyncClient,
+):
+    # Two sessions share a start time, so pages must break ties on id
+    ids = await _sync_sessions(
+        auth_seeded_client,
+        [
+            "2025-07-01T10:00:00Z",
+            "2025-07-02T10:00:00Z",
+            "2025-07-02T10:00:00Z",
+            "2025-07-03T10:00:00Z",
+            "2025-07-04T10:00:00Z",
+        ],
+    )
+    expected = [ids[4], ids[3], *sorted(ids[1:3], reverse=True), ids[0]]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+        resp = await auth_seeded_client.get("/api/sessions/page", params=params)
+        assert resp.status_code == 200
+        page = resp.json()
+        assert len(page["sessions"]) <= 2
+        assert all(s["sets"] is None for s in page["sessions"])
+        seen += [s["id"] for s in page["sessions"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+    # The unpaged list keeps its original shape
+    resp = await auth_seeded_client.get("/api/sessions")
+    listed = [s["id"] for s in resp.json()]
+    assert (listed[0], sorted(listed), listed[-1]) == (ids[4], sorted(ids), ids[0])
+
+    resp = await auth_seeded_client.get(
+        "/api/sessions/page",
+        params={
+            "started_after": "2025-07-02T00:00:00Z",
+            "started_before": "2025-07-04T00:00:00Z",
+        },
+    )
+    assert [s["id"] for s in resp.json()["sessions"]] == expected[1:4]
+
+    resp = await auth_seeded_client.get("/api/sessions/page", params={"cursor": "nope"})
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_includes_sets_of_the_page(
+    auth_seeded_client: AsyncClient,
+):
+    exercise_id = await _get_exercise_id_by_name(
+        auth_seeded_client, "Barbell Bench Press"
+    )
+    older, newer = await _sync_sessions(
+        auth_seeded_client, ["2025-07-01T10:00:00Z", "2025-07-02T10:00:00Z"]
+    )
+    for session_id in (older, newer):
+        resp = await auth_seeded_client.post(
+            f"/api/sessions/{session_id}/sets",
+            json={
+                "exercise_id": exercise_id,
+                "set_type": "working",
+                "set_number": 1,
+                "reps": 5,
+                "weight": 100,
+            },
+        )
+        assert resp.status_code == 201
+
+    resp = await auth_seeded_client.get(
+        "/api/sessions/page", params={"limit": 1, "include": "sets"}
+    )
+    (session,) = resp.json()["sessions"]
+    assert session["id"] == newer
+    assert [s["reps"] for s in session["sets"]] == [5]
+
+
+def _set(exercise_id: str, set_type: str, set_number: int, weight: float) -> dict:
+    return {
+        "exercise_id": exercise_id,
+        "set_type": set_type,
+        "set_number": set_number,
+        "reps": 5,
+        "weight": weight,
+    }
+
+
+async def _log_batch(
+    client: AsyncClient, session_id: str, sets: list[dict]
+) -> list[dict]:
+    resp = await client.post(
+        f"/api/sessions/{session_id}/sets:batch", json={"sets": sets}
+    )
+    assert resp.status_code == 201
+    return resp.json()
+
+
+@pytest.mark.asyncio
+async def test_log_sets_batch(auth_seeded_client: AsyncClient):
+    bench = await _get_exercise_id_by_name(auth_seeded_client, "Barbell Bench Press")
+    rdl = await _get_exercise_id_by_name(auth_seeded_client, "Barbell RDL")
+    session = await _create_session(auth_seeded_client)
+
+    with collect_queries() as small:
+        created = await _log_batch(
+            auth_seeded_client,
+            session["id"],
+            [_set(bench, "warmup", 1, 60), _set(bench, "working", 1, 100)],
+        )
+    assert [(s["set_type"], float(s["weight"])) for s in created] == [
+        ("warmup", 60.0),
+        ("working", 100.0),
+    ]
+
+    # Statement count does not grow with the number of sets or exercises
+    with assert_max_queries(small.count):
+        created = await _log_batch(
+            auth_seeded_client,
+            session["id"],
+            [_set(bench, "working", n, 100 + 5 * n) for n in range(2, 5)]
+            + [_set(rdl, "working", n, 140) for n in range(1, 4)],
+        )
+    assert len(created) == 6
+
+    detail = (await auth_seeded_client.get(f"/api/sessions/{session['id']}")).json()
+    assert len(detail["sets"]) == 8
+
+    progress = (await auth_seeded_client.get(f"/api/progress/exercise/{bench}")).json()
+    assert [float(p["max_weight"]) for p in progress] == [120.0]
+    records = (await auth_seeded_client.get(f"/api/stats/records/{rdl}")).json()
+    assert float(records["max_weight"]) == 140.0
+
+    resp = await auth_seeded_client.post(
+        "/api/sessions/missing/sets:batch",
+        json={"sets": [_set(bench, "working", 1, 100)]},
+    )
+    assert resp.status_code == 404
+
+
+def _summary(session: dict) -> tuple[int, float, int]:
+    return (
+        session["working_set_count"],
+        float(session["total_volume"]),
+        session["exercise_count"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_summaries_follow_set_writes(
+    auth_seeded_client: AsyncClient, db_session
+):
+    from app.summaries import rebuild_session_summaries
+
+    bench = await _get_exercise_id_by_name(auth_seeded_client, "Barbell Bench Press")
+    rdl = await _get_exercise_id_by_name(auth_seeded_client, "Barbell RDL")
+    session = await _create_session(auth_seeded_client)
+    assert _summary(session) == (0, 0.0, 0)
+
+    async def listed() -> dict:
+        resp = await auth_seeded_client.get("/api/sessions")
+        return next(s for s in resp.json() if s["id"] == session["id"])
+
+    created = (
+        await auth_seeded_client.post(
+            f"/api/sessions/{session['id']}/sets:batch",
+            json={
+                "sets": [
+                    _set(bench, "warmup", 1, 60),
+                    _set(bench, "working", 1, 100),
+                    _set(bench, "working", 2, 100),
+                ]
+            },
+        )
+    ).json()
+    await auth_seeded_client.post(
+        f"/api/sessions/{session['id']}/sets", json=_set(rdl, "working", 1, 140)
+    )
+    assert _summary(await listed()) == (3, 1700.0, 2)
+
+    await auth_seeded_client.put(
+        f"/api/sessions/sets/{created[1]['id']}", json={"reps": 10}
+    )
+    await auth_seeded_client.delete(f"/api/sessions/sets/{created[2]['id']}")
+    assert _summary(await listed()) == (2, 1700.0, 2)
+
+    sync_set = dict(
+        _set(rdl, "working", 2, 150),
+        id=str(uuid.uuid4()),
+        session_id=session["id"],
+    )
+    await auth_seeded_client.post("/api/sync", json={"sets": [sync_set]})
+    resp = await auth_seeded_client.put(
+        f"/api/sessions/{session['id']}",
+        json={"finished_at": "2030-01-01T00:00:00"},
+    )
+    finished = resp.json()
+    assert _summary(finished) == (3, 2450.0, 2)
+    assert finished["duration_seconds"] > 0
+
+    await rebuild_session_summaries(db_session)
+    await db_session.commit()
+    assert _summary(await listed()) == (3, 2450.0, 2)
@@ -0,0 +1,362 @@
+"""Tests for the stats routes and the rollups behind them."""
+
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.records import rebuild_personal_records
+from app.rollups import rebuild_weekly_volume
+
+
+async def _get_exercise(client: AsyncClient, name: str) -> dict:
+    resp = await client.get("/api/exercises")
+    return next(e for e in resp.json() if e["name"] == name)
+
+
+async def _volume(client: AsyncClient) -> list[tuple[str, str, float]]:
+    resp = await client.get("/api/stats/volume")
+    assert resp.status_code == 200
+    return [
+        (row["year_week"], row["muscle_group"], float(row["total_volume"]))
+        for row in resp.json()
+    ]
+
+
+async def _log_set(
+    client: AsyncClient, session_id: str, exercise_id: str, **overrides
+) -> dict:
+    payload = {
+        "exercise_id": exercise_id,
+        "set_type": "working",
+        "set_number": 1,
+        "reps": 10,
+        "weight": 100,
+    }
+    payload.update(overrides)
+    resp = await client.post(f"/api/sessions/{session_id}/sets", json=payload)
+    assert resp.status_code == 201
+    return resp.json()
+
+
+async def _assert_matches_rebuild(client: AsyncClient, db: AsyncSession) -> None:
+    incremental = await _volume(client)
+    await rebuild_weekly_volume(db)
+    await db.commit()
+    assert await _volume(client) == incremental
+
+
+@pytest.mark.asyncio
+async def test_volume_tracks_set_writes(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession
+):
+    bench = await _get_exercise(auth_seeded_client, "Barbell Bench Press")
+    session = (
+        await auth_seeded_client.post(
+            "/api/sessions", json={"week_type": "normal", "year_week": "2025-27"}
+        )
+    ).json()
+
+    await _log_set(auth_seeded_client, session["id"], bench["id"], set_type="warmup")
+    first = await _log_set(auth_seeded_client, session["id"], bench["id"])
+    second = await _log_set(
+        auth_seeded_client, session["id"], bench["id"], set_number=2, reps=8
+    )
+    group = bench["muscle_group"]
+    assert await _volume(auth_seeded_client) == [("2025-27", group, 1800.0)]
+
+    await auth_seeded_client.put(f"/api/sessions/sets/{first['id']}", json={"reps": 5})
+    assert await _volume(auth_seeded_client) == [("2025-27", group, 1300.0)]
+
+    await auth_seeded_client.delete(f"/api/sessions/sets/{second['id']}")
+    assert await _volume(auth_seeded_client) == [("2025-27", group, 500.0)]
+
+    # Removing the last working set drops the bucket entirely
+    await auth_seeded_client.delete(f"/api/sessions/sets/{first['id']}")
+    assert await _volume(auth_seeded_client) == []
+    await _assert_matches_rebuild(auth_seeded_client, db_session)
+
+
+@pytest.mark.asyncio
+async def test_volume_tracks_sync_week_moves(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession
+):
+    bench = await _get_exercise(auth_seeded_client, "Barbell Bench Press")
+    session_id = str(uuid.uuid4())
+    session = {
+        "id": session_id,
+        "week_type": "normal",
+        "year_week": "2025-27",
+        "started_at": "2025-07-01T10:00:00Z",
+    }
+    sets = [
+        {
+            "id": str(uuid.uuid4()),
+            "session_id": session_id,
+            "exercise_id": bench["id"],
+            "set_type": "working",
+            "set_number": n,
+            "reps": 5,
+            "weight": 100,
+        }
+        for n in (1, 2)
+    ]
+    await auth_seeded_client.post(
+        "/api/sync", json={"sessions": [session], "sets": sets}
+    )
+    group = bench["muscle_group"]
+    assert await _volume(auth_seeded_client) == [("2025-27", group, 1000.0)]
+
+    # Re-syncing only the session into another week carries its sets along
+    session["year_week"] = "2025-28"
+    await auth_seeded_client.post("/api/sync", json={"sessions": [session]})
+    assert await _volume(auth_seeded_client) == [("2025-28", group, 1000.0)]
+
+    # Re-syncing an unchanged set is a no-op
+    await auth_seeded_client.post("/api/sync", json={"sets": sets[:1]})
+    assert await _volume(auth_seeded_client) == [("2025-28", group, 1000.0)]
+    await _assert_matches_rebuild(auth_seeded_client, db_session)
+
+
+@pytest.mark.asyncio
+async def test_volume_follows_muscle_group_edits(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession
+):
+    exercise = (
+        await auth_seeded_client.post(
+            "/api/exercises", json={"name": "Sled Push", "muscle_group": "legs"}
+        )
+    ).json()
+    session = (
+        await auth_seeded_client.post(
+            "/api/sessions", json={"week_type": "normal", "year_week": "2025-27"}
+        )
+    ).json()
+    await _log_set(auth_seeded_client, session["id"], exercise["id"])
+
+    await auth_seeded_client.put(
+        f"/api/exercises/{exercise['id']}",
+        json={"name": "Sled Push", "muscle_group": "conditioning"},
+    )
+    assert await _volume(auth_seeded_client) == [("2025-27", "conditioning", 1000.0)]
+    await _assert_matches_rebuild(auth_seeded_client, db_session)
+
+
+async def _records(client: AsyncClient, exercise_id: str) -> dict:
+    resp = await client.get(f"/api/stats/records/{exercise_id}")
+    assert resp.status_code == 200
+    return resp.json()
+
+
+@pytest.mark.asyncio
+async def test_records_describe_real_sets(auth_seeded_client: AsyncClient):
+    bench = await _get_exercise(auth_seeded_client, "Barbell Bench Press")
+    session = (
+        await auth_seeded_client.post(
+            "/api/sessions", json={"week_type": "normal", "year_week": "2025-27"}
+        )
+    ).json()
+    heavy = await _log_set(
+        auth_seeded_client, session["id"], bench["id"], reps=3, weight=120
+    )
+    volume = await _log_set(
+        auth_seeded_client, session["id"], bench["id"], reps=12, weight=80
+    )
+    await _log_set(
+        auth_seeded_client, session["id"], bench["id"], set_type="warmup", reps=20
+    )
+
+    records = await _records(auth_seeded_client, bench["id"])
+    assert records["best_weight"]["set_id"] == heavy["id"]
+    assert records["best_reps"]["set_id"] == volume["id"]
+    # Epley: 120 x 3 -> 132.00 beats 80 x 12 -> 112.00
+    assert records["best_e1rm"]["set_id"] == heavy["id"]
+    assert float(records["best_e1rm"]["e1rm"]) == 132.0
+    assert (float(records["max_weight"]), records["max_reps"]) == (120.0, 12)
+    assert sorted(records["rep_maxes"]) == ["12", "3"]
+
+    listing = (await auth_seeded_client.get("/api/stats/records")).json()
+    assert [r["exercise_id"] for r in listing] == [bench["id"]]
+
+
+@pytest.mark.asyncio
+async def test_records_rescan_when_holder_changes(auth_seeded_client: AsyncClient):
+    bench = await _get_exercise(auth_seeded_client, "Barbell Bench Press")
+    session = (
+        await auth_seeded_client.post(
+            "/api/sessions", json={"week_type": "normal", "year_week": "2025-27"}
+        )
+    ).json()
+    first = await _log_set(auth_seeded_client, session["id"], bench["id"], weight=100)
+    second = await _log_set(
+        auth_seeded_client, session["id"], bench["id"], set_number=2, weight=110
+    )
+    records = await _records(auth_seeded_client, bench["id"])
+    assert records["best_weight"]["set_id"] == second["id"]
+
+    # Weakening the holder hands the record back to the earlier set
+    await auth_seeded_client.put(
+        f"/api/sessions/sets/{second['id']}", json={"weight": 90}
+    )
+    records = await _records(auth_seeded_client, bench["id"])
+    assert records["best_weight"]["set_id"] == first["id"]
+    assert float(records["rep_maxes"]["10"]["weight"]) == 100.0
+
+    await auth_seeded_client.delete(f"/api/sessions/sets/{first['id']}")
+    records = await _records(auth_seeded_client, bench["id"])
+    assert records["best_weight"]["set_id"] == second["id"]
+
+    await auth_seeded_client.delete(f"/api/sessions/sets/{second['id']}")
+    resp = await auth_seeded_client.get(f"/api/stats/records/{bench['id']}")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_records_from_sync_match_rebuild(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession
+):
+    bench = await _get_exercise(auth_seeded_client, "Barbell Bench Press")
+    session_id = str(uuid.uuid4())
+    sets = [
+        {
+            "id": str(uuid.uuid4()),
+            "session_id": session_id,
+            "exercise_id": bench["id"],
+            "set_type": "working",
+            "set_number": n,
+            "reps": reps,
+            "weight": weight,
+        }
+        for n, (reps, weight) in enumerate([(5, 100), (8, 90), (1, 125)], start=1)
+    ]
+    session = {
+        "id": session_id,
+        "week_type": "normal",
+        "year_week": "2025-27",
+        "started_at": "2025-07-01T10:00:00Z",
+    }
+    await auth_seeded_client.post(
+        "/api/sync", json={"sessions": [session], "sets": sets}
+    )
+    # Demote the single to a warmup: max weight falls back to the 5s
+    sets[2]["set_type"] = "warmup"
+    await auth_seeded_client.post("/api/sync", json={"sets": [sets[2]]})
+
+    incremental = await _records(auth_seeded_client, bench["id"])
+    assert incremental["best_weight"]["set_id"] == sets[0]["id"]
+    assert "1" not in incremental["rep_maxes"]
+
+    await rebuild_personal_records(db_session)
+    await db_session.commit()
+    assert await _records(auth_seeded_client, bench["id"]) == incremental
+
+
+async def _sync_session(
+    client: AsyncClient, started_at: str, exercise_id: str, sets: list[tuple]
+) -> str:
+    session_id = str(uuid.uuid4())
+    await client.post(
+        "/api/sync",
+        json={
+            "sessions": [
+                {
+                    "id": session_id,
+                    "week_type": "normal",
+                    "year_week": "2025-27",
+                    "started_at": started_at,
+                }
+            ],
+            "sets": [
+                {
+                    "id": str(uuid.uuid4()),
+                    "session_id": session_id,
+                    "exercise_id": exercise_id,
+                    "set_type": set_type,
+                    "set_number": n,
+                    "reps": reps,
+                    "weight": weight,
+                }
+                for n, (set_type, reps, weight) in enumerate(sets, start=1)
+            ],
+        },
+    )
+    return session_id
+
+
+@pytest.mark.asyncio
+async def test_last_performance(auth_seeded_client: AsyncClient):
+    bench = await _get_exercise(auth_seeded_client, "Barbell Bench Press")
+    rdl = await _get_exercise(auth_seeded_client, "Barbell RDL")
+    await _sync_session(
+        auth_seeded_client,
+        "2025-07-01T10:00:00Z",
+        bench["id"],
+        [("working", 3, 120), ("working", 10, 90)],
+    )
+    latest = await _sync_session(
+        auth_seeded_client,
+        "2025-07-03T10:00:00Z",
+        bench["id"],
+        [("warmup", 10, 60), ("working", 5, 100), ("working", 5, 105)],
+    )
+
+    async def lookup() -> list[dict]:
+        resp = await auth_seeded_client.get(
+            "/api/stats/last-performance",
+            params={"exercise_id": [bench["id"], rdl["id"]]},
+        )
+        assert resp.status_code == 200
+        return resp.json()
+
+    (performance,) = await lookup()
+    assert performance["session_id"] == latest
+    assert [(s["reps"], float(s["weight"])) for s in performance["sets"]] == [
+        (5, 100.0),
+        (5, 105.0),
+    ]
+    # Epley: 120 x 3 -> 132.00 beats 90 x 10 -> 120.00 and 105 x 5 -> 122.50
+    best = performance["best_set"]
+    assert (best["reps"], float(best["weight"]), float(best["e1rm"])) == (
+        3,
+        120.0,
+        132.0,
+    )
+
+    # Served from cache until the next set write
+    assert await lookup() == [performance]
+    newer = await _sync_session(
+        auth_seeded_client, "2025-07-05T10:00:00Z", bench["id"], [("working", 1, 140)]
+    )
+    (performance,) = await lookup()
+    assert performance["session_id"] == newer
+    assert float(performance["best_set"]["e1rm"]) == 140.0
+
+
+@pytest.mark.asyncio
+async def test_today_includes_last_performance(
+    auth_seeded_client: AsyncClient, db_session: AsyncSession
+):
+    from app.seed_minimalift import (
+        SHARED_MINIMALIFT_PROGRAM_ID,
+        seed_minimalift_program,
+    )
+
+    await seed_minimalift_program(db_session)
+    await auth_seeded_client.post(
+        f"/api/programs/{SHARED_MINIMALIFT_PROGRAM_ID}/activate"
+    )
+    today = (await auth_seeded_client.get("/api/programs/today")).json()
+    assert today["last_performance"] is None
+    exercise_id = today["workout"]["sections"][0]["exercises"][0]["exercise_id"]
+
+    session_id = await _sync_session(
+        auth_seeded_client, "2025-07-01T10:00:00Z", exercise_id, [("working", 8, 50)]
+    )
+    today = (
+        await auth_seeded_client.get(
+            "/api/programs/today", params={"include": "last_performance"}
+        )
+    ).json()
+    assert list(today["last_performance"]) == [exercise_id]
+    assert today["last_performance"][exercise_id]["session_id"] == session_id
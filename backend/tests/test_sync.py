@@ -0,0 +1,466 @@
+"""Tests for the bulk offline sync endpoint."""
+
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from tests.conftest import assert_max_queries
+
+OTHER_USER_HEADERS = {
+    "Remote-User": "other",
+    "Remote-Email": "other@example.com",
+    "Remote-Name": "Other User",
+    "Remote-Groups": "users",
+}
+
+
+async def _get_exercise_id_by_name(client: AsyncClient, name: str) -> str:
+    resp = await client.get("/api/exercises")
+    exercises = resp.json()
+    exercise = next(e for e in exercises if e["name"] == name)
+    return exercise["id"]
+
+
+def _session_payload(session_id: str, **overrides) -> dict:
+    payload = {
+        "id": session_id,
+        "week_type": "normal",
+        "year_week": "2025-27",
+        "started_at": "2025-07-01T10:00:00Z",
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _set_payload(
+    set_id: str, session_id: str, exercise_id: str, number: int, weight: float
+) -> dict:
+    return {
+        "id": set_id,
+        "session_id": session_id,
+        "exercise_id": exercise_id,
+        "set_type": "working",
+        "set_number": number,
+        "reps": 8,
+        "weight": weight,
+    }
+
+
+@pytest.mark.asyncio
+async def test_sync_inserts_and_updates_in_bulk(auth_seeded_client: AsyncClient):
+    exercise_id = await _get_exercise_id_by_name(
+        auth_seeded_client, "Barbell Bench Press"
+    )
+    session_id = str(uuid.uuid4())
+    set_ids = [str(uuid.uuid4()) for _ in range(30)]
+
+    # The statement count does not grow with the number of rows; each table's
+    # upsert runs under a SAVEPOINT
+    with assert_max_queries(20):
+        resp = await auth_seeded_client.post(
+            "/api/sync",
+            json={
+                "sessions": [_session_payload(session_id)],
+                "sets": [
+                    _set_payload(sid, session_id, exercise_id, i + 1, 50 + i)
+                    for i, sid in enumerate(set_ids)
+                ],
+            },
+        )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["errors"] == []
+    assert data["synced_sessions"] == [session_id]
+    assert data["synced_sets"] == set_ids
+
+    # Re-sync with edits: existing rows are updated, not duplicated
+    resp = await auth_seeded_client.post(
+        "/api/sync",
+        json={
+            "sessions": [_session_payload(session_id, notes="edited")],
+            "sets": [_set_payload(set_ids[0], session_id, exercise_id, 1, 120)],
+        },
+    )
+    assert resp.json()["errors"] == []
+
+    detail = (await auth_seeded_client.get(f"/api/sessions/{session_id}")).json()
+    assert detail["notes"] == "edited"
+    assert detail["synced"] is True
+    assert len(detail["sets"]) == 30
+    first = next(s for s in detail["sets"] if s["id"] == set_ids[0])
+    assert float(first["weight"]) == 120.0
+
+
+@pytest.mark.asyncio
+async def test_sync_reports_per_row_ownership_errors(auth_seeded_client: AsyncClient):
+    exercise_id = await _get_exercise_id_by_name(
+        auth_seeded_client, "Barbell Bench Press"
+    )
+    foreign_session_id = str(uuid.uuid4())
+    resp = await auth_seeded_client.post(
+        "/api/sync",
+        headers=OTHER_USER_HEADERS,
+        json={"sessions": [_session_payload(foreign_session_id)]},
+    )
+    assert resp.json()["synced_sessions"] == [foreign_session_id]
+
+    own_session_id = str(uuid.uuid4())
+    good_set_id = str(uuid.uuid4())
+    foreign_set_id = str(uuid.uuid4())
+    orphan_set_id = str(uuid.uuid4())
+    resp = await auth_seeded_client.post(
+        "/api/sync",
+        json={
+            "sessions": [
+                _session_payload(foreign_session_id, notes="hijack"),
+                _session_payload(own_session_id),
+            ],
+            "sets": [
+                _set_payload(good_set_id, own_session_id, exercise_id, 1, 60),
+                _set_payload(foreign_set_id, foreign_session_id, exercise_id, 1, 60),
+                _set_payload(orphan_set_id, str(uuid.uuid4()), exercise_id, 1, 60),
+            ],
+        },
+    )
+    data = resp.json()
+    assert data["synced_sessions"] == [own_session_id]
+    assert data["synced_sets"] == [good_set_id]
+    assert len(data["errors"]) == 3
+    assert any(foreign_session_id in e for e in data["errors"])
+    assert any(foreign_set_id in e for e in data["errors"])
+    assert any(orphan_set_id in e for e in data["errors"])
+
+
+@pytest.mark.asyncio
+async def test_sync_refreshes_the_session_a_set_moves_out_of(
+    auth_seeded_client: AsyncClient,
+):
+    exercise_id = await _get_exercise_id_by_name(
+        auth_seeded_client, "Barbell Bench Press"
+    )
+    first, second = str(uuid.uuid4()), str(uuid.uuid4())
+    set_ids = [str(uuid.uuid4()) for _ in range(3)]
+    resp = await auth_seeded_client.post(
+        "/api/sync",
+        json={
+            "sessions": [_session_payload(first), _session_payload(second)],
+            "sets": [
+                _set_payload(sid, first, exercise_id, i + 1, 100)
+                for i, sid in enumerate(set_ids)
+            ],
+        },
+    )
+    assert resp.json()["errors"] == []
+
+    resp = await auth_seeded_client.post(
+        "/api/sync",
+        json={"sets": [_set_payload(set_ids[2], second, exercise_id, 1, 100)]},
+    )
+    assert resp.json()["errors"] == []
+
+    totals = {}
+    for session_id in (first, second):
+        detail = (await auth_seeded_client.get(f"/api/sessions/{session_id}")).json()
+        totals[session_id] = (
+            detail["working_set_count"],
+            float(detail["total_volume"]),
+        )
+    assert totals == {first: (2, 1600.0), second: (1, 800.0)}
+
+
+@pytest.mark.asyncio
+async def test_sync_rejects_only_the_bad_rows(
+    auth_seeded_client: AsyncClient, db_session
+):
+    from sqlalchemy import text
+
+    exercise_id = await _get_exercise_id_by_name(
+        auth_seeded_client, "Barbell Bench Press"
+    )
+    # Stands in for any constraint the database enforces per row
+    await db_session.execute(
+        text(
+            "CREATE TRIGGER reject_bad_sets BEFORE INSERT ON workout_sets "
+            "WHEN NEW.notes = 'bad' BEGIN SELECT RAISE(ABORT, 'bad set'); END"
+        )
+    )
+    await db_session.commit()
+
+    session_id, dangling_session_id = str(uuid.uuid4()), str(uuid.uuid4())
+    good_ids = [str(uuid.uuid4()) for _ in range(2)]
+    bad_id, unknown_exercise_id = str(uuid.uuid4()), str(uuid.uuid4())
+    bad_set = dict(_set_payload(bad_id, session_id, exercise_id, 3, 60), notes="bad")
+    payload = {
+        "sessions": [
+            _session_payload(session_id),
+            _session_payload(dangling_session_id, template_id="missing"),
+        ],
+        "sets": [
+            _set_payload(good_ids[0], session_id, exercise_id, 1, 60),
+            bad_set,
+            _set_payload(unknown_exercise_id, session_id, "missing", 1, 60),
+            _set_payload(good_ids[1], session_id, exercise_id, 2, 60),
+        ],
+    }
+
+    # Retrying the same batch keeps writing the good rows
+    for _ in range(2):
+        data = (await auth_seeded_client.post("/api/sync", json=payload)).json()
+        assert data["synced_sessions"] == [session_id]
+        assert data["synced_sets"] == good_ids
+        assert len(data["errors"]) == 3
+        for rejected in (dangling_session_id, bad_id, unknown_exercise_id):
+            assert any(rejected in e for e in data["errors"])
+
+    detail = (await auth_seeded_client.get(f"/api/sessions/{session_id}")).json()
+    assert sorted(s["id"] for s in detail["sets"]) == sorted(good_ids)
+    assert detail["working_set_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_updates_progress_and_rotation(auth_seeded_client: AsyncClient):
+    exercise_id = await _get_exercise_id_by_name(
+        auth_seeded_client, "Barbell Bench Press"
+    )
+    template_id = (
+        await auth_seeded_client.post(
+            "/api/templates", json={"name": "Push", "template_exercises": []}
+        )
+    ).json()["id"]
+    program = (
+        await auth_seeded_client.post(
+            "/api/programs",
+            json={
+                "name": "Rotation",
+                "routines": [
+                    {"template_id": template_id, "order": 0},
+                    {"template_id": template_id, "order": 1},
+                ],
+            },
+        )
+    ).json()
+    enrollment = (
+        await auth_seeded_client.post(f"/api/programs/{program['id']}/activate")
+    ).json()
+
+    session_id = str(uuid.uuid4())
+    await auth_seeded_client.post(
+        "/api/sync",
+        json={
+            "sessions": [
+                _session_payload(
+                    session_id,
+                    finished_at="2025-07-01T11:00:00Z",
+                    user_program_id=enrollment["id"],
+                )
+            ],
+            "sets": [
+                _set_payload(str(uuid.uuid4()), session_id, exercise_id, 1, 80),
+                _set_payload(str(uuid.uuid4()), session_id, exercise_id, 2, 95),
+                _set_payload(str(uuid.uuid4()), session_id, exercise_id, 3, 90),
+            ],
+        },
+    )
+
+    progress = (
+        await auth_seeded_client.get(f"/api/progress/exercise/{exercise_id}")
+    ).json()
+    assert [(p["year_week"], float(p["max_weight"])) for p in progress] == [
+        ("2025-27", 95.0)
+    ]
+
+    enrollments = (await auth_seeded_client.get("/api/programs/enrollments")).json()
+    current = next(e for e in enrollments if e["id"] == enrollment["id"])
+    assert current["current_routine_index"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_progress_never_lowers_weekly_max(auth_seeded_client: AsyncClient):
+    bench_id = await _get_exercise_id_by_name(auth_seeded_client, "Barbell Bench Press")
+    first_session = str(uuid.uuid4())
+    await auth_seeded_client.post(
+        "/api/sync",
+        json={
+            "sessions": [_session_payload(first_session)],
+            "sets": [_set_payload(str(uuid.uuid4()), first_session, bench_id, 1, 100)],
+        },
+    )
+
+    # A later batch in the same week with lighter sets keeps the heavier max,
+    # while a new week gets its own row
+    second_session = str(uuid.uuid4())
+    third_session = str(uuid.uuid4())
+    await auth_seeded_client.post(
+        "/api/sync",
+        json={
+            "sessions": [
+                _session_payload(second_session),
+                _session_payload(third_session, year_week="2025-28"),
+            ],
+            "sets": [
+                _set_payload(str(uuid.uuid4()), second_session, bench_id, 1, 70),
+                _set_payload(str(uuid.uuid4()), second_session, bench_id, 2, 75),
+                _set_payload(str(uuid.uuid4()), third_session, bench_id, 1, 102.5),
+            ],
+        },
+    )
+
+    progress = (
+        await auth_seeded_client.get(f"/api/progress/exercise/{bench_id}")
+    ).json()
+    assert [(p["year_week"], float(p["max_weight"])) for p in progress] == [
+        ("2025-27", 100.0),
+        ("2025-28", 102.5),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_changes_feed_returns_only_new_rows(auth_seeded_client: AsyncClient):
+    exercise_id = await _get_exercise_id_by_name(
+        auth_seeded_client, "Barbell Bench Press"
+    )
+    old_session = str(uuid.uuid4())
+    await auth_seeded_client.post(
+        "/api/sync", json={"sessions": [_session_payload(old_session)]}
+    )
+
+    head = (await auth_seeded_client.get("/api/sync/changes")).json()
+    assert head["sessions"] == []
+
+    # Changes by another user never show up in this user's feed
+    await auth_seeded_client.post(
+        "/api/sync",
+        headers=OTHER_USER_HEADERS,
+        json={"sessions": [_session_payload(str(uuid.uuid4()))]},
+    )
+
+    session = (
+        await auth_seeded_client.post(
+            "/api/sessions", json={"week_type": "normal", "year_week": "2025-28"}
+        )
+    ).json()
+    logged = (
+        await auth_seeded_client.post(
+            f"/api/sessions/{session['id']}/sets",
+            json={
+                "exercise_id": exercise_id,
+                "set_type": "working",
+                "set_number": 1,
+                "reps": 5,
+                "weight": 100,
+            },
+        )
+    ).json()
+
+    changes = (
+        await auth_seeded_client.get(
+            "/api/sync/changes", params={"since": head["cursor"]}
+        )
+    ).json()
+    assert changes["cursor"] > head["cursor"]
+    assert changes["has_more"] is False
+    assert [s["id"] for s in changes["sessions"]] == [session["id"]]
+    assert [(s["id"], s["session_id"]) for s in changes["sets"]] == [
+        (logged["id"], session["id"])
+    ]
+    assert [p["year_week"] for p in changes["progress"]] == ["2025-28"]
+    assert changes["deleted"] == []
+
+    # Deleting the set yields a tombstone instead of the row
+    await auth_seeded_client.delete(f"/api/sessions/sets/{logged['id']}")
+    after_delete = (
+        await auth_seeded_client.get(
+            "/api/sync/changes", params={"since": changes["cursor"]}
+        )
+    ).json()
+    assert after_delete["sets"] == []
+    assert after_delete["deleted"] == [{"entity": "workout_sets", "id": logged["id"]}]
+
+
+@pytest.mark.asyncio
+async def test_changes_feed_pages_with_cursor(auth_seeded_client: AsyncClient):
+    head = (await auth_seeded_client.get("/api/sync/changes")).json()["cursor"]
+    session_ids = [str(uuid.uuid4()) for _ in range(5)]
+    await auth_seeded_client.post(
+        "/api/sync",
+        json={"sessions": [_session_payload(sid) for sid in session_ids]},
+    )
+
+    pulled: list[str] = []
+    cursor, has_more = head, True
+    while has_more:
+        page = (
+            await auth_seeded_client.get(
+                "/api/sync/changes", params={"since": cursor, "limit": 2}
+            )
+        ).json()
+        pulled.extend(s["id"] for s in page["sessions"])
+        cursor, has_more = page["cursor"], page["has_more"]
+    assert sorted(pulled) == sorted(session_ids)
+
+
+@pytest.mark.asyncio
+async def test_changes_feed_includes_shared_seed_rows(
+    auth_seeded_client: AsyncClient, db_session
+):
+    from app.seed import SHARED_JN_PROGRAM_ID, seed_default_program
+
+    head = (await auth_seeded_client.get("/api/sync/changes")).json()["cursor"]
+    other_head = (
+        await auth_seeded_client.get("/api/sync/changes", headers=OTHER_USER_HEADERS)
+    ).json()["cursor"]
+    await seed_default_program(db_session)
+
+    # Seed upserts are shared, so every user pulls them
+    for headers, since in ((None, head), (OTHER_USER_HEADERS, other_head)):
+        changes = (
+            await auth_seeded_client.get(
+                "/api/sync/changes", headers=headers, params={"since": since}
+            )
+        ).json()
+        assert changes["templates"]
+        assert changes["template_exercises"]
+        assert [p["id"] for p in changes["programs"]] == [SHARED_JN_PROGRAM_ID]
+
+
+@pytest.mark.asyncio
+async def test_changes_feed_attributes_child_rows_to_their_parent(
+    auth_seeded_client: AsyncClient, db_session
+):
+    from sqlalchemy import select
+
+    from app.changes import USER_ID_KEY
+    from app.models import ChangeLog, TemplateExercise, WorkoutTemplate
+
+    exercise_id = await _get_exercise_id_by_name(
+        auth_seeded_client, "Barbell Bench Press"
+    )
+    template = WorkoutTemplate(name="Shared Push", user_id=None)
+    db_session.add(template)
+    await db_session.flush()
+
+    # A request by some user touching a shared template's exercise
+    db_session.info[USER_ID_KEY] = "someone"
+    child = TemplateExercise(
+        template_id=template.id,
+        exercise_id=exercise_id,
+        week_type="normal",
+        order=1,
+        working_sets=3,
+        min_reps=8,
+        max_reps=10,
+        early_set_rpe_min=7,
+        early_set_rpe_max=8,
+        last_set_rpe_min=9,
+        last_set_rpe_max=10,
+        rest_period="2 min",
+    )
+    db_session.add(child)
+    await db_session.commit()
+    db_session.info.pop(USER_ID_KEY)
+
+    owner = await db_session.scalar(
+        select(ChangeLog.user_id).where(ChangeLog.entity_id == child.id)
+    )
+    assert owner is None
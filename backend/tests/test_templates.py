@@ -119,3 +119,36 @@ async def test_get_template_detail(auth_seeded_client: AsyncClient):
         assert ex["min_reps"] == 8
         assert ex["max_reps"] == 12
         assert ex["rest_period"] == "2-3 min"
+
+
+@pytest.mark.asyncio
+async def test_template_writes_change_catalog_etag(auth_seeded_client: AsyncClient):
+    exercise_id = await _get_exercise_id_by_name(
+        auth_seeded_client, "Barbell Bench Press"
+    )
+    etag = (await auth_seeded_client.get("/api/templates")).headers["ETag"]
+    programs_etag = (await auth_seeded_client.get("/api/programs")).headers["ETag"]
+    unchanged = await auth_seeded_client.get(
+        "/api/templates", headers={"If-None-Match": etag}
+    )
+    assert unchanged.status_code == 304
+
+    created = await auth_seeded_client.post(
+        "/api/templates",
+        json={
+            "name": "Pull Day",
+            "template_exercises": [_make_template_exercise(exercise_id, "normal", 0)],
+        },
+    )
+    assert created.status_code == 201
+
+    resp = await auth_seeded_client.get(
+        "/api/templates", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 200
+    assert "Pull Day" in [t["name"] for t in resp.json()]
+    # Programs embed template names, so they share the catalog version
+    programs = await auth_seeded_client.get(
+        "/api/programs", headers={"If-None-Match": programs_etag}
+    )
+    assert programs.status_code == 200
@@ -0,0 +1,46 @@
+/**
+ * Cursor paging over GET /api/sessions/page.
+ *
+ * The endpoint returns one page of sessions, newest first, with the cursor
+ * of the next page; it is null on the last one.
+ */
+import { api } from "./client";
+import type { SessionPageItem, SessionPageResponse } from "@/types";
+
+export const SESSION_PAGE_SIZE = 200;
+
+export interface SessionPageFilters {
+  started_after?: string;
+  started_before?: string;
+  program_id?: string;
+  template_id?: string;
+  year_week?: string;
+  week_type?: "normal" | "deload";
+}
+
+/**
+ * Fetch every matching session with its sets, one page at a time.
+ * `onPage` runs for each page before the next is requested, so callers can
+ * store history as it arrives instead of holding all of it in memory.
+ */
+export async function forEachSessionPage(
+  onPage: (sessions: SessionPageItem[]) => Promise<void> | void,
+  filters: SessionPageFilters = {},
+): Promise<void> {
+  let cursor: string | null = null;
+  do {
+    const params = new URLSearchParams({
+      include: "sets",
+      limit: String(SESSION_PAGE_SIZE),
+    });
+    for (const [key, value] of Object.entries(filters)) {
+      if (value) params.set(key, value);
+    }
+    if (cursor) params.set("cursor", cursor);
+    const page: SessionPageResponse = await api.get<SessionPageResponse>(
+      `/sessions/page?${params}`,
+    );
+    await onPage(page.sessions);
+    cursor = page.next_cursor;
+  } while (cursor);
+}
@@ -1,29 +1,108 @@
 /**
  * Fetch data from the backend API and populate Dexie tables.
  * Called after login to seed the local database for offline-first usage.
+ *
+ * Everything but session history is replaced on each hydrate. History is
+ * kept once it has been paged in completely, and later hydrates only fetch
+ * the sessions started since the newest one of that hydrate.
  */
 import { db } from "./index";
 import { api } from "@/api/client";
+import { forEachSessionPage } from "@/api/sessions";
 import type {
-  ExerciseResponse,
-  TemplateResponse,
-  TemplateDetailResponse,
-  ProgramResponse,
-  ProgramDetailResponse,
-  ProgramPhaseDetailResponse,
-  UserProgramResponse,
-  SessionResponse,
-  SessionDetailResponse,
+  BootstrapResponse,
   ProgressDetailResponse,
+  SessionDetailResponse,
+  SessionPageItem,
 } from "@/types";
 
+// Sessions GET /api/bootstrap includes by default (its session_limit)
+const BOOTSTRAP_SESSION_LIMIT = 100;
+
+// The user and newest session start of the last hydrate whose history was
+// paged in completely
+const HISTORY_MARK_KEY = "hydrated-history";
+const HISTORY_TABLES = new Set(["workoutSessions", "workoutSets"]);
+
+interface HistoryMark {
+  user_id: string;
+  started_at: string;
+}
+
+function historyMark(userId: string): string | null {
+  try {
+    const mark = JSON.parse(
+      localStorage.getItem(HISTORY_MARK_KEY) ?? "null",
+    ) as HistoryMark | null;
+    return mark?.user_id === userId ? mark.started_at : null;
+  } catch {
+    return null;
+  }
+}
+
+/** Clear every table, and the history mark that describes their contents. */
+export async function clearLocalData(): Promise<void> {
+  localStorage.removeItem(HISTORY_MARK_KEY);
+  await Promise.all(db.tables.map((table) => table.clear()));
+}
+
+async function putSessions(
+  sessions: (SessionDetailResponse | SessionPageItem)[],
+  userId: string,
+): Promise<void> {
+  if (sessions.length === 0) return;
+  await db.workoutSessions.bulkPut(
+    sessions.map((s) => ({
+      id: s.id,
+      user_id: userId,
+      template_id: s.template_id,
+      year_week: s.year_week,
+      week_type: s.week_type as "normal" | "deload",
+      started_at: s.started_at,
+      finished_at: s.finished_at,
+      notes: s.notes,
+      program_id: s.program_id,
+      phase_workout_id: s.phase_workout_id ?? null,
+      user_program_id: s.user_program_id ?? null,
+      sync_status: "synced" as const,
+    })),
+  );
+
+  const setRecords = sessions.flatMap((sd) =>
+    (sd.sets ?? []).map((set) => ({
+      id: set.id,
+      session_id: sd.id,
+      exercise_id: set.exercise_id,
+      set_type: set.set_type as "warmup" | "working",
+      set_number: set.set_number,
+      reps: set.reps,
+      weight: set.weight,
+      rpe: set.rpe,
+      notes: set.notes,
+      created_at: set.created_at,
+      sync_status: "synced" as const,
+    })),
+  );
+
+  if (setRecords.length > 0) {
+    await db.workoutSets.bulkPut(setRecords);
+  }
+}
+
 export async function hydrateFromApi(userId: string): Promise<void> {
   try {
-    // Clear all local data first to avoid duplicates / stale records
-    await Promise.all(db.tables.map((table) => table.clear()));
+    // Clear local data first to avoid duplicates / stale records, keeping
+    // history this user already has in full
+    const mark = historyMark(userId);
+    await Promise.all(
+      db.tables
+        .filter((table) => mark === null || !HISTORY_TABLES.has(table.name))
+        .map((table) => table.clear()),
+    );
 
-    // Fetch exercises (includes substitutions)
-    const exercises = await api.get<ExerciseResponse[]>("/exercises");
+    // One request returns the whole catalog, enrollments and recent sessions
+    const { exercises, templates, programs, phases, enrollments, sessions } =
+      await api.get<BootstrapResponse>("/bootstrap");
 
     await db.exercises.bulkPut(
       exercises.map((e) => ({
@@ -55,8 +134,7 @@ export async function hydrateFromApi(userId: string): Promise<void> {
       await db.exerciseSubstitutions.bulkPut(substitutions);
     }
 
-    // Fetch templates and their exercises
-    const templates = await api.get<TemplateResponse[]>("/templates");
+    // Templates and their exercises
     if (templates.length > 0) {
       await db.workoutTemplates.bulkPut(
         templates.map((t) => ({
@@ -68,14 +146,7 @@ export async function hydrateFromApi(userId: string): Promise<void> {
         })),
       );
 
-      // Fetch template exercises for each template
-      const allTemplateExercises = await Promise.all(
-        templates.map((t) =>
-          api.get<TemplateDetailResponse>(`/templates/${t.id}`),
-        ),
-      );
-
-      const templateExerciseRecords = allTemplateExercises.flatMap((td) =>
+      const templateExerciseRecords = templates.flatMap((td) =>
         td.template_exercises.map((te) => ({
           id: te.id,
           template_id: td.id,
@@ -102,8 +173,7 @@ export async function hydrateFromApi(userId: string): Promise<void> {
       }
     }
 
-    // Fetch programs and their routines
-    const programs = await api.get<ProgramResponse[]>("/programs");
+    // Programs and their routines
     if (programs.length > 0) {
       await db.programs.bulkPut(
         programs.map((p) => ({
@@ -117,13 +187,7 @@ export async function hydrateFromApi(userId: string): Promise<void> {
         })),
       );
 
-      const allProgramDetails = await Promise.all(
-        programs.map((p) =>
-          api.get<ProgramDetailResponse>(`/programs/${p.id}`),
-        ),
-      );
-
-      const routineRecords = allProgramDetails.flatMap((pd) =>
+      const routineRecords = programs.flatMap((pd) =>
         pd.routines.map((r) => ({
           id: r.id,
           program_id: pd.id,
@@ -136,88 +200,80 @@ export async function hydrateFromApi(userId: string): Promise<void> {
       if (routineRecords.length > 0) {
         await db.programRoutines.bulkPut(routineRecords);
       }
+    }
 
-      // Hydrate phased program data
-      for (const p of programs) {
-        if ((p.program_type ?? "rotating") !== "phased") continue;
-
-        const phases = await api.get<ProgramPhaseDetailResponse[]>(
-          `/programs/${p.id}/phases`,
-        );
+    // Phased program data
+    if (phases.length > 0) {
+      await db.programPhases.bulkPut(
+        phases.map((ph) => ({
+          id: ph.id,
+          program_id: ph.program_id,
+          name: ph.name,
+          description: ph.description,
+          order: ph.order,
+          duration_weeks: ph.duration_weeks,
+          days_per_week: ph.days_per_week,
+          sync_status: "synced" as const,
+        })),
+      );
 
-        await db.programPhases.bulkPut(
-          phases.map((ph) => ({
-            id: ph.id,
-            program_id: p.id,
-            name: ph.name,
-            description: ph.description,
-            order: ph.order,
-            duration_weeks: ph.duration_weeks,
-            sync_status: "synced" as const,
-          })),
-        );
+      const workoutRecords = phases.flatMap((ph) =>
+        ph.workouts.map((w) => ({
+          id: w.id,
+          phase_id: ph.id,
+          name: w.name,
+          day_index: w.day_index,
+          week_number: w.week_number,
+          sync_status: "synced" as const,
+        })),
+      );
+      if (workoutRecords.length > 0) {
+        await db.phaseWorkouts.bulkPut(workoutRecords);
+      }
 
-        const workoutRecords = phases.flatMap((ph) =>
-          ph.workouts.map((w) => ({
-            id: w.id,
-            phase_id: ph.id,
-            name: w.name,
-            day_index: w.day_index,
-            week_number: w.week_number,
+      const sectionRecords = phases.flatMap((ph) =>
+        ph.workouts.flatMap((w) =>
+          w.sections.map((s) => ({
+            id: s.id,
+            workout_id: w.id,
+            name: s.name,
+            order: s.order,
+            notes: s.notes,
             sync_status: "synced" as const,
           })),
-        );
-        if (workoutRecords.length > 0) {
-          await db.phaseWorkouts.bulkPut(workoutRecords);
-        }
+        ),
+      );
+      if (sectionRecords.length > 0) {
+        await db.phaseWorkoutSections.bulkPut(sectionRecords);
+      }
 
-        const sectionRecords = phases.flatMap((ph) =>
-          ph.workouts.flatMap((w) =>
-            w.sections.map((s) => ({
-              id: s.id,
-              workout_id: w.id,
-              name: s.name,
-              order: s.order,
-              notes: s.notes,
+      const exerciseRecords = phases.flatMap((ph) =>
+        ph.workouts.flatMap((w) =>
+          w.sections.flatMap((s) =>
+            s.exercises.map((ex) => ({
+              id: ex.id,
+              section_id: s.id,
+              exercise_id: ex.exercise_id,
+              order: ex.order,
+              working_sets: ex.working_sets,
+              reps_display: ex.reps_display,
+              rest_period: ex.rest_period,
+              intensity_technique: ex.intensity_technique,
+              warmup_sets: ex.warmup_sets,
+              notes: ex.notes,
+              substitute1_exercise_id: ex.substitute1_exercise_id,
+              substitute2_exercise_id: ex.substitute2_exercise_id,
               sync_status: "synced" as const,
             })),
           ),
-        );
-        if (sectionRecords.length > 0) {
-          await db.phaseWorkoutSections.bulkPut(sectionRecords);
-        }
-
-        const exerciseRecords = phases.flatMap((ph) =>
-          ph.workouts.flatMap((w) =>
-            w.sections.flatMap((s) =>
-              s.exercises.map((ex) => ({
-                id: ex.id,
-                section_id: s.id,
-                exercise_id: ex.exercise_id,
-                order: ex.order,
-                working_sets: ex.working_sets,
-                reps_display: ex.reps_display,
-                rest_period: ex.rest_period,
-                intensity_technique: ex.intensity_technique,
-                warmup_sets: ex.warmup_sets,
-                notes: ex.notes,
-                substitute1_exercise_id: ex.substitute1_exercise_id,
-                substitute2_exercise_id: ex.substitute2_exercise_id,
-                sync_status: "synced" as const,
-              })),
-            ),
-          ),
-        );
-        if (exerciseRecords.length > 0) {
-          await db.phaseWorkoutExercises.bulkPut(exerciseRecords);
-        }
+        ),
+      );
+      if (exerciseRecords.length > 0) {
+        await db.phaseWorkoutExercises.bulkPut(exerciseRecords);
       }
     }
 
-    // Fetch user program enrollments
-    const enrollments = await api.get<UserProgramResponse[]>(
-      "/programs/enrollments",
-    );
+    // User program enrollments
     if (enrollments.length > 0) {
       await db.userPrograms.bulkPut(
         enrollments.map((e) => ({
@@ -238,53 +294,8 @@ export async function hydrateFromApi(userId: string): Promise<void> {
       );
     }
 
-    // Fetch sessions and their sets
-    const sessions = await api.get<SessionResponse[]>("/sessions");
-    if (sessions.length > 0) {
-      await db.workoutSessions.bulkPut(
-        sessions.map((s) => ({
-          id: s.id,
-          user_id: userId,
-          template_id: s.template_id,
-          year_week: s.year_week,
-          week_type: s.week_type as "normal" | "deload",
-          started_at: s.started_at,
-          finished_at: s.finished_at,
-          notes: s.notes,
-          program_id: s.program_id,
-          phase_workout_id: s.phase_workout_id ?? null,
-          user_program_id: s.user_program_id ?? null,
-          sync_status: "synced" as const,
-        })),
-      );
-
-      // Fetch sets for each session
-      const allSessionDetails = await Promise.all(
-        sessions.map((s) =>
-          api.get<SessionDetailResponse>(`/sessions/${s.id}`),
-        ),
-      );
-
-      const setRecords = allSessionDetails.flatMap((sd) =>
-        sd.sets.map((set) => ({
-          id: set.id,
-          session_id: sd.id,
-          exercise_id: set.exercise_id,
-          set_type: set.set_type as "warmup" | "working",
-          set_number: set.set_number,
-          reps: set.reps,
-          weight: set.weight,
-          rpe: set.rpe,
-          notes: set.notes,
-          created_at: set.created_at,
-          sync_status: "synced" as const,
-        })),
-      );
-
-      if (setRecords.length > 0) {
-        await db.workoutSets.bulkPut(setRecords);
-      }
-    }
+    // Recent sessions and their sets
+    await putSessions(sessions, userId);
 
     // Fetch exercise progress
     const progress = await api.get<ProgressDetailResponse[]>("/progress");
@@ -301,6 +312,25 @@ export async function hydrateFromApi(userId: string): Promise<void> {
         })),
       );
     }
+
+    // A full snapshot means older history remains. Page in whatever is not
+    // stored yet, last, so everything above is usable while it loads
+    if (
+      sessions.length >= BOOTSTRAP_SESSION_LIMIT &&
+      (mark === null ||
+        Date.parse(mark) < Date.parse(sessions[sessions.length - 1].started_at))
+    ) {
+      await forEachSessionPage((page) => putSessions(page, userId), {
+        started_after: mark ?? undefined,
+      });
+    }
+    if (sessions.length > 0) {
+      const newest: HistoryMark = {
+        user_id: userId,
+        started_at: sessions[0].started_at,
+      };
+      localStorage.setItem(HISTORY_MARK_KEY, JSON.stringify(newest));
+    }
   } catch {
     // Hydration is best-effort — data will load from API on individual pages
   }
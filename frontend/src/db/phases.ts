@@ -0,0 +1,21 @@
+import { db, type DbProgramPhase } from "@/db/index";
+
+/**
+ * Workout days an enrollment advances through before the phase's week ends.
+ *
+ * The server sends `days_per_week` with every phase. Phases stored before it
+ * did are counted from their local workouts with the server's rule: the
+ * distinct day indices of the weeks within `duration_weeks`.
+ */
+export async function phaseDaysPerWeek(phase: DbProgramPhase): Promise<number> {
+  if (phase.days_per_week !== undefined) return phase.days_per_week;
+  const workouts = await db.phaseWorkouts
+    .where("phase_id")
+    .equals(phase.id)
+    .toArray();
+  return new Set(
+    workouts
+      .filter((w) => w.week_number <= phase.duration_weeks)
+      .map((w) => w.day_index),
+  ).size;
+}
@@ -157,6 +157,8 @@ export interface DbProgramPhase {
   description: string | null;
   order: number;
   duration_weeks: number;
+  // Absent on phases stored before the server sent it; see db/phases.ts
+  days_per_week?: number;
   sync_status: SyncStatus;
 }
 
@@ -1,7 +1,7 @@
 import { useCallback } from "react";
 import { useAuthContext } from "@/context/AuthContext";
 import { api } from "@/api/client";
-import { db } from "@/db/index";
+import { clearLocalData } from "@/db/hydrate";
 import type { UserResponse } from "@/types";
 
 interface UseAuthReturn {
@@ -21,7 +21,7 @@ export function useAuth(): UseAuthReturn {
       // Logout should succeed even if the API call fails
     } finally {
       // Clear Dexie tables so the next user doesn't see stale data
-      await Promise.all(db.tables.map((table) => table.clear()));
+      await clearLocalData();
       dispatch({ type: "LOGOUT" });
       // Redirect to Authelia logout
       window.location.href = "https://auth.zurera.cloud/logout";
@@ -414,6 +414,7 @@ export default function Programs() {
                   description: ph.description,
                   order: ph.order,
                   duration_weeks: ph.duration_weeks,
+                  days_per_week: ph.days_per_week,
                   sync_status: "synced" as const,
                 })),
               );
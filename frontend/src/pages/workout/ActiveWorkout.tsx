@@ -11,6 +11,7 @@ import {
 } from "@/db/index";
 import { useAuthContext } from "@/context/AuthContext";
 import { api } from "@/api/client";
+import { phaseDaysPerWeek } from "@/db/phases";
 import { Button } from "@/components/ui/button";
 import {
   Dialog,
@@ -968,9 +969,12 @@ export function ActiveWorkout({
             .toArray();
           phases.sort((a, b) => a.order - b.order);
 
-          const daysPerWeek = 3;
           const currentPhase =
             phases[enrollment.current_phase_index % phases.length];
+          // Advance through the same days the server's schedule does
+          const daysPerWeek = currentPhase
+            ? await phaseDaysPerWeek(currentPhase)
+            : 0;
 
           let newDay = enrollment.current_day_index + 1;
           let newWeek = enrollment.current_week_in_phase;
@@ -9,6 +9,7 @@ import {
   type DbPhaseWorkoutExercise,
   type DbExercise,
 } from "@/db/index";
+import { phaseDaysPerWeek } from "@/db/phases";
 import { calculateWarmupSets } from "@/utils/warmup";
 import { Button } from "@/components/ui/button";
 import {
@@ -59,7 +60,8 @@ export function PhasedTodayScreen({
   const [sectionGroups, setSectionGroups] = useState<SectionWithExercises[]>(
     [],
   );
-  const [daysPerWeek, setDaysPerWeek] = useState(3);
+  // Rendered only once loaded; 1 keeps the modulo defined until then
+  const [daysPerWeek, setDaysPerWeek] = useState(1);
   const [isLoading, setIsLoading] = useState(true);
 
   const phaseIdx = overridePhaseIndex ?? enrollment.current_phase_index;
@@ -88,13 +90,8 @@ export function PhasedTodayScreen({
       // week_number is 1-indexed
       const weekNum = (weekInPhase % currentPhase.duration_weeks) + 1;
 
-      // Determine days per week from actual workout data for this phase
-      const phaseWorkouts = await db.phaseWorkouts
-        .where("phase_id")
-        .equals(currentPhase.id)
-        .toArray();
-      const computedDays =
-        new Set(phaseWorkouts.map((w) => w.day_index)).size || 3;
+      // The same days per week the server's schedule advances through
+      const computedDays = (await phaseDaysPerWeek(currentPhase)) || 1;
       setDaysPerWeek(computedDays);
       const currentDayIdx = dayIdx % computedDays;
 
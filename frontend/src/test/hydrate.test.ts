@@ -0,0 +1,148 @@
+import { describe, it, expect, vi, beforeEach, type Mock } from "vitest";
+
+vi.mock("@/api/client", () => ({
+  api: {
+    get: vi.fn(),
+    post: vi.fn(),
+    put: vi.fn(),
+    delete: vi.fn(),
+  },
+}));
+
+vi.mock("@/db/index", async () => {
+  const { GymTrackerDB, SYNC_STATUS } = await import("@/db/schema");
+  const instance = new GymTrackerDB();
+  return { db: instance, SYNC_STATUS, GymTrackerDB };
+});
+
+import { api } from "@/api/client";
+import { db } from "@/db/index";
+import { hydrateFromApi } from "@/db/hydrate";
+
+// api.get is generic; the tests only care about the endpoint it is called with
+const mockGet = api.get as unknown as Mock<
+  (endpoint: string) => Promise<unknown>
+>;
+
+function session(n: number) {
+  return {
+    id: `s${n}`,
+    template_id: null,
+    phase_workout_id: null,
+    user_program_id: null,
+    year_week: "2025-26",
+    week_type: "normal",
+    started_at: new Date(Date.UTC(2025, 0, 1) + n * 86400000).toISOString(),
+    finished_at: null,
+    notes: null,
+    program_id: null,
+    sets: [],
+  };
+}
+
+function bootstrap(sessionCount: number, newest = sessionCount - 1) {
+  return {
+    exercises: [],
+    templates: [],
+    programs: [],
+    phases: [],
+    enrollments: [],
+    // Newest first, as the endpoint returns them
+    sessions: Array.from({ length: sessionCount }, (_, i) => session(newest - i)),
+  };
+}
+
+beforeEach(async () => {
+  mockGet.mockReset();
+  localStorage.clear();
+  await db.delete();
+  await db.open();
+});
+
+describe("hydrateFromApi", () => {
+  it("pages in history older than the bootstrap snapshot", async () => {
+    const older = [session(-1), session(-2)];
+    mockGet.mockImplementation(async (endpoint: string) => {
+      if (endpoint === "/bootstrap") return bootstrap(100);
+      if (endpoint === "/progress") return [];
+      const cursor = new URL(endpoint, "http://test").searchParams.get("cursor");
+      return cursor
+        ? { sessions: older, next_cursor: null }
+        : { sessions: bootstrap(100).sessions, next_cursor: "page2" };
+    });
+
+    await hydrateFromApi("user-1");
+
+    expect(await db.workoutSessions.count()).toBe(102);
+    expect(await db.workoutSessions.get("s-2")).toBeDefined();
+  });
+
+  it("skips paging when the snapshot holds the whole history", async () => {
+    mockGet.mockImplementation(async (endpoint: string) =>
+      endpoint === "/bootstrap" ? bootstrap(3) : [],
+    );
+
+    await hydrateFromApi("user-1");
+
+    expect(await db.workoutSessions.count()).toBe(3);
+    expect(mockGet.mock.calls.map(([endpoint]) => endpoint)).toEqual([
+      "/bootstrap",
+      "/progress",
+    ]);
+  });
+
+  it("pages only past the history a previous hydrate stored", async () => {
+    mockGet.mockImplementation(async (endpoint: string) =>
+      endpoint === "/bootstrap" ? bootstrap(3) : [],
+    );
+    await hydrateFromApi("user-1");
+
+    // 120 sessions later, only the ones since the first hydrate are paged
+    const pages: URLSearchParams[] = [];
+    mockGet.mockImplementation(async (endpoint: string) => {
+      if (endpoint === "/bootstrap") return bootstrap(100, 122);
+      if (endpoint === "/progress") return [];
+      pages.push(new URL(endpoint, "http://test").searchParams);
+      return {
+        sessions: Array.from({ length: 121 }, (_, i) => session(122 - i)),
+        next_cursor: null,
+      };
+    });
+    await hydrateFromApi("user-1");
+
+    expect(pages.map((params) => params.get("started_after"))).toEqual([
+      session(2).started_at,
+    ]);
+    expect(await db.workoutSessions.count()).toBe(123);
+
+    // A snapshot reaching back to the stored history pages nothing
+    mockGet.mockReset();
+    mockGet.mockImplementation(async (endpoint: string) =>
+      endpoint === "/bootstrap" ? bootstrap(100, 150) : [],
+    );
+    await hydrateFromApi("user-1");
+
+    expect(mockGet.mock.calls.map(([endpoint]) => endpoint)).toEqual([
+      "/bootstrap",
+      "/progress",
+    ]);
+    expect(await db.workoutSessions.count()).toBe(151);
+  });
+
+  it("replaces the history another user left behind", async () => {
+    mockGet.mockImplementation(async (endpoint: string) =>
+      endpoint === "/bootstrap" ? bootstrap(3) : [],
+    );
+    await hydrateFromApi("user-1");
+
+    mockGet.mockImplementation(async (endpoint: string) =>
+      endpoint === "/bootstrap" ? bootstrap(2, 10) : [],
+    );
+    await hydrateFromApi("user-2");
+
+    expect((await db.workoutSessions.toArray()).map((s) => s.id).sort()).toEqual([
+      "s10",
+      "s9",
+    ]);
+  });
+});
@@ -0,0 +1,49 @@
+import { describe, it, expect, vi, beforeEach } from "vitest";
+
+vi.mock("@/db/index", async () => {
+  const { GymTrackerDB, SYNC_STATUS } = await import("@/db/schema");
+  const instance = new GymTrackerDB();
+  return { db: instance, SYNC_STATUS, GymTrackerDB };
+});
+
+import { db, type DbProgramPhase } from "@/db/index";
+import { phaseDaysPerWeek } from "@/db/phases";
+
+const phase: DbProgramPhase = {
+  id: "phase-1",
+  program_id: "program-1",
+  name: "Phase 1",
+  description: null,
+  order: 0,
+  duration_weeks: 2,
+  sync_status: "synced",
+};
+
+beforeEach(async () => {
+  await db.delete();
+  await db.open();
+});
+
+describe("phaseDaysPerWeek", () => {
+  it("uses the days per week the server sent", async () => {
+    expect(await phaseDaysPerWeek({ ...phase, days_per_week: 5 })).toBe(5);
+  });
+
+  it("counts the scheduled days of phases stored without it", async () => {
+    // Five days a week, plus a week past the phase's duration
+    await db.phaseWorkouts.bulkPut(
+      [1, 2, 3].flatMap((week) =>
+        Array.from({ length: week === 3 ? 6 : 5 }, (_, day) => ({
+          id: `w${week}-${day}`,
+          phase_id: phase.id,
+          name: `W${week} D${day + 1}`,
+          day_index: day,
+          week_number: week,
+          sync_status: "synced" as const,
+        })),
+      ),
+    );
+
+    expect(await phaseDaysPerWeek(phase)).toBe(5);
+  });
+});
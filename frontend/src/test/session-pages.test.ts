@@ -0,0 +1,60 @@
+import { describe, it, expect, vi, beforeEach, type Mock } from "vitest";
+
+vi.mock("@/api/client", () => ({
+  api: {
+    get: vi.fn(),
+    post: vi.fn(),
+    put: vi.fn(),
+    delete: vi.fn(),
+  },
+}));
+
+import { api } from "@/api/client";
+import { forEachSessionPage } from "@/api/sessions";
+
+// api.get is generic; the tests only care about the endpoint it is called with
+const mockGet = api.get as unknown as Mock<
+  (endpoint: string) => Promise<unknown>
+>;
+
+function session(id: string) {
+  return { id, started_at: "2025-06-30T18:00:00", sets: [] };
+}
+
+beforeEach(() => {
+  mockGet.mockReset();
+});
+
+describe("forEachSessionPage", () => {
+  it("follows next_cursor until the last page", async () => {
+    mockGet
+      .mockResolvedValueOnce({
+        sessions: [session("a"), session("b")],
+        next_cursor: "c1",
+      })
+      .mockResolvedValueOnce({ sessions: [session("c")], next_cursor: null });
+
+    const seen: string[][] = [];
+    await forEachSessionPage((sessions) => {
+      seen.push(sessions.map((s) => s.id));
+    });
+
+    expect(seen).toEqual([["a", "b"], ["c"]]);
+    expect(mockGet).toHaveBeenCalledTimes(2);
+    const first = new URL(mockGet.mock.calls[0][0], "http://test");
+    expect(first.pathname).toBe("/sessions/page");
+    expect(first.searchParams.get("include")).toBe("sets");
+    expect(first.searchParams.has("cursor")).toBe(false);
+    const second = new URL(mockGet.mock.calls[1][0], "http://test");
+    expect(second.searchParams.get("cursor")).toBe("c1");
+  });
+
+  it("passes filters through", async () => {
+    mockGet.mockResolvedValueOnce({ sessions: [], next_cursor: null });
+
+    await forEachSessionPage(() => {}, { week_type: "deload" });
+
+    const url = new URL(mockGet.mock.calls[0][0], "http://test");
+    expect(url.searchParams.get("week_type")).toBe("deload");
+  });
+});
@@ -185,6 +185,7 @@ export interface TodayResponse {
   week_number: number;
   is_deload: boolean;
   next_routine_name: string | null;
+  last_performance: Record<string, LastPerformanceResponse> | null;
 }
 
 // ---------------------------------------------------------------------------
@@ -233,6 +234,7 @@ export interface ProgramPhaseResponse {
 }
 
 export interface ProgramPhaseDetailResponse extends ProgramPhaseResponse {
+  days_per_week: number;
   workouts: PhaseWorkoutResponse[];
 }
 
@@ -245,6 +247,18 @@ export interface PhasedTodayResponse {
   week_in_phase: number;
   day_number: number;
   total_phases: number;
+  schedule_day: number;
+  total_days: number;
+  last_performance: Record<string, LastPerformanceResponse> | null;
+}
+
+export interface ScheduleDayResponse {
+  day: number;
+  phase_index: number;
+  week_number: number;
+  day_index: number;
+  workout_id: string;
+  workout_name: string;
 }
 
 // ---------------------------------------------------------------------------
@@ -261,6 +275,10 @@ export interface SetCreate {
   notes: string | null;
 }
 
+export interface SetBatchCreate {
+  sets: SetCreate[];
+}
+
 export interface SetResponse {
   id: string;
   exercise_id: string;
@@ -306,6 +324,10 @@ export interface SessionResponse {
   notes: string | null;
   program_id: string | null;
   synced: boolean;
+  working_set_count: number;
+  total_volume: number;
+  exercise_count: number;
+  duration_seconds: number | null;
 }
 
 export interface SessionDetailResponse {
@@ -320,9 +342,22 @@ export interface SessionDetailResponse {
   notes: string | null;
   program_id: string | null;
   synced: boolean;
+  working_set_count: number;
+  total_volume: number;
+  exercise_count: number;
+  duration_seconds: number | null;
   sets: SetResponse[];
 }
 
+export interface SessionPageItem extends SessionResponse {
+  sets: SetResponse[] | null;
+}
+
+export interface SessionPageResponse {
+  sessions: SessionPageItem[];
+  next_cursor: string | null;
+}
+
 // ---------------------------------------------------------------------------
 // Progress
 // ---------------------------------------------------------------------------
@@ -346,11 +381,31 @@ export interface VolumeResponse {
   total_volume: number;
 }
 
+export interface RecordSetResponse {
+  set_id: string;
+  weight: number;
+  reps: number;
+  e1rm: number;
+  achieved_at: string;
+}
+
+export interface LastPerformanceResponse {
+  exercise_id: string;
+  session_id: string;
+  performed_at: string;
+  sets: SetResponse[];
+  best_set: RecordSetResponse;
+}
+
 export interface RecordResponse {
   exercise_id: string;
   exercise_name: string;
   max_weight: number;
   max_reps: number;
+  best_weight: RecordSetResponse;
+  best_reps: RecordSetResponse;
+  best_e1rm: RecordSetResponse | null;
+  rep_maxes: Record<number, RecordSetResponse>;
 }
 
 // ---------------------------------------------------------------------------
@@ -392,3 +447,20 @@ export interface SyncResponse {
   synced_sets: string[];
   errors: string[];
 }
+
+// ---------------------------------------------------------------------------
+// Bootstrap
+// ---------------------------------------------------------------------------
+
+export interface BootstrapPhaseResponse extends ProgramPhaseDetailResponse {
+  program_id: string;
+}
+
+export interface BootstrapResponse {
+  exercises: ExerciseResponse[];
+  templates: TemplateDetailResponse[];
+  programs: ProgramDetailResponse[];
+  phases: BootstrapPhaseResponse[];
+  enrollments: UserProgramResponse[];
+  sessions: SessionDetailResponse[];
+}